@@ -1,16 +1,95 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
-from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from typing import AsyncIterator, Optional
 
+from app.database.db_config import session_scope, async_session_scope
 from app.services.security_service import SecurityService
-from app.services.user_service import UserService
-from app.schemas import UserResponse
+from app.services.user_service import UserService, get_user_service
+from app.services.rates_service import RateService, get_rate_service
+from app.services.candles_service import CandleService, get_candle_service
+from app.services.ingestion_jobs_service import IngestionJobService, get_ingestion_job_service
+from app.schemas import UserResponse, PageCursor
 from app.enums import UserRole
 
 # Esto permite que Swagger UI muestre el botón de "Authorize"
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
-def get_current_user(token: str = Depends(oauth2_scheme)) -> UserResponse:
+# --- SESIÓN Y SERVICIOS ---
+# get_db es async para que la sesión quede en el contexto de la petición,
+# que FastAPI copia a los hilos donde corren las dependencias y rutas síncronas.
+
+async def get_db() -> AsyncIterator[Session]:
+    """
+    Dependency providing one database session per request, closed after the response.
+    Every controller used while serving the request works on it.
+    """
+    with session_scope() as session:
+        yield session
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Dependency providing one async database session per request, for the async routes.
+    Their reads await SQLite on the event loop instead of holding a thread of the pool.
+    """
+    async with async_session_scope() as session:
+        yield session
+
+async def provide_async_rate_service(session: AsyncSession = Depends(get_async_db)) -> RateService:
+    """
+    Dependency providing the shared rate service, bound to the async request session.
+    """
+    return get_rate_service()
+
+async def provide_rate_service(session: Session = Depends(get_db)) -> RateService:
+    """
+    Dependency providing the shared rate service, bound to the request session.
+    """
+    return get_rate_service()
+
+async def provide_user_service(session: Session = Depends(get_db)) -> UserService:
+    """
+    Dependency providing the shared user service, bound to the request session.
+    """
+    return get_user_service()
+
+async def provide_candle_service(session: Session = Depends(get_db)) -> CandleService:
+    """
+    Dependency providing the shared candle service, bound to the request session.
+    """
+    return get_candle_service()
+
+async def provide_ingestion_job_service(session: Session = Depends(get_db)) -> IngestionJobService:
+    """
+    Dependency providing the shared ingestion job service, bound to the request session.
+    """
+    return get_ingestion_job_service()
+
+# --- PAGINACIÓN ---
+
+def get_page_cursor(
+    after: Optional[str] = Query(None, description="next_cursor of the previous page")
+) -> Optional[PageCursor]:
+    """
+    Dependency decoding the cursor of a paginated list, None for the first page.
+    """
+    if after is None:
+        return None
+    try:
+        return PageCursor.decode(after)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+# --- AUTENTICACIÓN ---
+
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    users: UserService = Depends(provide_user_service)
+) -> UserResponse:
     """
     Dependency to validate the JWT token and return the current user.
     """
@@ -18,22 +97,18 @@ def get_current_user(token: str = Depends(oauth2_scheme)) -> UserResponse:
     token_data = SecurityService.decode_access_token(token)
     
     # 2. Buscar al usuario en la DB (usando el email que viene en 'sub')
-    user_service = UserService()
-    try:
-        user = user_service.controller.get_user_by_email(token_data.username)
-        if user is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found",
-            )
-        if not user.is_active:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Inactive user",
-            )
-        return user
-    finally:
-        user_service.controller.close_session()
+    user = users.controller.get_user_by_email(token_data.username)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+        )
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Inactive user",
+        )
+    return user
 
 def get_current_admin(current_user: UserResponse = Depends(get_current_user)) -> UserResponse:
     """
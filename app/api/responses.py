@@ -0,0 +1,21 @@
+"""
+Response classes of the API
+"""
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSON response of a pydantic model, serialized to bytes by pydantic-core in one call.
+
+    Returned directly by a route, it skips the default pipeline: the response_model
+    validation of the returned model, its dump to Python dicts and the json.dumps() of
+    those dicts. The route keeps its response_model for the OpenAPI schema. Only worth it
+    for large list responses, other content is rendered as a plain JSONResponse.
+    """
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return super().render(content)
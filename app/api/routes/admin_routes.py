@@ -1,16 +1,24 @@
 """
 Module for defining API routes related to admin management.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
-
-from app.enums import UserRole
-from app.api.dependencies import get_current_admin
-from app.services.user_service import UserService
-from app.services.rates_service import RateService
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
+
+from app.enums import UserRole, ExportFormat
+from app.config import Config
+from app.api.responses import PydanticJSONResponse
+from app.api.dependencies import (
+    get_current_admin, provide_user_service, provide_rate_service, provide_ingestion_job_service, get_page_cursor
+)
+from app.services.user_service import UserService, get_user_service
+from app.services.rates_service import RateService, get_rate_service
+from app.services.export_service import EXPORT_MEDIA_TYPES
+from app.services.ingestion_jobs_service import IngestionJobService
 from app.schemas import (
-    UserCreate, UserUpdate, UserResponse, UserListResponse,
-    RateCreate, RateUpdate, RateResponse
+    UserCreate, UserUpdate, UserResponse, UserListResponse, PageCursor,
+    RateCreate, RateUpdate, RateResponse,
+    IngestionJobCreate, IngestionJobUpdate, IngestionJobResponse, IngestionJobListResponse
 )
 
 router = APIRouter(
@@ -22,137 +30,137 @@ router = APIRouter(
 # --- GESTIÓN DE USUARIOS ---
 
 @router.post("/register_user", response_model=UserResponse)
-def create_user(user_in: UserCreate):
-    service = UserService()
-    try:
-        user = service.register_user(user_in)
-        if not user:
-            raise HTTPException(status_code=400, detail="User could not be created")
-        return user
-    finally:
-        service.controller.close_session()
+def create_user(user_in: UserCreate, service: UserService = Depends(provide_user_service)):
+    user = service.register_user(user_in)
+    if not user:
+        raise HTTPException(status_code=400, detail="User could not be created")
+    return user
 
 @router.patch("/update_user/{user_id}", response_model=UserResponse)
-def update_user(user_id: int, user_in: UserUpdate):
-    service = UserService()
-    try:
-        return service.update_user_data(user_id, user_in)
-    finally:
-        service.controller.close_session()
+def update_user(user_id: int, user_in: UserUpdate, service: UserService = Depends(provide_user_service)):
+    return service.update_user_data(user_id, user_in)
 
 @router.delete("/delete_user/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_user(user_id: int):
+def delete_user(user_id: int, service: UserService = Depends(provide_user_service)):
     """Deletes a user from the system."""
-    service = UserService()
-    try:
-        success = service.controller.delete_user(user_id)
-        if not success:
-            raise HTTPException(status_code=404, detail="User not found")
-        return None
-    finally:
-        service.controller.close_session()
+    success = service.controller.delete_user(user_id)
+    if not success:
+        raise HTTPException(status_code=404, detail="User not found")
+    return None
 
 @router.patch("/activate_user/{user_id}", response_model=UserResponse)
-def activate_user(user_id: int):
-    service = UserService()
-    try:
-        return service.activate_user(user_id)
-    finally:
-        service.controller.close_session()
+def activate_user(user_id: int, service: UserService = Depends(provide_user_service)):
+    return service.activate_user(user_id)
 
 @router.patch("/deactivate_user/{user_id}", response_model=UserResponse)
-def deactivate_user(user_id: int):
-    service = UserService()
-    try:
-        return service.deactivate_user(user_id)
-    finally:
-        service.controller.close_session()
+def deactivate_user(user_id: int, service: UserService = Depends(provide_user_service)):
+    return service.deactivate_user(user_id)
 
 @router.patch("/update_user_role/{user_id}", response_model=UserResponse)
-def update_user_role(user_id: int, user_role: str):
-    service = UserService()
+def update_user_role(user_id: int, user_role: str, service: UserService = Depends(provide_user_service)):
     user_role_map: dict[str, UserRole] = {
         "ADMIN": UserRole.ADMIN,
         "CLIENT": UserRole.CLIENT
     }
-    try:
-        return service.update_user_role(user_id, user_role = user_role_map.get(user_role))
-    finally:
-        service.controller.close_session()
+    return service.update_user_role(user_id, user_role = user_role_map.get(user_role))
 
 # --- VISUALIZAR USUARIOS POR PERÍODOS ---
 
 @router.get("/users_register_last_month", response_model=UserListResponse)
-def get_users_register_last_month():
-    service = UserService()
-    try:
-        return service.get_user_register_last_month()
-    finally:
-        service.controller.close_session()
+def get_users_register_last_month(service: UserService = Depends(provide_user_service)):
+    return service.get_user_register_last_month()
 
 @router.get("/users_register_last_3_months", response_model=UserListResponse)
-def get_users_register_last_3_months():
-    service = UserService()
-    try:
-        return service.get_user_register_last_3_months()
-    finally:
-        service.controller.close_session()
+def get_users_register_last_3_months(service: UserService = Depends(provide_user_service)):
+    return service.get_user_register_last_3_months()
 
 @router.get("/users_register_last_6_months", response_model=UserListResponse)
-def get_users_register_last_6_months():
-    service = UserService()
-    try:
-        return service.get_user_register_last_6_months()
-    finally:
-        service.controller.close_session()
+def get_users_register_last_6_months(service: UserService = Depends(provide_user_service)):
+    return service.get_user_register_last_6_months()
 
 @router.get("/all_users", response_model=UserListResponse)
-def get_all_users():
-    service = UserService()
-    try:
-        return service.get_all_users()
-    finally:
-        service.controller.close_session()
+def get_all_users(
+    limit: int = Query(Config.PAGINATION_DEFAULT_LIMIT, ge=1, le=Config.PAGINATION_MAX_LIMIT),
+    after: Optional[PageCursor] = Depends(get_page_cursor),
+    service: UserService = Depends(provide_user_service)
+):
+    return PydanticJSONResponse(service.get_users_page(limit, after))
 
 @router.get("/users_register_last_year", response_model=UserListResponse)
-def get_users_register_last_year():
-    service = UserService()
-    try:
-        return service.get_user_register_last_year()
-    finally:
-        service.controller.close_session()
+def get_users_register_last_year(service: UserService = Depends(provide_user_service)):
+    return service.get_user_register_last_year()
 
 @router.get("/users_by_custom_range", response_model=UserListResponse)
-def get_users_by_custom_range(start_date: str, end_date: str):
-    service = UserService()
-    try:
-        return service.get_users_by_custom_range(start_date, end_date)
-    finally:
-        service.controller.close_session()
+def get_users_by_custom_range(start_date: str, end_date: str, service: UserService = Depends(provide_user_service)):
+    return service.get_users_by_custom_range(start_date, end_date)
+
+# Las exportaciones abren su propia sesión, el stream sigue después de cerrar la del request
+@router.get("/export_users", response_class=StreamingResponse)
+async def export_users(
+    format: ExportFormat = Query(ExportFormat.NDJSON),
+    service: UserService = Depends(get_user_service)
+):
+    return StreamingResponse(
+        service.export_users(format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="users.{format}"'}
+    )
 
 # --- GESTIÓN DE TASAS (RATES) ---
 
 @router.post("/register_rate", response_model=RateResponse)
-def register_rate(rate_in: RateCreate):
-    service = RateService()
-    try:
-        return service.register_rate(rate_in)
-    finally:
-        service.controller.close_session()
+def register_rate(rate_in: RateCreate, service: RateService = Depends(provide_rate_service)):
+    return service.register_rate(rate_in)
 
 @router.patch("/update_rate/{rate_id}", response_model=RateResponse)
-def update_rate(rate_id: int, rate_in: RateUpdate):
-    service = RateService()
-    try:
-        return service.update_rate(rate_id, rate_in)
-    finally:
-        service.controller.close_session()
+def update_rate(rate_id: int, rate_in: RateUpdate, service: RateService = Depends(provide_rate_service)):
+    return service.update_rate(rate_id, rate_in)
 
 @router.delete("/delete_rate/{rate_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_rate(rate_id: int):
-    service = RateService()
-    try:
-        if not service.delete_rate(rate_id):
-            raise HTTPException(status_code=404, detail="Rate record not found")
-    finally:
-        service.controller.close_session()
\ No newline at end of file
+def delete_rate(rate_id: int, service: RateService = Depends(provide_rate_service)):
+    if not service.delete_rate(rate_id):
+        raise HTTPException(status_code=404, detail="Rate record not found")
+
+@router.get("/export_rates", response_class=StreamingResponse)
+async def export_rates(
+    format: ExportFormat = Query(ExportFormat.NDJSON),
+    service: RateService = Depends(get_rate_service)
+):
+    return StreamingResponse(
+        service.export_rates(format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="rates.{format}"'}
+    )
+
+# --- REGISTRO DE JOBS DE INGESTA ---
+# Los cambios se aplican al scheduler en la siguiente sincronización (INGESTION_JOBS_REFRESH_SECONDS).
+
+@router.get("/ingestion_jobs", response_model=IngestionJobListResponse)
+def get_ingestion_jobs(service: IngestionJobService = Depends(provide_ingestion_job_service)):
+    return PydanticJSONResponse(service.get_jobs())
+
+@router.post("/ingestion_jobs", response_model=IngestionJobResponse)
+def register_ingestion_job(
+    job_in: IngestionJobCreate,
+    service: IngestionJobService = Depends(provide_ingestion_job_service)
+):
+    job = service.register_job(job_in)
+    if not job:
+        raise HTTPException(status_code=400, detail="Ingestion job could not be created")
+    return job
+
+@router.patch("/ingestion_jobs/{job_id}", response_model=IngestionJobResponse)
+def update_ingestion_job(
+    job_id: int,
+    job_in: IngestionJobUpdate,
+    service: IngestionJobService = Depends(provide_ingestion_job_service)
+):
+    job = service.update_job(job_id, job_in)
+    if not job:
+        raise HTTPException(status_code=404, detail="Ingestion job not found")
+    return job
+
+@router.delete("/ingestion_jobs/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_ingestion_job(job_id: int, service: IngestionJobService = Depends(provide_ingestion_job_service)):
+    if not service.delete_job(job_id):
+        raise HTTPException(status_code=404, detail="Ingestion job not found")
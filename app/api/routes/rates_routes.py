@@ -1,168 +1,228 @@
 """
 Module for defining API routes related to exchange rates.
 """
-from fastapi import APIRouter, Query, HTTPException, status
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, HTTPException, status
 
-from app.services import RateService
-from app.schemas import RateResponse, RateListResponse
+from app.enums import CurrencyEnum, TradeType, CandleResolution
+from app.config import Config
+from app.api.responses import PydanticJSONResponse
+from app.api.dependencies import provide_async_rate_service, provide_candle_service, get_page_cursor
+from app.services import RateService, CandleService, get_cross_rate_engine, get_live_quote_cache
+from app.schemas import (
+    RateResponse, RateListResponse, CrossRateResponse, CrossRateListResponse, CandleListResponse,
+    LiveQuoteResponse, PageCursor
+)
 
 router = APIRouter(prefix="/rates", tags=["Exchange Rates"])
 
 @router.get("/today", summary="Get today's exchange rates", response_model=RateListResponse)
-def get_today_exchange_rates():
+async def get_today_exchange_rates(rate_service: RateService = Depends(provide_async_rate_service)):
     """
     Retrieve today's exchange rates.
     """
-    rate_service = RateService()
-    try:
-        rates = rate_service.get_today_rates()
-        if not rates:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="No rates found for today.",
-            )
-        return rates
-    finally:
-        rate_service.dispose()
+    rates = await rate_service.get_today_rates_async()
+    if not rates:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No rates found for today.",
+        )
+    return PydanticJSONResponse(rates)
 
 
 @router.get("/week", summary="Get rates for the last week", response_model=RateListResponse)
-def get_last_week_exchange_rates():
+async def get_last_week_exchange_rates(rate_service: RateService = Depends(provide_async_rate_service)):
     """
     Retrieve rates for the last week.
     """
-    rate_service = RateService()
-    try:
-        rates = rate_service.get_last_week_rates()
-        if not rates:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="No rates found for this week."
-            )
-        return rates
-    finally:
-        rate_service.dispose()
+    rates = await rate_service.get_last_week_rates_async()
+    if not rates:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No rates found for this week."
+        )
+    return PydanticJSONResponse(rates)
 
 @router.get("/month", summary="Get rates for the last month", response_model=RateListResponse)
-def get_last_month_exchange_rates():
+async def get_last_month_exchange_rates(rate_service: RateService = Depends(provide_async_rate_service)):
     """
     Retrieve rates for the last month.
     """
-    rate_service = RateService()
-    try:
-        rates = rate_service.get_last_month_rates()
-        if not rates:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="No rates found for this month."
-            )
-        return rates
-    finally:
-        rate_service.dispose()
+    rates = await rate_service.get_last_month_rates_async()
+    if not rates:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No rates found for this month."
+        )
+    return PydanticJSONResponse(rates)
 
 
 @router.get("/3months", summary="Get rates for the last 3 months", response_model=RateListResponse)
-def get_last_3_months_exchange_rates():
+async def get_last_3_months_exchange_rates(rate_service: RateService = Depends(provide_async_rate_service)):
     """
     Retrieve rates for the last 3 months.
     """
-    rate_service = RateService()
-    try:
-        rates = rate_service.get_last_3_months_rates()
-        if not rates:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="No rates found for the last 3 months."
-            )
-        return rates
-    finally:
-        rate_service.dispose()
+    rates = await rate_service.get_last_3_months_rates_async()
+    if not rates:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No rates found for the last 3 months."
+        )
+    return PydanticJSONResponse(rates)
 
 
 @router.get("/6months", summary="Get rates for the last 6 months", response_model=RateListResponse)
-def get_last_6_months_exchange_rates():
+async def get_last_6_months_exchange_rates(rate_service: RateService = Depends(provide_async_rate_service)):
     """
     Retrieve rates for the last 6 months.
     """
-    rate_service = RateService()
-    try:
-        rates = rate_service.get_last_6_months_rates()
-        if not rates:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="No rates found for the last 6 months."
-            )
-        return rates
-    finally:
-        rate_service.dispose()
+    rates = await rate_service.get_last_6_months_rates_async()
+    if not rates:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No rates found for the last 6 months."
+        )
+    return PydanticJSONResponse(rates)
 
 @router.get("/year", summary="Get rates for the last year", response_model=RateListResponse)
-def get_last_year_exchange_rates():
+async def get_last_year_exchange_rates(rate_service: RateService = Depends(provide_async_rate_service)):
     """
     Retrieve rates for the last year.
     """
-    rate_service = RateService()
-    try:
-        rates = rate_service.get_last_year_rates()
-        if not rates:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="No rates found for the last year."
-            )
-        return rates
-    finally:
-        rate_service.dispose()
+    rates = await rate_service.get_last_year_rates_async()
+    if not rates:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No rates found for the last year."
+        )
+    return PydanticJSONResponse(rates)
 
 @router.get("/custom", summary="Get rates within a specified date range", response_model=RateListResponse)
-def get_custom_exchange_rates(
+async def get_custom_exchange_rates(
     start_date: str = Query(..., description="Start date in YYYY-MM-DD format"),
-    end_date: str = Query(..., description="End date in YYYY-MM-DD format")
+    end_date: str = Query(..., description="End date in YYYY-MM-DD format"),
+    rate_service: RateService = Depends(provide_async_rate_service)
 ):
     """
     Retrieve rates within a specified date range.
     """
-    rate_service = RateService()
-    try:
-        rates = rate_service.get_rates_by_custom_range(start_date, end_date)
-        if not rates:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="No rates found for the specified date range."
-            )
-        return rates
-    finally:
-        rate_service.dispose()
-
-@router.get("/all", summary="Get all rates", response_model=RateListResponse)
-def get_all_exchange_rates():
-    """
-    Retrieve all rates.
-    """
-    rate_service = RateService()
-    try:
-        rates = rate_service.get_all_rates()
-        if not rates:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="No rates found in the database."
-            )
-        return rates
-    finally:
-        rate_service.dispose()
+    rates = await rate_service.get_rates_by_custom_range_async(start_date, end_date)
+    if not rates:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No rates found for the specified date range."
+        )
+    return PydanticJSONResponse(rates)
+
+@router.get("/all", summary="Get all rates, one page at a time", response_model=RateListResponse)
+async def get_all_exchange_rates(
+    limit: int = Query(Config.PAGINATION_DEFAULT_LIMIT, ge=1, le=Config.PAGINATION_MAX_LIMIT, description="Rates per page"),
+    after: Optional[PageCursor] = Depends(get_page_cursor),
+    rate_service: RateService = Depends(provide_async_rate_service)
+):
+    """
+    Retrieve all rates, newest first. Follow next_cursor to get the next page.
+    """
+    rates = await rate_service.get_rates_page_async(limit, after)
+    if not rates and after is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No rates found in the database."
+        )
+    return PydanticJSONResponse(rates)
+
+@router.get("/latest", summary="Get the latest Binance rate of every pair, side and pay method", response_model=RateListResponse)
+async def get_latest_exchange_rates(
+    from_currency: Optional[CurrencyEnum] = Query(None, description="Source currency code, e.g. USDT"),
+    to_currency: Optional[CurrencyEnum] = Query(None, description="Target currency code, e.g. VES"),
+    trade_type: Optional[TradeType] = Query(None, description="Binance P2P side"),
+    pay_method: Optional[str] = Query(None, description="Binance pay method, e.g. PagoMovil or PIX"),
+    rate_service: RateService = Depends(provide_async_rate_service)
+):
+    """
+    Retrieve the latest rate sampled from Binance for every pair, side and pay method.
+    Rates without a pay method are sampled on the whole order book.
+    """
+    rates = await rate_service.get_latest_rates_async(from_currency, to_currency, trade_type, pay_method)
+    if not rates.count:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No rates found for the specified filters."
+        )
+    return PydanticJSONResponse(rates)
+
+@router.get("/live", summary="Get the live USDT/VES rate from Binance", response_model=LiveQuoteResponse)
+def get_live_exchange_rate():
+    """
+    Retrieve the live USDT/VES rate. Served from a short TTL cache, stale values are
+    served while a single background refresh hits Binance.
+    """
+    quote = get_live_quote_cache().get(timeout=Config.LIVE_QUOTE_WAIT_SECONDS)
+    if not quote:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Live rate is temporarily unavailable."
+        )
+    return quote
+
+@router.get("/cross", summary="Get a derived cross rate", response_model=CrossRateResponse)
+def get_cross_rate(
+    from_currency: CurrencyEnum = Query(..., description="Source currency code, e.g. BRL"),
+    to_currency: CurrencyEnum = Query(..., description="Target currency code, e.g. VES")
+):
+    """
+    Retrieve a cross rate derived from the latest Binance legs.
+    """
+    rate = get_cross_rate_engine().get_quote(from_currency, to_currency)
+    if not rate:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Cross rate {from_currency}/{to_currency} cannot be derived."
+        )
+    return rate
+
+@router.get("/cross/all", summary="Get every derived cross rate", response_model=CrossRateListResponse)
+def get_all_cross_rates():
+    """
+    Retrieve every cross rate derived from the latest Binance legs.
+    """
+    rates = get_cross_rate_engine().get_all()
+    return PydanticJSONResponse(CrossRateListResponse(count=len(rates), rates=rates))
+
+@router.get("/candles", summary="Get OHLC candles within a date range", response_model=CandleListResponse)
+def get_rate_candles(
+    start_date: date = Query(..., description="Start date in YYYY-MM-DD format"),
+    end_date: date = Query(..., description="End date in YYYY-MM-DD format"),
+    from_currency: CurrencyEnum = Query(CurrencyEnum.USDT, description="Source currency code"),
+    to_currency: CurrencyEnum = Query(CurrencyEnum.VES, description="Target currency code"),
+    trade_type: Optional[TradeType] = Query(None, description="Binance P2P side, both if omitted"),
+    resolution: Optional[CandleResolution] = Query(None, description="1m, 1h or 1d. Picked from the range if omitted"),
+    candle_service: CandleService = Depends(provide_candle_service)
+):
+    """
+    Retrieve the OHLC candles of a pair within a date range.
+    """
+    candles = candle_service.get_candles(
+        from_currency, to_currency, start_date, end_date,
+        resolution=resolution, trade_type=trade_type
+    )
+    if not candles.count:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No candles found for the specified date range."
+        )
+    return PydanticJSONResponse(candles)
 
 @router.get("/{id}", summary="Get a rate by ID", response_model=RateResponse)
-def get_rate_by_id(id: int):
+async def get_rate_by_id(id: int, rate_service: RateService = Depends(provide_async_rate_service)):
     """
     Retrieve a rate by its ID.
     """
-    rate_service = RateService()
-    try:
-        rate = rate_service.get_rate_by_id(id)
-        if not rate:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Rate not found."
-            )
-        return rate
-    finally:
-        rate_service.dispose()
\ No newline at end of file
+    rate = await rate_service.get_rate_by_id_async(id)
+    if not rate:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Rate not found."
+        )
+    return rate
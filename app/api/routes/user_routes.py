@@ -4,7 +4,7 @@ Module for defining API routes related to user management.
 from fastapi import APIRouter, Depends, HTTPException, status
 from typing import List
 
-from app.api.dependencies import get_current_user
+from app.api.dependencies import get_current_user, provide_user_service
 from app.services.user_service import UserService
 from app.schemas import UserResponse, UserUpdate, UserCreate
 
@@ -22,40 +22,34 @@ def read_user_me(current_user: UserResponse = Depends(get_current_user)):
     return current_user
 
 @router.patch("/update_user", response_model=UserResponse)
-def update_user(user_in: UserUpdate, current_user: UserResponse = Depends(get_current_user)):
+def update_user(
+    user_in: UserUpdate,
+    current_user: UserResponse = Depends(get_current_user),
+    service: UserService = Depends(provide_user_service)
+):
     """
     Update the current user's information.
     """
-    service = UserService()
-    try:
-        return service.update_user_data(current_user.id, user_in)
-    finally:
-        service.controller.close_session()
+    return service.update_user_data(current_user.id, user_in)
 
 @router.patch("/update_password", response_model=UserResponse)
 def update_password(
     new_password: str,
-    current_user: UserResponse = Depends(get_current_user)
+    current_user: UserResponse = Depends(get_current_user),
+    service: UserService = Depends(provide_user_service)
 ):
     """
     Update the current user's password.
     """
-    service = UserService()
-    try:
-        return service.update_user_password_hash(current_user.id, new_password)
-    finally:
-        service.controller.close_session()
+    return service.update_user_password_hash(current_user.id, new_password)
 
 @router.patch("/update_email", response_model=UserResponse)
 def update_email(
     new_email: str,
-    current_user: UserResponse = Depends(get_current_user)
+    current_user: UserResponse = Depends(get_current_user),
+    service: UserService = Depends(provide_user_service)
 ):
     """
     Update the current user's email.
     """
-    service = UserService()
-    try:
-        return service.update_user_email(current_user.id, new_email)
-    finally:
-        service.controller.close_session()
\ No newline at end of file
+    return service.update_user_email(current_user.id, new_email)
@@ -2,6 +2,7 @@ import os
 from pathlib import Path
 from typing import Dict
 from dotenv import load_dotenv
+from sqlalchemy.engine import make_url
 
 load_dotenv()
 __version__ = "0.1.6"
@@ -19,7 +20,33 @@ class Config:
 
     # Database
     DATABASE_URL: str = f"sqlite:///{os.path.join(INSTANCE_PATH, 'westcambios.db')}"
+    ASYNC_DATABASE_URL: str = make_url(DATABASE_URL).set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
     DATABASE_CONNECT_ARGS: dict = {"check_same_thread": False}
+    DATABASE_POOL_SIZE: int = int(os.getenv("DATABASE_POOL_SIZE", 10))
+    DATABASE_MAX_OVERFLOW: int = int(os.getenv("DATABASE_MAX_OVERFLOW", 10))
+    DATABASE_POOL_TIMEOUT: float = float(os.getenv("DATABASE_POOL_TIMEOUT", 30))
+    DATABASE_POOL_RECYCLE: int = int(os.getenv("DATABASE_POOL_RECYCLE", 3600))
+
+    # SQLite profile, applied to every new connection
+    SQLITE_JOURNAL_MODE: str = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", 5000))
+    SQLITE_CACHE_SIZE: int = int(os.getenv("SQLITE_CACHE_SIZE", -64000))  # Negative: KiB, i.e. 64 MB
+    SQLITE_MMAP_SIZE: int = int(os.getenv("SQLITE_MMAP_SIZE", 256 * 1024 * 1024))
+    SQLITE_TEMP_STORE: str = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
+
+    # Single writer thread, groups the writes queued meanwhile in one transaction
+    DB_WRITER_ENABLED: bool = os.getenv("DB_WRITER_ENABLED", "true").lower() == "true"
+    DB_WRITER_MAX_BATCH: int = int(os.getenv("DB_WRITER_MAX_BATCH", 200))
+    DB_WRITER_LINGER_MS: float = float(os.getenv("DB_WRITER_LINGER_MS", 2))
+    DB_WRITER_TIMEOUT_SECONDS: float = float(os.getenv("DB_WRITER_TIMEOUT_SECONDS", 30))
+
+    # Keyset pagination of the list endpoints
+    PAGINATION_DEFAULT_LIMIT: int = int(os.getenv("PAGINATION_DEFAULT_LIMIT", 100))
+    PAGINATION_MAX_LIMIT: int = int(os.getenv("PAGINATION_MAX_LIMIT", 1000))
+
+    # Streaming exports, rows fetched from the cursor and sent per chunk
+    EXPORT_BATCH_SIZE: int = int(os.getenv("EXPORT_BATCH_SIZE", 1000))
 
     # API
     API_HOST: str = "0.0.0.0"
@@ -43,6 +70,79 @@ class Config:
     STATIC_DIR = UI_DIR / "static"
     INDEX_HTML = UI_DIR / "index.html"
 
+    # Upstream HTTP client
+    HTTP_POOL_SIZE: int = int(os.getenv("HTTP_POOL_SIZE", 10))
+    HTTP_CONNECT_TIMEOUT: float = float(os.getenv("HTTP_CONNECT_TIMEOUT", 3.05))
+    HTTP_READ_TIMEOUT: float = float(os.getenv("HTTP_READ_TIMEOUT", 10))
+    HTTP_MAX_RETRIES: int = int(os.getenv("HTTP_MAX_RETRIES", 3))
+    HTTP_BACKOFF_FACTOR: float = float(os.getenv("HTTP_BACKOFF_FACTOR", 0.5))
+    HTTP_BACKOFF_JITTER: float = float(os.getenv("HTTP_BACKOFF_JITTER", 0.5))
+
+    # Binance P2P
+    BINANCE_PAGES: int = int(os.getenv("BINANCE_PAGES", 5))
+    BINANCE_MAX_WORKERS: int = int(os.getenv("BINANCE_MAX_WORKERS", 4))
+    BINANCE_INGEST_PAIRS: list = [
+        tuple(pair.strip().split("/")) for pair in os.getenv("BINANCE_INGEST_PAIRS", "USDT/VES,USDT/BRL").split(",")
+    ]
+    BINANCE_INGEST_SIDES: list = [
+        side.strip() for side in os.getenv("BINANCE_INGEST_SIDES", "BUY,SELL").split(",")
+    ]
+    # Pay methods sampled on top of the whole order book, by fiat: "VES:PagoMovil|Banesco,BRL:PIX"
+    BINANCE_PAY_METHODS: dict = {
+        fiat.strip(): [method.strip() for method in methods.split("|") if method.strip()]
+        for fiat, _, methods in (
+            entry.partition(":") for entry in os.getenv("BINANCE_PAY_METHODS", "VES:PagoMovil|Banesco,BRL:PIX").split(",")
+        )
+        if fiat.strip()
+    }
+    BINANCE_STORE_AD_SNAPSHOTS: bool = os.getenv("BINANCE_STORE_AD_SNAPSHOTS", "true").lower() == "true"
+    BINANCE_PUBLISHED_PRICE: str = os.getenv("BINANCE_PUBLISHED_PRICE", "trimmed_mean_price")
+    BINANCE_SAMPLING_INTERVAL_SECONDS: int = int(os.getenv("BINANCE_SAMPLING_INTERVAL_SECONDS", 60))
+    BINANCE_SAMPLING_PAGES: int = int(os.getenv("BINANCE_SAMPLING_PAGES", 1))
+    BINANCE_BREAKER_FAILURE_THRESHOLD: int = int(os.getenv("BINANCE_BREAKER_FAILURE_THRESHOLD", 5))
+    BINANCE_BREAKER_RESET_SECONDS: float = float(os.getenv("BINANCE_BREAKER_RESET_SECONDS", 60))
+    BINANCE_RATE_LIMIT_PER_SECOND: float = float(os.getenv("BINANCE_RATE_LIMIT_PER_SECOND", 5))
+    BINANCE_RATE_LIMIT_BURST: int = int(os.getenv("BINANCE_RATE_LIMIT_BURST", 10))
+    BINANCE_RATE_LIMIT_WAIT_SECONDS: float = float(os.getenv("BINANCE_RATE_LIMIT_WAIT_SECONDS", 30))
+    CANDLE_MINUTE_RETENTION_DAYS: int = int(os.getenv("CANDLE_MINUTE_RETENTION_DAYS", 7))
+
+    # Ingestion jobs
+    INGESTION_EXECUTOR_WORKERS: int = int(os.getenv("INGESTION_EXECUTOR_WORKERS", 10))
+    INGESTION_JOB_MAX_INSTANCES: int = int(os.getenv("INGESTION_JOB_MAX_INSTANCES", 1))
+    INGESTION_JOB_JITTER_SECONDS: int = int(os.getenv("INGESTION_JOB_JITTER_SECONDS", 5))
+    INGESTION_MISFIRE_GRACE_SECONDS: int = int(os.getenv("INGESTION_MISFIRE_GRACE_SECONDS", 30))
+    INGESTION_JOBS_REFRESH_SECONDS: int = int(os.getenv("INGESTION_JOBS_REFRESH_SECONDS", 60))
+
+    # Ingestion runs in the API process unless disabled, see westcambios-worker
+    INGESTION_ENABLED: bool = os.getenv("INGESTION_ENABLED", "true").lower() == "true"
+
+    # Leader election of the scheduler process
+    LEADER_LEASE_SECONDS: float = float(os.getenv("LEADER_LEASE_SECONDS", 30))
+    LEADER_RENEW_SECONDS: float = float(os.getenv("LEADER_RENEW_SECONDS", 10))
+
+    # Live quotes
+    LIVE_QUOTE_TTL_SECONDS: float = float(os.getenv("LIVE_QUOTE_TTL_SECONDS", 30))
+    LIVE_QUOTE_MAX_STALE_SECONDS: float = float(os.getenv("LIVE_QUOTE_MAX_STALE_SECONDS", 900))
+    LIVE_QUOTE_WAIT_SECONDS: float = float(os.getenv("LIVE_QUOTE_WAIT_SECONDS", 15))
+
+    # Price statistics
+    PRICE_TRIM_FRACTION: float = float(os.getenv("PRICE_TRIM_FRACTION", 0.1))
+    PRICE_IQR_FACTOR: float = float(os.getenv("PRICE_IQR_FACTOR", 1.5))
+
+    # In-memory window of recent rates serving the period endpoints
+    HOT_RATES_ENABLED: bool = os.getenv("HOT_RATES_ENABLED", "true").lower() == "true"
+    HOT_RATES_WINDOW_DAYS: int = int(os.getenv("HOT_RATES_WINDOW_DAYS", 365))
+    HOT_RATES_SYNC_SECONDS: float = float(os.getenv("HOT_RATES_SYNC_SECONDS", 5))
+
+    # Cross rates
+    CROSS_RATE_REFRESH_SECONDS: float = float(os.getenv("CROSS_RATE_REFRESH_SECONDS", 60))
+    CROSS_RATE_MARGIN: float = float(os.getenv("CROSS_RATE_MARGIN", 0.0))
+    CROSS_RATE_SOURCE_SIDE: str = os.getenv("CROSS_RATE_SOURCE_SIDE", "SELL")
+    CROSS_RATE_TARGET_SIDE: str = os.getenv("CROSS_RATE_TARGET_SIDE", "BUY")
+    CROSS_RATE_PAIRS: list = [
+        tuple(pair.strip().split("/")) for pair in os.getenv("CROSS_RATE_PAIRS", "BRL/VES").split(",") if pair.strip()
+    ]
+
     # Log level
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
 
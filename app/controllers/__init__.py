@@ -1,2 +1,5 @@
 from app.controllers.rates_controller import RateController
-from app.controllers.user_controller import UserController
\ No newline at end of file
+from app.controllers.user_controller import UserController
+from app.controllers.candles_controller import CandleController
+from app.controllers.ad_snapshots_controller import AdSnapshotController
+from app.controllers.ingestion_jobs_controller import IngestionJobController
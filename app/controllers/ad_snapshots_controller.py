@@ -0,0 +1,45 @@
+"""
+Binance ad snapshots controller
+"""
+import logging
+from typing import List
+
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.schemas import AdSnapshotCreate
+from app.controllers.base_controller import BaseController
+from app.database.models import AdSnapshotsDatabaseModel
+
+class AdSnapshotController(BaseController):
+    """
+    Controller for managing the Binance ad snapshots in the database.
+    """
+    def __init__(self) -> None:
+        """
+        Initializes the controller with a dedicated database session and logger.
+        """
+        super().__init__()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def bulk_register(self, snapshots: List[AdSnapshotCreate]) -> int:
+        """
+        Inserts the ads of an ingestion run with a single executemany INSERT and one commit.
+        No ORM instance is built per row.
+
+        Args:
+            snapshots(List[AdSnapshotCreate]): Ads to be stored.
+
+        Returns:
+            int: Number of ads stored, 0 if the transaction failed.
+        """
+        if not snapshots:
+            return 0
+        try:
+            rows = [snapshot.model_dump() for snapshot in snapshots]
+            self._write(lambda session: session.execute(insert(AdSnapshotsDatabaseModel), rows))
+            self.logger.info(f"Successfully stored {len(snapshots)} ad snapshots")
+            return len(snapshots)
+        except (SQLAlchemyError, TimeoutError) as e:
+            self.logger.error(f"SQLAlchemy Error during ad snapshots insert: {e}")
+            return 0
@@ -2,11 +2,19 @@
 Base methods and class for controllers
 """
 import logging
-from typing import Any, Optional, Type
-from sqlalchemy.orm import Session
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Type
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.database.db_config import SessionLocal
+from app.config import Config
+from app.database.db_config import (
+    SessionLocal, AsyncSessionLocal, engine, get_scoped_session, get_scoped_async_session
+)
+from app.database.db_writer import WriteOperation, get_db_writer
 
 class BaseController:
     """
@@ -14,10 +22,117 @@ class BaseController:
     """
     def __init__(self) -> None:
         """
-        Initializes the controller with a dedicated database session and logger.
+        Initializes the controller with its logger. The database session is opened on first use.
         """
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.session: Session = SessionLocal()
+        self._session: Optional[Session] = None
+
+    @property
+    def session(self) -> Session:
+        """
+        Session of the current request when served within session_scope(),
+        otherwise the dedicated session of the controller.
+        """
+        scoped = get_scoped_session()
+        if scoped is not None:
+            return scoped
+        if self._session is None:
+            self._session = SessionLocal()
+        return self._session
+
+    @session.setter
+    def session(self, session: Session) -> None:
+        self._session = session
+
+    @asynccontextmanager
+    async def _async_session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Async session of the current request when served within async_session_scope(),
+        otherwise a session opened for the block only.
+
+        Yields:
+            AsyncSession: Session for the async read methods.
+        """
+        scoped = get_scoped_async_session()
+        if scoped is not None:
+            yield scoped
+            return
+        async with AsyncSessionLocal() as session:
+            yield session
+
+    def _write(self, operation: WriteOperation) -> Any:
+        """
+        Internal helper to run a write operation and commit it.
+        Sessions of the application database hand it to the single writer thread,
+        other sessions (tests, scripts) run it inline.
+
+        Args:
+            operation (WriteOperation): Callable run with the session that commits it.
+                It must only touch the objects it loads itself, the writer may run it twice.
+
+        Returns:
+            Any: Value returned by the operation.
+
+        Raises:
+            SQLAlchemyError: If the transaction failed, after rolling it back.
+            TimeoutError: If the writer did not start the operation in time. It is cancelled,
+                an operation already running is waited for instead, it may still commit.
+        """
+        if not Config.DB_WRITER_ENABLED or self.session.get_bind() is not engine:
+            try:
+                result = operation(self.session)
+                self.session.commit()
+                return result
+            except SQLAlchemyError:
+                self.session.rollback()
+                raise
+        # Ends the read transaction, so this session sees the commit of the writer
+        self.session.rollback()
+        future = get_db_writer().submit(operation)
+        try:
+            return future.result(timeout=Config.DB_WRITER_TIMEOUT_SECONDS)
+        except TimeoutError:
+            if future.cancel():
+                raise
+            self.logger.warning("Write still running after its timeout, waiting for its commit")
+            return future.result()
+
+    @staticmethod
+    def _column_values(record: Any) -> Dict[str, Any]:
+        """
+        Loaded column values of a record, pending changes included.
+        """
+        state = inspect(record)
+        return {attr.key: state.dict[attr.key] for attr in state.mapper.column_attrs if attr.key in state.dict}
+
+    def _save_records(self, records: List[Any]) -> None:
+        """
+        Internal helper to insert or update records through _write().
+        The writer saves copies of the records, then the records get the saved values
+        and are attached to this session, as if it had committed them.
+
+        Args:
+            records (List[object]): New or modified SQLAlchemy model instances.
+        """
+        snapshots = [(type(record), self._column_values(record)) for record in records]
+        for record in records:
+            if record in self.session:
+                self.session.expunge(record)
+
+        def save(session: Session) -> List[Dict[str, Any]]:
+            merged = [session.merge(model(**values)) for model, values in snapshots]
+            session.flush()
+            saved = [self._column_values(record) for record in merged]
+            for record in merged:
+                session.expunge(record)
+            return saved
+
+        for record, values in zip(records, self._write(save)):
+            for key, value in values.items():
+                set_committed_value(record, key, value)
+            if inspect(record).transient:
+                make_transient_to_detached(record)
+            self.session.add(record)
 
     def _commit_or_rollback(self, record: Any) -> bool:
         """
@@ -30,15 +145,31 @@ class BaseController:
             bool: True if the operation was successful, False otherwise.
         """
         try:
-            self.session.add(record)
-            self.session.commit()
+            self._save_records([record])
             self.logger.info(f"Successfully committed: {record}")
             return True
-        except SQLAlchemyError as e:
-            self.session.rollback()
+        except (SQLAlchemyError, TimeoutError) as e:
             self.logger.error(f"SQLAlchemy Error during commit: {e}")
             return False
 
+    def _commit_all_or_rollback(self, records: List[Any]) -> bool:
+        """
+        Internal helper to commit several new records in a single transaction or rollback on error.
+
+        Args:
+            records (List[object]): The SQLAlchemy model instances to be saved.
+
+        Returns:
+            bool: True if the operation was successful, False otherwise.
+        """
+        try:
+            self._save_records(records)
+            self.logger.info(f"Successfully committed {len(records)} records")
+            return True
+        except (SQLAlchemyError, TimeoutError) as e:
+            self.logger.error(f"SQLAlchemy Error during batch commit: {e}")
+            return False
+
     def _update_or_rollback(self, record: Any) -> bool:
         """
         Internal helper to update an existing record or rollback on error.
@@ -50,18 +181,17 @@ class BaseController:
             bool: True if the update was successful, False otherwise.
         """
         try:
-            self.session.add(record)
-            self.session.commit()
+            self._save_records([record])
             self.logger.info(f"Successfully updated: {record}")
             return True
-        except SQLAlchemyError as e:
-            self.session.rollback()
+        except (SQLAlchemyError, TimeoutError) as e:
             self.logger.error(f"SQLAlchemy Error during update: {e}")
             return False
 
     def _delete_or_rollback(self, record: Any) -> bool:
         """
         Internal helper to delete a record or rollback on error.
+        The record is left detached, with the values it had.
 
         Args:
             record (object): The SQLAlchemy model instance to be deleted.
@@ -69,13 +199,24 @@ class BaseController:
         Returns:
             bool: True if the deletion was successful, False otherwise.
         """
-        try:
-            self.session.delete(record)
-            self.session.commit()
-            self.logger.info(f"Successfully deleted: {record}")
+        model, identity = type(record), inspect(record).identity
+        if record in self.session:
+            self.session.expunge(record)
+
+        def delete(session: Session) -> bool:
+            target = session.get(model, identity)
+            if target is None:
+                return False
+            session.delete(target)
+            session.flush()
             return True
-        except SQLAlchemyError as e:
-            self.session.rollback()
+
+        try:
+            deleted = self._write(delete)
+            if deleted:
+                self.logger.info(f"Successfully deleted: {record}")
+            return deleted
+        except (SQLAlchemyError, TimeoutError) as e:
             self.logger.error(f"SQLAlchemy Error during deletion: {e}")
             return False
 
@@ -105,8 +246,10 @@ class BaseController:
     
     def close_session(self) -> None:
         """
-        Manually closes the database session. 
+        Manually closes the dedicated database session. 
         Should be called when the controller is no longer needed.
+        A request session is closed by its scope instead.
         """
-        self.session.close()
+        if self._session is not None:
+            self._session.close()
         self.logger.debug("Database session closed.")
\ No newline at end of file
@@ -0,0 +1,172 @@
+"""
+Rate candles controller
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import case, func
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.enums import CandleResolution
+from app.schemas import RateCreate, CandleResponse, CandleListResponse
+from app.controllers.base_controller import BaseController
+from app.database.models import RateCandlesDatabaseModel
+
+def bucket_start(timestamp: datetime, resolution: CandleResolution) -> datetime:
+    """
+    Truncates a timestamp to the start of its candle period.
+
+    Args:
+        timestamp (datetime): Sample timestamp.
+        resolution (CandleResolution): Candle resolution.
+
+    Returns:
+        datetime: Start of the candle period.
+    """
+    if resolution == CandleResolution.MINUTE:
+        return timestamp.replace(second=0, microsecond=0)
+    if resolution == CandleResolution.HOUR:
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+class CandleController(BaseController):
+    """
+    Controller for managing the OHLC rate candles in the database.
+    """
+    def __init__(self) -> None:
+        """
+        Initializes the controller with a dedicated database session and logger.
+        """
+        super().__init__()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def register_samples(self, rates: List[RateCreate], resolutions: Optional[List[CandleResolution]] = None) -> int:
+        """
+        Folds rate samples into their candles with a single upsert per batch.
+        Candles are updated incrementally: high/low/close/average/count are merged in SQL,
+        so no candle ever has to be recomputed from raw samples.
+
+        Args:
+            rates(List[RateCreate]): Samples with a trade type and a timestamp.
+            resolutions(Optional[List[CandleResolution]]): Resolutions to update. Defaults to all.
+
+        Returns:
+            int: Number of candle updates applied.
+        """
+        resolutions = resolutions or list(CandleResolution)
+        rows = [
+            {
+                "from_currency": rate.from_currency,
+                "to_currency": rate.to_currency,
+                "trade_type": rate.trade_type,
+                "resolution": resolution,
+                "bucket_start": bucket_start(rate.timestamp, resolution),
+                "open": rate.rate,
+                "high": rate.rate,
+                "low": rate.rate,
+                "close": rate.rate,
+                "average": rate.rate,
+                "count": 1,
+                "last_timestamp": rate.timestamp
+            }
+            for rate in rates if rate.trade_type and rate.timestamp
+            for resolution in resolutions
+        ]
+        if not rows:
+            return 0
+
+        candle = RateCandlesDatabaseModel
+        stmt = insert(candle)
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                candle.from_currency, candle.to_currency, candle.trade_type,
+                candle.resolution, candle.bucket_start
+            ],
+            set_={
+                "high": func.max(candle.high, excluded.high),
+                "low": func.min(candle.low, excluded.low),
+                "close": case(
+                    (excluded.last_timestamp >= candle.last_timestamp, excluded.close),
+                    else_=candle.close
+                ),
+                "average": (candle.average * candle.count + excluded.average) / (candle.count + 1),
+                "count": candle.count + 1,
+                "last_timestamp": func.max(candle.last_timestamp, excluded.last_timestamp)
+            }
+        )
+        try:
+            self._write(lambda session: session.execute(stmt, rows))
+            self.logger.info(f"Successfully applied {len(rows)} candle updates")
+            return len(rows)
+        except (SQLAlchemyError, TimeoutError) as e:
+            self.logger.error(f"SQLAlchemy Error during candle upsert: {e}")
+            return 0
+
+    def get_candles(
+            self,
+            from_currency: str,
+            to_currency: str,
+            resolution: CandleResolution,
+            start: datetime,
+            end: datetime,
+            trade_type: Optional[str] = None
+        ) -> CandleListResponse:
+        """
+        Retrieves the candles of a pair within a time range.
+
+        Args:
+            from_currency(str): Source currency code.
+            to_currency(str): Target currency code.
+            resolution(CandleResolution): Candle resolution.
+            start(datetime): Start of the range, inclusive.
+            end(datetime): End of the range, inclusive.
+            trade_type(Optional[str]): Binance P2P side. Defaults to both.
+
+        Returns:
+            CandleListResponse: Candles within the range, oldest first.
+        """
+        try:
+            query = self.session.query(RateCandlesDatabaseModel).filter(
+                RateCandlesDatabaseModel.from_currency == from_currency,
+                RateCandlesDatabaseModel.to_currency == to_currency,
+                RateCandlesDatabaseModel.resolution == resolution,
+                RateCandlesDatabaseModel.bucket_start >= bucket_start(start, resolution),
+                RateCandlesDatabaseModel.bucket_start <= end
+            )
+            if trade_type:
+                query = query.filter(RateCandlesDatabaseModel.trade_type == trade_type)
+            candles = query.order_by(RateCandlesDatabaseModel.bucket_start).all()
+            self.logger.info(f"Successfully retrieved {len(candles)} {resolution} candles for {from_currency} to {to_currency}")
+            return CandleListResponse(
+                count=len(candles),
+                candles=[CandleResponse.model_validate(candle) for candle in candles]
+            )
+        except Exception as e:
+            self.logger.error(f"Error retrieving candles for {from_currency} to {to_currency}: {e}")
+            return CandleListResponse(count=0, candles=[])
+
+    def prune_candles(self, resolution: CandleResolution, older_than_days: int) -> int:
+        """
+        Deletes the candles of a resolution older than the retention window.
+
+        Args:
+            resolution(CandleResolution): Candle resolution.
+            older_than_days(int): Retention window in days.
+
+        Returns:
+            int: Number of candles deleted.
+        """
+        limit = datetime.now() - timedelta(days=older_than_days)
+        try:
+            deleted = self._write(lambda session: session.query(RateCandlesDatabaseModel).filter(
+                RateCandlesDatabaseModel.resolution == resolution,
+                RateCandlesDatabaseModel.bucket_start < limit
+            ).delete(synchronize_session=False))
+            self.logger.info(f"Pruned {deleted} {resolution} candles older than {limit}")
+            return deleted
+        except (SQLAlchemyError, TimeoutError) as e:
+            self.logger.error(f"SQLAlchemy Error pruning candles: {e}")
+            return 0
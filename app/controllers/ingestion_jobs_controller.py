@@ -0,0 +1,146 @@
+"""
+Ingestion jobs controller
+"""
+import logging
+from typing import List, Optional
+
+from sqlalchemy import func, select
+
+from app.schemas import IngestionJobCreate, IngestionJobUpdate, IngestionJobResponse, IngestionJobListResponse
+from app.controllers.base_controller import BaseController
+from app.database.models import IngestionJobsDatabaseModel
+
+def _join(values: Optional[List[str]]) -> Optional[str]:
+    """Stores a list as a comma separated string, None if empty."""
+    return ",".join(str(value) for value in values) if values else None
+
+class IngestionJobController(BaseController):
+    """
+    Controller for managing the Binance ingestion job registry in the database.
+    """
+    def __init__(self) -> None:
+        """
+        Initializes the controller with a dedicated database session and logger.
+        """
+        super().__init__()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _to_record_values(self, job: IngestionJobCreate | IngestionJobUpdate, exclude_unset: bool = False) -> dict:
+        """
+        Converts a job schema into column values, joining the list fields.
+
+        Args:
+            job(IngestionJobCreate | IngestionJobUpdate): Job data.
+            exclude_unset(bool): Skip the fields that were not sent.
+
+        Returns:
+            dict: Column values.
+        """
+        values = job.model_dump(exclude_unset=exclude_unset)
+        for key in ("trade_types", "pay_methods"):
+            if key in values:
+                values[key] = _join(values[key])
+        return values
+
+    def register_job(self, job: IngestionJobCreate) -> Optional[IngestionJobResponse]:
+        """
+        Creates a new ingestion job in the database.
+
+        Args:
+            job(IngestionJobCreate): Job data to be created.
+
+        Returns:
+            Optional[IngestionJobResponse]: Job created.
+        """
+        try:
+            new_job = IngestionJobsDatabaseModel(**self._to_record_values(job))
+            self._commit_or_rollback(new_job)
+            self.session.refresh(new_job)
+            return IngestionJobResponse.model_validate(new_job)
+        except Exception as e:
+            self.logger.error(f"Error creating ingestion job: {e}")
+            return None
+
+    def register_jobs_if_empty(self, jobs: List[IngestionJobCreate]) -> int:
+        """
+        Seeds the registry in a single transaction, only if it holds no job yet.
+
+        Args:
+            jobs(List[IngestionJobCreate]): Jobs to be created.
+
+        Returns:
+            int: Number of jobs created.
+        """
+        try:
+            if self.session.scalar(select(func.count()).select_from(IngestionJobsDatabaseModel)):
+                return 0
+            records = [IngestionJobsDatabaseModel(**self._to_record_values(job)) for job in jobs]
+            return len(records) if self._commit_all_or_rollback(records) else 0
+        except Exception as e:
+            self.logger.error(f"Error seeding ingestion jobs: {e}")
+            return 0
+
+    def get_jobs(self, enabled_only: bool = False) -> IngestionJobListResponse:
+        """
+        Retrieves the ingestion jobs.
+
+        Args:
+            enabled_only(bool): Only the jobs that are scheduled.
+
+        Returns:
+            IngestionJobListResponse: Jobs ordered by id.
+        """
+        try:
+            query = select(IngestionJobsDatabaseModel).order_by(IngestionJobsDatabaseModel.id)
+            if enabled_only:
+                query = query.where(IngestionJobsDatabaseModel.enabled.is_(True))
+            jobs = self.session.scalars(query).all()
+            return IngestionJobListResponse(
+                count=len(jobs),
+                jobs=[IngestionJobResponse.model_validate(job) for job in jobs]
+            )
+        except Exception as e:
+            self.logger.error(f"Error retrieving ingestion jobs: {e}")
+            return IngestionJobListResponse(count=0, jobs=[])
+
+    def update_job(self, job_id: int, job: IngestionJobUpdate) -> Optional[IngestionJobResponse]:
+        """
+        Updates an existing ingestion job in the database.
+
+        Args:
+            job_id(int): ID of the job to be updated.
+            job(IngestionJobUpdate): Updated job data.
+
+        Returns:
+            Optional[IngestionJobResponse]: Updated job.
+        """
+        try:
+            record = self._get_item_by_id(IngestionJobsDatabaseModel, job_id)
+            if record:
+                for key, value in self._to_record_values(job, exclude_unset=True).items():
+                    setattr(record, key, value)
+                self._update_or_rollback(record)
+                self.session.refresh(record)
+                return IngestionJobResponse.model_validate(record)
+        except Exception as e:
+            self.logger.error(f"Error updating ingestion job: {e}")
+            return None
+
+    def delete_job(self, job_id: int) -> bool:
+        """
+        Deletes an ingestion job from the database.
+
+        Args:
+            job_id(int): ID of the job to be deleted.
+
+        Returns:
+            bool: True if the deletion was successful, False otherwise.
+        """
+        try:
+            record = self._get_item_by_id(IngestionJobsDatabaseModel, job_id)
+            if record:
+                return self._delete_or_rollback(record)
+            return False
+        except Exception as e:
+            self.logger.error(f"Error deleting ingestion job: {e}")
+            return False
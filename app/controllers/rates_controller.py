@@ -3,11 +3,41 @@ Rates exchange controller
 """
 import logging
 from datetime import date, datetime
-from typing import Optional
+from typing import AsyncIterator, List, Optional, Sequence
 
-from app.schemas import RateCreate, RateResponse, RateUpdate, RateListResponse
+from pydantic import TypeAdapter
+from sqlalchemy import Row, Select, String, func, select, tuple_, type_coerce
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.schemas import RateCreate, RateResponse, RateUpdate, RateListResponse, PageCursor
 from app.controllers.base_controller import BaseController
-from app.database.models import RatesDatabaseModel
+from app.database.db_config import AsyncSessionLocal
+from app.database.models import RatesDatabaseModel, rates_natural_key
+
+# Rows per INSERT, keeps the statement under the SQLite bound parameter limit
+UPSERT_CHUNK_SIZE = 500
+
+# Validates a whole list of rows in one call instead of one model_validate() per entity
+RATE_LIST_ADAPTER = TypeAdapter(List[RateResponse])
+
+def rate_columns() -> tuple:
+    """
+    Columns of a RateResponse, selected instead of the entity to skip the ORM hydration.
+    The timestamp is read as stored and parsed by RATE_LIST_ADAPTER, much faster than the
+    DateTime result processor of SQLAlchemy.
+    """
+    return tuple(
+        type_coerce(column, String).label(column.key) if column.key == "timestamp" else column
+        for column in RatesDatabaseModel.__table__.c
+    )
+
+def rate_responses(rows: Sequence[Row]) -> List[RateResponse]:
+    """
+    Builds the responses of rows selected with rate_columns().
+    """
+    keys = RatesDatabaseModel.__table__.c.keys()
+    return RATE_LIST_ADAPTER.validate_python([dict(zip(keys, row)) for row in rows])
 
 class RateController(BaseController):
     """
@@ -20,26 +50,82 @@ class RateController(BaseController):
         super().__init__()
         self.logger = logging.getLogger(self.__class__.__name__)
     
+    def _upsert_rates(self, rates: List[RateCreate]) -> List[RateResponse]:
+        """
+        Inserts rates with INSERT ... ON CONFLICT on their natural key (pair, side, pay method, timestamp).
+        A rate that already exists gets its value replaced, so a retried write never duplicates rows.
+
+        Args:
+            rates(List[RateCreate]): Rates data, with a timestamp.
+
+        Returns:
+            List[RateResponse]: Rate records created or updated, one per natural key.
+
+        Raises:
+            SQLAlchemyError: If the transaction failed, after rolling it back.
+            TimeoutError: If the writer did not commit the rates in time.
+        """
+        rows = {}
+        for rate in rates:
+            row = rate.model_dump()
+            rows[(row["from_currency"], row["to_currency"], row["trade_type"], row["pay_method"], row["timestamp"])] = row
+        rows = list(rows.values())
+
+        def upsert(session: Session) -> List[RateResponse]:
+            records = []
+            for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+                stmt = insert(RatesDatabaseModel).values(rows[start:start + UPSERT_CHUNK_SIZE])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=rates_natural_key(),
+                    set_={"rate": stmt.excluded.rate}
+                ).returning(RatesDatabaseModel)
+                records.extend(
+                    session.scalars(stmt, execution_options={"populate_existing": True}).all()
+                )
+            return [RateResponse.model_validate(record) for record in records]
+
+        return self._write(upsert)
+
     def register_rate(self, rate: RateCreate) -> Optional[RateResponse]:
         """
-        Creates a new rate record in the database.
+        Creates a rate record in the database, or updates the value of the existing
+        rate with the same pair, side, pay method and timestamp.
         
         Args:
             rate(RateCreate): Rate data to be created.
         
         Returns:
-            Optional[RateResponse]: Rate record created.
+            Optional[RateResponse]: Rate record created or updated.
         """
         try:
-            new_rate = RatesDatabaseModel(**rate.model_dump())
-            self._commit_or_rollback(new_rate)
-            self.logger.info(f"Successfully created new rate record: {new_rate}")
-            self.session.refresh(new_rate)
-            return RateResponse.model_validate(new_rate)
+            new_rate = self._upsert_rates([rate])[0]
+            self.logger.info(f"Successfully upserted rate record: {new_rate}")
+            return new_rate
         except Exception as e:
             self.logger.error(f"Error creating new rate record: {e}")
             return None
     
+    def register_rates(self, rates: List[RateCreate]) -> List[RateResponse]:
+        """
+        Creates or updates several rate records in a single transaction.
+        Safe to retry: rates are upserted on their natural key.
+
+        Args:
+            rates(List[RateCreate]): Rates data to be created.
+
+        Returns:
+            List[RateResponse]: Rate records created or updated, empty if the transaction failed.
+        """
+        if not rates:
+            return []
+        try:
+            new_rates = self._upsert_rates(rates)
+            self.logger.info(f"Successfully upserted {len(new_rates)} rate records")
+            return new_rates
+        except Exception as e:
+            self.logger.error(f"Error creating rate records: {e}")
+            return []
+
     def get_rate_by_id(self, rate_id: int) -> Optional[RateResponse]:
         """
         Retrieves a rate record by its ID from the database.
@@ -61,6 +147,22 @@ class RateController(BaseController):
         except Exception as e:
             self.logger.error(f"Error retrieving rate record: {e}")
             return None
+
+    async def get_rate_by_id_async(self, rate_id: int) -> Optional[RateResponse]:
+        """
+        Async version of get_rate_by_id().
+        """
+        try:
+            async with self._async_session() as session:
+                rate = await session.get(RatesDatabaseModel, rate_id)
+                if rate:
+                    self.logger.info(f"Successfully retrieved rate record: {rate}")
+                    return RateResponse.model_validate(rate)
+                self.logger.warning(f"Rate record with ID {rate_id} not found.")
+                return None
+        except Exception as e:
+            self.logger.error(f"Error retrieving rate record: {e}")
+            return None
     
     def get_limit_days_rates_by_pair_currency(self, from_currency: str, to_currency: str, limit_days: int) -> Optional[RateListResponse]:
         """
@@ -90,6 +192,85 @@ class RateController(BaseController):
             self.logger.error(f"Error retrieving rates for {from_currency} to {to_currency}: {e}")
             return None
 
+    @staticmethod
+    def _latest_sampled_rates_query(include_pay_methods: bool = False) -> Select:
+        """
+        Query of the most recent rate of every sampled pair, side and pay method.
+        """
+        pay_method = func.coalesce(RatesDatabaseModel.pay_method, "")
+        latest = select(
+            RatesDatabaseModel.from_currency,
+            RatesDatabaseModel.to_currency,
+            RatesDatabaseModel.trade_type,
+            pay_method.label("pay_method"),
+            func.max(RatesDatabaseModel.timestamp).label("timestamp")
+        ).where(
+            RatesDatabaseModel.trade_type.is_not(None)
+        )
+        if not include_pay_methods:
+            latest = latest.where(RatesDatabaseModel.pay_method.is_(None))
+        latest = latest.group_by(
+            RatesDatabaseModel.from_currency,
+            RatesDatabaseModel.to_currency,
+            RatesDatabaseModel.trade_type,
+            pay_method
+        ).subquery()
+        return select(RatesDatabaseModel).join(
+            latest,
+            (RatesDatabaseModel.from_currency == latest.c.from_currency)
+            & (RatesDatabaseModel.to_currency == latest.c.to_currency)
+            & (RatesDatabaseModel.trade_type == latest.c.trade_type)
+            & (pay_method == latest.c.pay_method)
+            & (RatesDatabaseModel.timestamp == latest.c.timestamp)
+        ).order_by(
+            RatesDatabaseModel.from_currency,
+            RatesDatabaseModel.to_currency,
+            RatesDatabaseModel.trade_type,
+            RatesDatabaseModel.pay_method
+        )
+
+    @staticmethod
+    def _time_range_query(start_date: date, end_date: date) -> Select:
+        """
+        Query of the rates between the start of start_date and the end of end_date.
+        """
+        return select(*rate_columns()).where(
+            RatesDatabaseModel.timestamp >= datetime.combine(start_date, datetime.min.time()),
+            RatesDatabaseModel.timestamp <= datetime.combine(end_date, datetime.max.time())
+        )
+
+    def get_latest_sampled_rates(self, include_pay_methods: bool = False) -> List[RateResponse]:
+        """
+        Retrieves the most recent rate of every (from_currency, to_currency, trade_type, pay_method)
+        sampled from Binance, i.e. with a trade type.
+
+        Args:
+            include_pay_methods(bool): Also return the rates sampled on a single pay method.
+
+        Returns:
+            List[RateResponse]: Latest rate of every sampled pair, side and pay method.
+        """
+        try:
+            rates = self.session.scalars(self._latest_sampled_rates_query(include_pay_methods)).all()
+            self.logger.info(f"Successfully retrieved latest sampled rates: {len(rates)} records found.")
+            return [RateResponse.model_validate(rate) for rate in rates]
+        except Exception as e:
+            self.logger.error(f"Error retrieving latest sampled rates: {e}")
+            return []
+
+    async def get_latest_sampled_rates_async(self, include_pay_methods: bool = False) -> List[RateResponse]:
+        """
+        Async version of get_latest_sampled_rates().
+        """
+        try:
+            async with self._async_session() as session:
+                rates = (await session.scalars(self._latest_sampled_rates_query(include_pay_methods))).all()
+                self.logger.info(f"Successfully retrieved latest sampled rates: {len(rates)} records found.")
+                return [RateResponse.model_validate(rate) for rate in rates]
+        except Exception as e:
+            self.logger.error(f"Error retrieving latest sampled rates: {e}")
+            return []
+
     def get_rates_by_time_range(self, start_date: date, end_date: date) -> RateListResponse:
         """
         Retrieves a list of rates within a specified time range from the database.
@@ -102,23 +283,76 @@ class RateController(BaseController):
             RateListResponse: List of rates within the specified time range.
         """
         try:
-            start_date = datetime.combine(start_date, datetime.min.time())
-            end_date = datetime.combine(end_date, datetime.max.time())
-            rates = self.session.query(RatesDatabaseModel).filter(
-                RatesDatabaseModel.timestamp >= start_date,
-                RatesDatabaseModel.timestamp <= end_date
-            ).all()
+            rates = rate_responses(
+                self.session.execute(self._time_range_query(start_date, end_date)).all()
+            )
             if rates:
-                list_response = RateListResponse(
-                    count=len(rates), 
-                    rates=[RateResponse.model_validate(rate) for rate in rates]
-                    )
+                list_response = RateListResponse(count=len(rates), rates=rates)
                 self.logger.info(f"Successfully retrieved rates within time range: {list_response.count} records found.")
                 return list_response
         except Exception as e:
             self.logger.error(f"Error retrieving rates within time range: {e}")
             return RateListResponse(count=0, rates=[])
 
+    @staticmethod
+    def _after_id_query(rate_id: int, since: datetime) -> Select:
+        """
+        Query of the rates with an id above rate_id and a timestamp from since on.
+        """
+        return select(*rate_columns()).where(
+            RatesDatabaseModel.id > rate_id,
+            RatesDatabaseModel.timestamp >= since
+        ).order_by(RatesDatabaseModel.id)
+
+    def get_rates_after_id(self, rate_id: int, since: datetime) -> Optional[List[RateResponse]]:
+        """
+        Retrieves the rates written after a given one, a primary key seek.
+
+        Args:
+            rate_id(int): Id of the last rate already read, 0 for every rate.
+            since(datetime): Oldest timestamp returned.
+
+        Returns:
+            Optional[List[RateResponse]]: Rates by id, None if the query failed.
+        """
+        try:
+            rates = rate_responses(self.session.execute(self._after_id_query(rate_id, since)).all())
+            self.logger.debug(f"Retrieved {len(rates)} rates after id {rate_id}")
+            return rates
+        except Exception as e:
+            self.logger.error(f"Error retrieving rates after id {rate_id}: {e}")
+            return None
+
+    async def get_rates_after_id_async(self, rate_id: int, since: datetime) -> Optional[List[RateResponse]]:
+        """
+        Async version of get_rates_after_id().
+        """
+        try:
+            async with self._async_session() as session:
+                rates = rate_responses((await session.execute(self._after_id_query(rate_id, since))).all())
+                self.logger.debug(f"Retrieved {len(rates)} rates after id {rate_id}")
+                return rates
+        except Exception as e:
+            self.logger.error(f"Error retrieving rates after id {rate_id}: {e}")
+            return None
+
+    async def get_rates_by_time_range_async(self, start_date: date, end_date: date) -> RateListResponse:
+        """
+        Async version of get_rates_by_time_range().
+        """
+        try:
+            async with self._async_session() as session:
+                rates = rate_responses(
+                    (await session.execute(self._time_range_query(start_date, end_date))).all()
+                )
+                if rates:
+                    list_response = RateListResponse(count=len(rates), rates=rates)
+                    self.logger.info(f"Successfully retrieved rates within time range: {list_response.count} records found.")
+                    return list_response
+        except Exception as e:
+            self.logger.error(f"Error retrieving rates within time range: {e}")
+            return RateListResponse(count=0, rates=[])
+
     def get_all_rates(self) -> Optional[RateListResponse]:
         """
         Retrieves a list of all rates from the database.
@@ -127,18 +361,85 @@ class RateController(BaseController):
             RateListResponse: List of all rates.
         """
         try:
-            rates = self.session.query(RatesDatabaseModel).all()
+            rates = rate_responses(
+                self.session.execute(select(*rate_columns())).all()
+            )
             if rates:
-                list_response = RateListResponse(
-                    count=len(rates), 
-                    rates=[RateResponse.model_validate(rate) for rate in rates]
-                    )
+                list_response = RateListResponse(count=len(rates), rates=rates)
                 self.logger.info(f"Successfully retrieved all rates: {list_response.count} records found.")
                 return list_response
         except Exception as e:
             self.logger.error(f"Error retrieving all rates: {e}")
             return None
 
+    @staticmethod
+    def _page_query(limit: int, after: Optional[PageCursor] = None) -> Select:
+        """
+        Query of a keyset page of rates, newest first, ordered by (timestamp, id).
+        One extra row tells whether there is a next page.
+        """
+        query = select(*rate_columns())
+        if after is not None:
+            query = query.where(
+                tuple_(RatesDatabaseModel.timestamp, RatesDatabaseModel.id) < (after.sort_key, after.id)
+            )
+        return query.order_by(
+            RatesDatabaseModel.timestamp.desc(), RatesDatabaseModel.id.desc()
+        ).limit(limit + 1)
+
+    @staticmethod
+    def _page_response(rates: List[RateResponse], limit: int) -> RateListResponse:
+        """
+        Builds a page from the rows of _page_query().
+        """
+        next_cursor = None
+        if len(rates) > limit:
+            rates = rates[:limit]
+            next_cursor = PageCursor(sort_key=rates[-1].timestamp, id=rates[-1].id).encode()
+        return RateListResponse(count=len(rates), rates=rates, next_cursor=next_cursor)
+
+    async def get_rates_page_async(self, limit: int, after: Optional[PageCursor] = None) -> RateListResponse:
+        """
+        Retrieves a page of rates, newest first. The cursor seeks the timestamp index,
+        so the cost of a page does not grow with the table.
+
+        Args:
+            limit(int): Maximum number of rates in the page.
+            after(Optional[PageCursor]): Cursor of the previous page, None for the first one.
+
+        Returns:
+            RateListResponse: Page of rates, with the cursor of the next page if any.
+        """
+        try:
+            async with self._async_session() as session:
+                rates = rate_responses((await session.execute(self._page_query(limit, after))).all())
+                self.logger.info(f"Successfully retrieved a page of {min(len(rates), limit)} rates")
+                return self._page_response(rates, limit)
+        except Exception as e:
+            self.logger.error(f"Error retrieving a page of rates: {e}")
+            return RateListResponse(count=0, rates=[])
+
+    async def stream_rates_async(self, batch_size: int) -> AsyncIterator[List[RateResponse]]:
+        """
+        Streams every rate, oldest first, from a server-side cursor. Only one batch is held in memory.
+        The stream has its own session, it outlives the request session of the route that returns it.
+
+        Args:
+            batch_size(int): Rows fetched from the cursor per batch.
+
+        Yields:
+            List[RateResponse]: Next batch of rates.
+        """
+        query = select(*rate_columns()).order_by(RatesDatabaseModel.id).execution_options(yield_per=batch_size)
+        try:
+            async with AsyncSessionLocal() as session:
+                result = await session.stream(query)
+                async for rows in result.partitions():
+                    yield rate_responses(rows)
+        except Exception as e:
+            self.logger.error(f"Error streaming rates: {e}")
+            raise
+
     def update_rate_record(self, rate_id: int, rate: RateUpdate) -> Optional[RateResponse]:
         """
         Updates an existing rate record in the database.
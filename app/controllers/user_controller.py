@@ -3,10 +3,13 @@ User controller
 """
 import logging
 from datetime import date, datetime
-from typing import Optional
+from typing import AsyncIterator, List, Optional
 
-from app.schemas import UserCreate, UserResponse, UserUpdate, UserListResponse
+from sqlalchemy import Select, select, tuple_
+
+from app.schemas import UserCreate, UserResponse, UserUpdate, UserListResponse, PageCursor
 from app.controllers.base_controller import BaseController
+from app.database.db_config import AsyncSessionLocal
 from app.database.models import UsersDatabaseModel
 from app.enums import UserRole
 
@@ -63,6 +66,22 @@ class UserController(BaseController):
         except Exception as e:
             self.logger.error(f"Error retrieving user record: {e}")
             return None
+
+    async def get_user_by_id_async(self, user_id: int) -> Optional[UserResponse]:
+        """
+        Async version of get_user_by_id().
+        """
+        try:
+            async with self._async_session() as session:
+                user = await session.get(UsersDatabaseModel, user_id)
+                if user:
+                    self.logger.info(f"Successfully retrieved user record: {user}")
+                    return UserResponse.model_validate(user)
+                self.logger.warning(f"User record with ID {user_id} not found.")
+                return None
+        except Exception as e:
+            self.logger.error(f"Error retrieving user record: {e}")
+            return None
     
     def get_user_by_email(self, email: str) -> Optional[UserResponse]:
         """
@@ -75,7 +94,9 @@ class UserController(BaseController):
             Optional[UserResponse]: User record retrieved.
         """
         try:
-            user = self.session.query(UsersDatabaseModel).filter(UsersDatabaseModel.email == email).one_or_none()
+            user = self.session.scalars(
+                select(UsersDatabaseModel).where(UsersDatabaseModel.email == email)
+            ).one_or_none()
             if user:
                 self.logger.info(f"Successfully retrieved user record by email: {user}")
                 return UserResponse.model_validate(user)
@@ -86,6 +107,24 @@ class UserController(BaseController):
             self.logger.error(f"Error retrieving user record by email: {e}")
             return None
 
+    async def get_user_by_email_async(self, email: str) -> Optional[UserResponse]:
+        """
+        Async version of get_user_by_email().
+        """
+        try:
+            async with self._async_session() as session:
+                user = (await session.scalars(
+                    select(UsersDatabaseModel).where(UsersDatabaseModel.email == email)
+                )).one_or_none()
+                if user:
+                    self.logger.info(f"Successfully retrieved user record by email: {user}")
+                    return UserResponse.model_validate(user)
+                self.logger.warning(f"User record with email {email} not found.")
+                return None
+        except Exception as e:
+            self.logger.error(f"Error retrieving user record by email: {e}")
+            return None
+
     def get_user_by_role(self, user_role: UserRole) -> UserListResponse:
         """
         Retrieves a list of users with a specific role from the database.
@@ -109,6 +148,16 @@ class UserController(BaseController):
             self.logger.error(f"Error retrieving users with role {user_role}: {e}")
             return UserListResponse(count=0, users=[])
 
+    @staticmethod
+    def _registered_in_time_range_query(start_date: date, end_date: date) -> Select:
+        """
+        Query of the users registered between the start of start_date and the end of end_date.
+        """
+        return select(UsersDatabaseModel).where(
+            UsersDatabaseModel.created_at >= datetime.combine(start_date, datetime.min.time()),
+            UsersDatabaseModel.created_at <= datetime.combine(end_date, datetime.max.time())
+        )
+
     def get_users_register_by_time_range(self, start_date: date, end_date: date) -> UserListResponse:
         """
         Retrieves a list of users registered within a specified time range from the database.
@@ -121,12 +170,7 @@ class UserController(BaseController):
             UserListResponse: List of users registered within the specified time range.
         """
         try:
-            start_date = datetime.combine(start_date, datetime.min.time())
-            end_date = datetime.combine(end_date, datetime.max.time())
-            users = self.session.query(UsersDatabaseModel).filter(
-                UsersDatabaseModel.created_at >= start_date,
-                UsersDatabaseModel.created_at <= end_date
-            ).all()
+            users = self.session.scalars(self._registered_in_time_range_query(start_date, end_date)).all()
             if users:
                 list_response = UserListResponse(
                     count=len(users), 
@@ -138,6 +182,24 @@ class UserController(BaseController):
             self.logger.error(f"Error retrieving users within time range: {e}")
             return UserListResponse(count=0, users=[])
 
+    async def get_users_register_by_time_range_async(self, start_date: date, end_date: date) -> UserListResponse:
+        """
+        Async version of get_users_register_by_time_range().
+        """
+        try:
+            async with self._async_session() as session:
+                users = (await session.scalars(self._registered_in_time_range_query(start_date, end_date))).all()
+                if users:
+                    list_response = UserListResponse(
+                        count=len(users),
+                        users=[UserResponse.model_validate(user) for user in users]
+                    )
+                    self.logger.info(f"Successfully retrieved users within time range: {list_response.count} users found.")
+                    return list_response
+        except Exception as e:
+            self.logger.error(f"Error retrieving users within time range: {e}")
+            return UserListResponse(count=0, users=[])
+
     def get_all_users(self) -> UserListResponse:
         """
         Retrieves a list of all users from the database.
@@ -146,7 +208,7 @@ class UserController(BaseController):
             UserListResponse: List of all users.
         """
         try:
-            users = self.session.query(UsersDatabaseModel).all()
+            users = self.session.scalars(select(UsersDatabaseModel)).all()
             if users:
                 list_response = UserListResponse(
                     count=len(users),
@@ -157,6 +219,80 @@ class UserController(BaseController):
         except Exception as e:
             self.logger.error(f"Error retrieving all users: {e}")
             return UserListResponse(count=0, users=[])
+
+    async def get_all_users_async(self) -> UserListResponse:
+        """
+        Async version of get_all_users().
+        """
+        try:
+            async with self._async_session() as session:
+                users = (await session.scalars(select(UsersDatabaseModel))).all()
+                if users:
+                    list_response = UserListResponse(
+                        count=len(users),
+                        users=[UserResponse.model_validate(user) for user in users]
+                    )
+                    self.logger.info(f"Successfully retrieved all users: {list_response.count} users found.")
+                    return list_response
+        except Exception as e:
+            self.logger.error(f"Error retrieving all users: {e}")
+            return UserListResponse(count=0, users=[])
+
+    async def stream_users_async(self, batch_size: int) -> AsyncIterator[List[UserResponse]]:
+        """
+        Streams every user, in id order, from a server-side cursor. Only one batch is held in memory.
+        The stream has its own session, it outlives the request session of the route that returns it.
+
+        Args:
+            batch_size(int): Rows fetched from the cursor per batch.
+
+        Yields:
+            List[UserResponse]: Next batch of users.
+        """
+        query = select(UsersDatabaseModel).order_by(UsersDatabaseModel.id).execution_options(yield_per=batch_size)
+        try:
+            async with AsyncSessionLocal() as session:
+                result = await session.stream_scalars(query)
+                async for users in result.partitions():
+                    yield [UserResponse.model_validate(user) for user in users]
+                    session.expunge_all()
+        except Exception as e:
+            self.logger.error(f"Error streaming users: {e}")
+            raise
+
+    def get_users_page(self, limit: int, after: Optional[PageCursor] = None) -> UserListResponse:
+        """
+        Retrieves a page of users in registration order, keyed on (created_at, id).
+
+        Args:
+            limit(int): Maximum number of users in the page.
+            after(Optional[PageCursor]): Cursor of the previous page, None for the first one.
+
+        Returns:
+            UserListResponse: Page of users, with the cursor of the next page if any.
+        """
+        try:
+            query = select(UsersDatabaseModel)
+            if after is not None:
+                query = query.where(
+                    tuple_(UsersDatabaseModel.created_at, UsersDatabaseModel.id) > (after.sort_key, after.id)
+                )
+            users = self.session.scalars(
+                query.order_by(UsersDatabaseModel.created_at, UsersDatabaseModel.id).limit(limit + 1)
+            ).all()
+            next_cursor = None
+            if len(users) > limit:
+                users = users[:limit]
+                next_cursor = PageCursor(sort_key=users[-1].created_at, id=users[-1].id).encode()
+            self.logger.info(f"Successfully retrieved a page of {len(users)} users")
+            return UserListResponse(
+                count=len(users),
+                users=[UserResponse.model_validate(user) for user in users],
+                next_cursor=next_cursor
+            )
+        except Exception as e:
+            self.logger.error(f"Error retrieving a page of users: {e}")
+            return UserListResponse(count=0, users=[])
     
     def update_user(self, user_id: int, user: UserUpdate) -> Optional[UserResponse]:
         """
@@ -1,2 +1,6 @@
 from app.database.db_base import Base
-from app.database.db_config import SessionLocal, engine, init_db
\ No newline at end of file
+from app.database.db_config import (
+    SessionLocal, engine, init_db, get_scoped_session, session_scope,
+    AsyncSessionLocal, async_engine, get_scoped_async_session, async_session_scope
+)
+from app.database.db_writer import DatabaseWriter, get_db_writer
\ No newline at end of file
@@ -1,16 +1,161 @@
 """
 Database initialization module
 """
+import logging
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from typing import AsyncIterator, Dict, Iterator, Optional, Tuple
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.config import Config
 from app.database.db_base import Base
+from app.database.migrations import run_migrations, current_version
 
-engine = create_engine(Config.DATABASE_URL, connect_args=Config.DATABASE_CONNECT_ARGS)
+logger = logging.getLogger("DatabaseConfig")
+
+def sqlite_pragmas() -> Dict[str, object]:
+    """
+    SQLite profile of the configuration.
+
+    - WAL lets readers run while the ingestion commits, instead of blocking on the rollback journal.
+    - synchronous=NORMAL is durable in WAL mode except for the last commits on power loss.
+    - busy_timeout makes writers wait for the lock instead of failing with "database is locked".
+
+    Returns:
+        Dict[str, object]: Pragmas applied to every new connection, in order.
+    """
+    return {
+        "journal_mode": Config.SQLITE_JOURNAL_MODE,
+        "synchronous": Config.SQLITE_SYNCHRONOUS,
+        "busy_timeout": Config.SQLITE_BUSY_TIMEOUT_MS,
+        "cache_size": Config.SQLITE_CACHE_SIZE,
+        "mmap_size": Config.SQLITE_MMAP_SIZE,
+        "temp_store": Config.SQLITE_TEMP_STORE,
+    }
+
+def create_sqlite_engine(url: str, pragmas: Optional[Dict[str, object]] = None) -> Engine:
+    """
+    Create an engine with the SQLite profile applied on connect and explicit pool settings.
+
+    Args:
+        url (str): Database URL.
+        pragmas (Optional[Dict[str, object]]): Pragmas to apply. Defaults to sqlite_pragmas().
+
+    Returns:
+        Engine: Configured engine.
+    """
+    in_memory, pool_args = _engine_options(url)
+    new_engine = create_engine(url, connect_args=Config.DATABASE_CONNECT_ARGS, **pool_args)
+    _apply_pragmas_on_connect(new_engine, sqlite_pragmas() if pragmas is None else pragmas, in_memory)
+    return new_engine
+
+def create_async_sqlite_engine(url: str, pragmas: Optional[Dict[str, object]] = None) -> AsyncEngine:
+    """
+    Create an aiosqlite engine with the same SQLite profile and pool settings as create_sqlite_engine().
+
+    Args:
+        url (str): Database URL, with the sqlite+aiosqlite driver.
+        pragmas (Optional[Dict[str, object]]): Pragmas to apply. Defaults to sqlite_pragmas().
+
+    Returns:
+        AsyncEngine: Configured async engine.
+    """
+    in_memory, pool_args = _engine_options(url)
+    new_engine = create_async_engine(url, connect_args=Config.DATABASE_CONNECT_ARGS, **pool_args)
+    _apply_pragmas_on_connect(new_engine.sync_engine, sqlite_pragmas() if pragmas is None else pragmas, in_memory)
+    return new_engine
+
+def _engine_options(url: str) -> Tuple[bool, Dict[str, object]]:
+    """
+    Whether the URL is an in-memory database, and the pool arguments for it.
+    In-memory databases keep the default pool of their dialect.
+    """
+    database = make_url(url).database
+    in_memory = not database or database == ":memory:"
+    pool_args = {} if in_memory else {
+        "pool_size": Config.DATABASE_POOL_SIZE,
+        "max_overflow": Config.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": Config.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": Config.DATABASE_POOL_RECYCLE,
+    }
+    return in_memory, pool_args
+
+def _apply_pragmas_on_connect(sync_engine: Engine, pragmas: Dict[str, object], in_memory: bool) -> None:
+    """
+    Run the pragmas on every new DBAPI connection of the engine.
+    """
+    @event.listens_for(sync_engine, "connect")
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                if in_memory and name in ("journal_mode", "mmap_size"):
+                    continue
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+engine = create_sqlite_engine(Config.DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Read path of the async routes, they await SQLite without holding a thread of the pool
+async_engine = create_async_sqlite_engine(Config.ASYNC_DATABASE_URL)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+# Session of the request being served, set by the get_db() API dependency
+_scoped_session: ContextVar[Optional[Session]] = ContextVar("scoped_session", default=None)
+
+def get_scoped_session() -> Optional[Session]:
+    """
+    Session opened by session_scope() for the current request or task, if any.
+    """
+    return _scoped_session.get()
+
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """
+    Open one session shared by every controller used within the block, closed on exit.
+
+    Yields:
+        Session: The scoped session.
+    """
+    session = SessionLocal()
+    token = _scoped_session.set(session)
+    try:
+        yield session
+    finally:
+        _scoped_session.reset(token)
+        session.close()
+
+# Async session of the request being served, set by the get_async_db() API dependency
+_scoped_async_session: ContextVar[Optional[AsyncSession]] = ContextVar("scoped_async_session", default=None)
+
+def get_scoped_async_session() -> Optional[AsyncSession]:
+    """
+    Async session opened by async_session_scope() for the current request or task, if any.
+    """
+    return _scoped_async_session.get()
+
+@asynccontextmanager
+async def async_session_scope() -> AsyncIterator[AsyncSession]:
+    """
+    Open one async session shared by every controller used within the block, closed on exit.
+
+    Yields:
+        AsyncSession: The scoped async session.
+    """
+    session = AsyncSessionLocal()
+    token = _scoped_async_session.set(session)
+    try:
+        yield session
+    finally:
+        _scoped_async_session.reset(token)
+        await session.close()
+
 def init_db(instance_path: Path = Config.INSTANCE_PATH) -> None:
     """
     Initialize the database and creates the database directory
@@ -19,4 +164,7 @@ def init_db(instance_path: Path = Config.INSTANCE_PATH) -> None:
         instance_path (Path): The path to the database instance directory
     """
     Path(instance_path).mkdir(parents=True, exist_ok=True)
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+    Base.metadata.create_all(bind=engine)
+    applied = run_migrations(engine)
+    if applied:
+        logger.info(f"Applied {applied} migrations, schema version {current_version(engine)}")
\ No newline at end of file
@@ -0,0 +1,187 @@
+"""
+Single writer thread for the database
+"""
+import queue
+import logging
+import threading
+from time import monotonic
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Tuple
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config import Config
+from app.database.db_config import engine
+
+WriteOperation = Callable[[Session], Any]
+
+class DatabaseWriter:
+    """
+    Runs every write of the process on one thread with its own session.
+
+    SQLite takes one writer at a time, so writers on request and scheduler threads only
+    wait for each other on the database lock. Here they wait on a queue instead: the operations
+    queued while a transaction runs are grouped in the next one, a single commit for all of them.
+    Operations must be replayable, they are run again one by one if their batch fails.
+    """
+    def __init__(
+            self,
+            bind: Engine,
+            max_batch: int = Config.DB_WRITER_MAX_BATCH,
+            linger_seconds: float = Config.DB_WRITER_LINGER_MS / 1000
+        ) -> None:
+        """
+        Args:
+            bind (Engine): Engine the writes go to.
+            max_batch (int): Most operations grouped in one transaction.
+            linger_seconds (float): Time the writer waits for more operations before running a batch.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.bind = bind
+        self.max_batch = max_batch
+        self.linger_seconds = linger_seconds
+        self._session_factory = sessionmaker(bind=bind, autoflush=False, expire_on_commit=False)
+        self._queue: "queue.Queue[Optional[Tuple[WriteOperation, Future]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """
+        Whether the writer thread is alive.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """
+        Start the writer thread, if not running.
+        """
+        with self._lock:
+            if self.running:
+                return
+            self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Run the operations already queued and stop the writer thread.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for the thread.
+        """
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return
+            self._queue.put(None)
+            self._thread = None
+        thread.join(timeout)
+
+    def submit(self, operation: WriteOperation) -> Future:
+        """
+        Queue a write operation.
+
+        Args:
+            operation (WriteOperation): Callable run with the writer session, before its commit.
+
+        Returns:
+            Future: Resolves to the value returned by the operation once committed,
+                or to its exception if it failed.
+        """
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("A write operation can not wait on the writer thread")
+        future: Future = Future()
+        self.start()
+        self._queue.put((operation, future))
+        return future
+
+    def _run(self) -> None:
+        """
+        Writer loop, one transaction per batch.
+        """
+        session = self._session_factory()
+        stopping = False
+        try:
+            while not stopping:
+                item = self._queue.get()
+                if item is None:
+                    break
+                batch = [item]
+                deadline = monotonic() + self.linger_seconds
+                while len(batch) < self.max_batch:
+                    try:
+                        item = self._queue.get(timeout=max(deadline - monotonic(), 0))
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        stopping = True
+                        break
+                    batch.append(item)
+                self._execute(session, batch)
+        finally:
+            session.close()
+
+    def _execute(self, session: Session, batch: List[Tuple[WriteOperation, Future]]) -> None:
+        """
+        Run a batch in one transaction. If it fails, its operations run again one per
+        transaction, so a bad operation only fails its own future.
+
+        Args:
+            session (Session): Writer session.
+            batch (List[Tuple[WriteOperation, Future]]): Operations and their futures.
+        """
+        batch = [(operation, future) for operation, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        try:
+            results = self._transaction(session, [operation for operation, _ in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0][1].set_exception(e)
+                return
+            self.logger.warning(f"Batch of {len(batch)} writes failed, retrying one by one: {e}")
+            for operation, future in batch:
+                try:
+                    future.set_result(self._transaction(session, [operation])[0])
+                except Exception as e:
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+    @staticmethod
+    def _transaction(session: Session, operations: List[WriteOperation]) -> List[Any]:
+        """
+        Run operations and commit them together.
+
+        Args:
+            session (Session): Writer session.
+            operations (List[WriteOperation]): Operations to run.
+
+        Returns:
+            List[Any]: Values returned by the operations.
+        """
+        try:
+            results = [operation(session) for operation in operations]
+            session.commit()
+            return results
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.expunge_all()
+
+_writer: Optional[DatabaseWriter] = None
+_writer_lock = threading.Lock()
+
+def get_db_writer() -> DatabaseWriter:
+    """
+    Writer of the application database, shared by every controller of the process.
+    """
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = DatabaseWriter(engine)
+    return _writer
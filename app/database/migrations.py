@@ -0,0 +1,159 @@
+"""
+Versioned schema migrations.
+
+`Base.metadata.create_all` only creates missing tables, it never alters the existing ones.
+Every change to a table that already exists in production databases is a migration:
+a numbered, idempotent step recorded in the `schema_version` table once applied.
+Migrations run in order from `init_db`, inside one transaction each. The transaction takes
+the SQLite write lock before reading `schema_version`, so processes starting together
+(uvicorn workers, westcambios-worker) apply every migration once.
+
+To add one, append a new `Migration` with the next version number. Never edit or
+renumber a migration that has been released.
+"""
+import logging
+from datetime import datetime
+from typing import Callable, List, Set
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger("DatabaseMigrations")
+
+class Migration:
+    """
+    A single schema migration.
+    """
+    def __init__(self, version: int, description: str, upgrade: Callable[[Connection], None]) -> None:
+        """
+        Args:
+            version (int): Sequential version number.
+            description (str): What the migration changes.
+            upgrade (Callable[[Connection], None]): Idempotent upgrade step.
+        """
+        self.version = version
+        self.description = description
+        self.upgrade = upgrade
+
+    def __repr__(self) -> str:
+        return f"<Migration(version={self.version}, description={self.description})>"
+
+def _columns(conn: Connection, table: str) -> Set[str]:
+    """Column names of a table."""
+    return {row[1] for row in conn.execute(text(f"PRAGMA table_info({table})"))}
+
+def _add_column(conn: Connection, table: str, column: str, column_type: str) -> None:
+    """Adds a nullable column if the table does not have it yet."""
+    if column not in _columns(conn, table):
+        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}"))
+        logger.info(f"Added column {table}.{column}")
+
+def _rates_trade_type_and_pay_method(conn: Connection) -> None:
+    _add_column(conn, "rates", "trade_type", "VARCHAR(4)")
+    _add_column(conn, "rates", "pay_method", "VARCHAR")
+
+def _rates_natural_key(conn: Connection) -> None:
+    exists = conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'uq_rates_natural_key'")
+    ).first()
+    if exists:
+        return
+    removed = conn.execute(text(
+        "DELETE FROM rates WHERE id NOT IN ("
+        "SELECT MAX(id) FROM rates GROUP BY from_currency, to_currency, "
+        "COALESCE(trade_type, ''), COALESCE(pay_method, ''), timestamp)"
+    )).rowcount
+    conn.execute(text(
+        "CREATE UNIQUE INDEX uq_rates_natural_key ON rates "
+        "(from_currency, to_currency, COALESCE(trade_type, ''), COALESCE(pay_method, ''), timestamp)"
+    ))
+    logger.info(f"Created index uq_rates_natural_key, removed {removed} duplicated rates")
+
+def _range_indexes(conn: Connection) -> None:
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_rates_timestamp ON rates (timestamp)"))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_rates_pair_timestamp ON rates (from_currency, to_currency, timestamp)"
+    ))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_users_created_at ON users (created_at)"))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_payments_user_date ON payments (id_user, payment_date)"
+    ))
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "Add trade_type and pay_method to rates", _rates_trade_type_and_pay_method),
+    Migration(2, "Unique natural key of rates", _rates_natural_key),
+    Migration(3, "Range indexes on rates, users and payments", _range_indexes),
+]
+
+def _ensure_version_table(conn: Connection) -> None:
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS schema_version ("
+        "version INTEGER PRIMARY KEY, description VARCHAR NOT NULL, applied_at DATETIME NOT NULL)"
+    ))
+
+def _begin_immediate(conn: Connection) -> None:
+    """
+    Takes the write lock now instead of on the first write, the driver only begins
+    a transaction before DML, so DDL and the version check would run unlocked.
+    """
+    conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+def current_version(engine: Engine) -> int:
+    """
+    Version of the database schema.
+
+    Args:
+        engine (Engine): Database engine.
+
+    Returns:
+        int: Highest applied migration, 0 if none.
+    """
+    with engine.begin() as conn:
+        _ensure_version_table(conn)
+        return conn.execute(text("SELECT COALESCE(MAX(version), 0) FROM schema_version")).scalar_one()
+
+def run_migrations(engine: Engine) -> int:
+    """
+    Apply the pending migrations in order, each in its own transaction.
+    A process waiting on the lock finds the migration applied and skips it.
+
+    Args:
+        engine (Engine): Database engine, with the tables already created.
+
+    Returns:
+        int: Number of migrations applied.
+    """
+    applied = 0
+    for migration in sorted(MIGRATIONS, key=lambda m: m.version):
+        with engine.begin() as conn:
+            _begin_immediate(conn)
+            _ensure_version_table(conn)
+            done = conn.execute(
+                text("SELECT 1 FROM schema_version WHERE version = :version"), {"version": migration.version}
+            ).first()
+            if done:
+                continue
+            logger.info(f"Applying migration {migration.version}: {migration.description}")
+            migration.upgrade(conn)
+            conn.execute(
+                text("INSERT INTO schema_version (version, description, applied_at) VALUES (:v, :d, :a)"),
+                {"v": migration.version, "d": migration.description, "a": datetime.now()}
+            )
+            applied += 1
+    return applied
+
+def explain_query_plan(conn: Connection, statement, params: dict = None) -> List[str]:
+    """
+    SQLite query plan of a statement, to check which indexes it uses.
+
+    Args:
+        conn (Connection): Database connection.
+        statement: SQLAlchemy statement or SQL string.
+        params (dict): Bound parameters of a SQL string.
+
+    Returns:
+        List[str]: Plan steps, e.g. "SEARCH rates USING INDEX ix_rates_timestamp (timestamp>? AND timestamp<?)".
+    """
+    if not isinstance(statement, str):
+        statement = str(statement.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    return [row[3] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {statement}"), params or {})]
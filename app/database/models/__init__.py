@@ -1,3 +1,7 @@
-from app.database.models.rates_model import RatesDatabaseModel
+from app.database.models.rates_model import RatesDatabaseModel, rates_natural_key, uq_rates_natural_key
+from app.database.models.rate_candles_model import RateCandlesDatabaseModel
+from app.database.models.ad_snapshots_model import AdSnapshotsDatabaseModel
 from app.database.models.users_model import UsersDatabaseModel
-from app.database.models.payments_model import PaymentsDatabaseModel
\ No newline at end of file
+from app.database.models.payments_model import PaymentsDatabaseModel
+from app.database.models.ingestion_jobs_model import IngestionJobsDatabaseModel
+from app.database.models.leases_model import LeasesDatabaseModel
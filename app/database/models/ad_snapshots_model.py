@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Integer, Float, DateTime, Enum, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database.db_base import Base
+from app.enums import TradeType
+
+class AdSnapshotsDatabaseModel(Base):
+    __tablename__ = 'ad_snapshots'
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    run_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    captured_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    asset: Mapped[str] = mapped_column(String, nullable=False)
+    fiat: Mapped[str] = mapped_column(String, nullable=False)
+    trade_type: Mapped[TradeType] = mapped_column(Enum(TradeType), nullable=False)
+    adv_no: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    price: Mapped[float] = mapped_column(Float, nullable=False)
+    tradable_quantity: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    min_limit: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    max_limit: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    pay_methods: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    advertiser_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+
+    def __repr__(self):
+        return (f"<AdSnapshot(run_id={self.run_id}, asset={self.asset}, fiat={self.fiat}, "
+                f"trade_type={self.trade_type}, price={self.price})>")
+    
+    def __str__(self):
+        return f"{self.asset}/{self.fiat} {self.trade_type}: {self.price} ({self.tradable_quantity})"
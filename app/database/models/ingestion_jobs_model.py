@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Integer, DateTime, Enum, String, Boolean
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database.db_base import Base
+from app.enums import CurrencyEnum
+
+class IngestionJobsDatabaseModel(Base):
+    __tablename__ = 'ingestion_jobs'
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String, unique=True, nullable=False)
+    asset: Mapped[CurrencyEnum] = mapped_column(Enum(CurrencyEnum), nullable=False)
+    fiat: Mapped[CurrencyEnum] = mapped_column(Enum(CurrencyEnum), nullable=False)
+    trade_types: Mapped[str] = mapped_column(String, nullable=False, default="BUY,SELL")
+    pay_methods: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    interval_seconds: Mapped[int] = mapped_column(Integer, nullable=False)
+    pages: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    jitter_seconds: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    enabled: Mapped[bool] = mapped_column(Boolean, default=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+    def __repr__(self):
+        return (f"<IngestionJob(name={self.name}, asset={self.asset}, fiat={self.fiat}, "
+                f"trade_types={self.trade_types}, interval_seconds={self.interval_seconds})>")
+
+    def __str__(self):
+        return f"{self.name}: {self.asset}/{self.fiat} {self.trade_types} every {self.interval_seconds}s"
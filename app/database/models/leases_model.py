@@ -0,0 +1,19 @@
+from datetime import datetime
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database.db_base import Base
+
+class LeasesDatabaseModel(Base):
+    __tablename__ = 'leases'
+
+    name: Mapped[str] = mapped_column(String, primary_key=True)
+    holder: Mapped[str] = mapped_column(String, nullable=False)
+    acquired_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<Lease(name={self.name}, holder={self.holder}, expires_at={self.expires_at})>"
+
+    def __str__(self):
+        return f"{self.name}: {self.holder} until {self.expires_at}"
@@ -1,7 +1,7 @@
 from __future__ import annotations # Permite usar tipos que aún no están definidos
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import Integer, DateTime, Enum, String, ForeignKey, Float
+from sqlalchemy import Integer, DateTime, Enum, String, ForeignKey, Float, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.db_base import Base
@@ -13,6 +13,9 @@ if TYPE_CHECKING:
 
 class PaymentsDatabaseModel(Base):
     __tablename__ = 'payments'
+    __table_args__ = (
+        Index("ix_payments_user_date", "id_user", "payment_date"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     id_user: Mapped[int] = mapped_column(ForeignKey('users.id'), nullable=False)
@@ -0,0 +1,52 @@
+from datetime import datetime
+from sqlalchemy import Integer, Float, DateTime, Enum, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database.db_base import Base
+from app.enums import CurrencyEnum, TradeType, CandleResolution
+
+class RateCandlesDatabaseModel(Base):
+    __tablename__ = 'rate_candles'
+    __table_args__ = (
+        UniqueConstraint(
+            "from_currency", "to_currency", "trade_type", "resolution", "bucket_start",
+            name="uq_rate_candles_bucket"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    from_currency: Mapped[CurrencyEnum] = mapped_column(Enum(CurrencyEnum), nullable=False)
+    to_currency: Mapped[CurrencyEnum] = mapped_column(Enum(CurrencyEnum), nullable=False)
+    trade_type: Mapped[TradeType] = mapped_column(Enum(TradeType), nullable=False)
+    resolution: Mapped[CandleResolution] = mapped_column(Enum(CandleResolution), nullable=False)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    open: Mapped[float] = mapped_column(Float, nullable=False)
+    high: Mapped[float] = mapped_column(Float, nullable=False)
+    low: Mapped[float] = mapped_column(Float, nullable=False)
+    close: Mapped[float] = mapped_column(Float, nullable=False)
+    average: Mapped[float] = mapped_column(Float, nullable=False)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    last_timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return (f"<RateCandle(from_currency={self.from_currency}, to_currency={self.to_currency}, "
+                f"trade_type={self.trade_type}, resolution={self.resolution}, bucket_start={self.bucket_start})>")
+    
+    def __str__(self):
+        return f"{self.from_currency} to {self.to_currency} {self.trade_type} [{self.resolution} {self.bucket_start}]: {self.close}"
+    
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "from_currency": self.from_currency,
+            "to_currency": self.to_currency,
+            "trade_type": self.trade_type,
+            "resolution": self.resolution,
+            "bucket_start": self.bucket_start,
+            "open": self.open,
+            "high": self.high,
+            "low": self.low,
+            "close": self.close,
+            "average": self.average,
+            "count": self.count
+        }
@@ -1,18 +1,24 @@
 from datetime import datetime
-from sqlalchemy import Integer, Float, DateTime, Enum
+from typing import Optional
+from sqlalchemy import Integer, Float, DateTime, Enum, String, Index, func, literal_column
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database.db_base import Base
-from app.enums import CurrencyEnum
+from app.enums import CurrencyEnum, TradeType
 
 class RatesDatabaseModel(Base):
     __tablename__ = 'rates'
+    __table_args__ = (
+        Index("ix_rates_pair_timestamp", "from_currency", "to_currency", "timestamp"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     from_currency: Mapped[CurrencyEnum] = mapped_column(Enum(CurrencyEnum), nullable=False)
     to_currency: Mapped[CurrencyEnum] = mapped_column(Enum(CurrencyEnum), nullable=False)
     rate: Mapped[float] = mapped_column(Float, nullable=False)
-    timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    trade_type: Mapped[Optional[TradeType]] = mapped_column(Enum(TradeType), nullable=True)
+    pay_method: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
     def __repr__(self):
         return f"<Rate(from_currency={self.from_currency}, to_currency={self.to_currency}, rate={self.rate}, timestamp={self.timestamp})>"
@@ -26,5 +32,23 @@ class RatesDatabaseModel(Base):
             "from_currency": self.from_currency,
             "to_currency": self.to_currency,
             "rate": self.rate,
-            "timestamp": self.timestamp
-        }
\ No newline at end of file
+            "timestamp": self.timestamp,
+            "trade_type": self.trade_type,
+            "pay_method": self.pay_method
+        }
+
+def rates_natural_key() -> list:
+    """
+    Natural key of a rate: pair, side, pay method and timestamp.
+    Side and pay method are coalesced so that manual and whole-book rates, stored with NULLs,
+    are unique too. Upserts must use these exact expressions as their conflict target.
+    """
+    return [
+        RatesDatabaseModel.from_currency,
+        RatesDatabaseModel.to_currency,
+        func.coalesce(RatesDatabaseModel.trade_type, literal_column("''")),
+        func.coalesce(RatesDatabaseModel.pay_method, literal_column("''")),
+        RatesDatabaseModel.timestamp
+    ]
+
+uq_rates_natural_key = Index("uq_rates_natural_key", *rates_natural_key(), unique=True)
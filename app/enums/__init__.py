@@ -1,3 +1,8 @@
 from app.enums.currencies_enum import CurrencyEnum
 from app.enums.payments_enum import PaymentStatus
 from app.enums.user_roles_enum import UserRole
+from app.enums.trade_type_enum import TradeType
+from app.enums.candle_resolution_enum import CandleResolution
+from app.enums.circuit_state_enum import CircuitState
+from app.enums.feed_status_enum import FeedStatus
+from app.enums.export_format_enum import ExportFormat
@@ -0,0 +1,16 @@
+from typing import List
+from enum import StrEnum
+
+class CandleResolution(StrEnum):
+    MINUTE = "1m"
+    HOUR = "1h"
+    DAY = "1d"
+
+    def __str__(self) -> str:
+        return self.value
+    
+    def __repr__(self) -> str:
+        return self.value
+    
+    def to_list(self) -> List[str]:
+        return [self.value for self in CandleResolution]
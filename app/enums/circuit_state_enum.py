@@ -0,0 +1,16 @@
+from typing import List
+from enum import StrEnum
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __str__(self) -> str:
+        return self.value
+    
+    def __repr__(self) -> str:
+        return self.value
+    
+    def to_list(self) -> List[str]:
+        return [self.value for self in CircuitState]
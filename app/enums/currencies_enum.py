@@ -6,6 +6,9 @@ class CurrencyEnum(StrEnum):
     BRL = "BRL"
     USD = "USD"
     USDT = "USDT"
+    COP = "COP"
+    PEN = "PEN"
+    ARS = "ARS"
 
     def __str__(self) -> str:
         return self.value
@@ -0,0 +1,15 @@
+from typing import List
+from enum import StrEnum
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    def __str__(self) -> str:
+        return self.value
+    
+    def __repr__(self) -> str:
+        return self.value
+    
+    def to_list(self) -> List[str]:
+        return [self.value for self in ExportFormat]
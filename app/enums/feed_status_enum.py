@@ -0,0 +1,16 @@
+from typing import List
+from enum import StrEnum
+
+class FeedStatus(StrEnum):
+    OK = "ok"
+    DEGRADED = "degraded"
+    UNAVAILABLE = "unavailable"
+
+    def __str__(self) -> str:
+        return self.value
+    
+    def __repr__(self) -> str:
+        return self.value
+    
+    def to_list(self) -> List[str]:
+        return [self.value for self in FeedStatus]
@@ -4,9 +4,10 @@ import os
 
 from app.config import Config
 from app.api.app_factory import create_app
-from app.database.db_config import init_db
+from app.database.db_config import init_db, async_engine, session_scope
+from app.database.db_writer import get_db_writer
 from app.seeds import create_admin, create_rates, create_rates_production
-from app.services import SchedulerService
+from app.services import SchedulerService, LeaderElection, get_rate_service
 
 
 Config.create_dirs()
@@ -32,10 +33,49 @@ if Config.LOG_LEVEL.upper() == "DEBUG":
 @app.on_event("startup")
 def start_scheduler():
     """
-    Start the scheduler.
+    Start the scheduler election. Only the worker holding the lease runs the scheduler,
+    another worker takes over if it dies.
+    Skipped if ingestion is disabled, when it runs in westcambios-worker.
     """
+    if not Config.INGESTION_ENABLED:
+        logging.info("Ingestion disabled in the API process")
+        return
     scheduler = SchedulerService()
-    scheduler.start_scheduler()
+    election = LeaderElection(
+        "scheduler",
+        on_elected=scheduler.start_scheduler,
+        on_demoted=scheduler.pause_scheduler
+    )
+    election.start()
+    app.state.scheduler = scheduler
+    app.state.scheduler_election = election
+
+@app.on_event("startup")
+def load_hot_rates():
+    """
+    Load the rates of the period endpoints in memory, so they never wait on the full read.
+    """
+    if Config.HOT_RATES_ENABLED:
+        with session_scope():
+            get_rate_service().sync_hot_rates()
+
+@app.on_event("shutdown")
+def stop_scheduler():
+    """
+    Stop the scheduler and release its lease, then flush the queued writes.
+    """
+    if hasattr(app.state, "scheduler_election"):
+        app.state.scheduler_election.stop()
+        app.state.scheduler.stop_scheduler()
+    get_db_writer().stop()
+
+
+@app.on_event("shutdown")
+async def dispose_async_engine():
+    """
+    Close the pooled connections of the async read path, and their aiosqlite threads.
+    """
+    await async_engine.dispose()
 
 
 def run_server():
@@ -1,6 +1,15 @@
 from app.schemas.tokens_schemas import Token, TokenData
 from app.schemas.binance_request_schema import BinanceRequest
+from app.schemas.ad_snapshots_schemas import BinanceAd, AdSnapshotCreate
 from app.schemas.binance_response_schemas import BinanceResponse
+from app.schemas.binance_feed_schemas import BinanceFeedResult
+from app.schemas.live_quote_schemas import LiveQuoteResponse
+from app.schemas.pagination_schemas import PageCursor
 from app.schemas.rates_schemas import RateResponse, RateCreate, RateUpdate, RateListResponse
+from app.schemas.cross_rates_schemas import CrossRateResponse, CrossRateListResponse
+from app.schemas.candles_schemas import CandleResponse, CandleListResponse
+from app.schemas.ingestion_jobs_schemas import (
+    IngestionJobCreate, IngestionJobUpdate, IngestionJobResponse, IngestionJobListResponse
+)
 from app.schemas.users_schemas import UserResponse, UserCreate, UserUpdate, UserLogin, UserListResponse
 from app.schemas.payments_schemas import PaymentResponse, PaymentCreate, PaymentUpdate, PaymentListResponse
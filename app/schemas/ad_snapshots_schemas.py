@@ -0,0 +1,62 @@
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict
+
+from app.enums import TradeType
+
+class BinanceAd(BaseModel):
+    """
+    Schema for a single ad of the Binance P2P order book.
+
+    Attributes:
+        adv_no (Optional[str]): Advertisement number.
+        price (float): Ad price.
+        tradable_quantity (Optional[float]): Asset quantity still available in the ad.
+        min_limit (Optional[float]): Minimum order amount, in fiat.
+        max_limit (Optional[float]): Maximum order amount, in fiat.
+        pay_methods (List[str]): Identifiers of the accepted payment methods.
+        advertiser_id (Optional[str]): Binance user number of the advertiser.
+    """
+    adv_no: Optional[str] = None
+    price: float
+    tradable_quantity: Optional[float] = None
+    min_limit: Optional[float] = None
+    max_limit: Optional[float] = None
+    pay_methods: List[str] = []
+    advertiser_id: Optional[str] = None
+
+class AdSnapshotCreate(BaseModel):
+    """
+    Schema for storing an ad captured during an ingestion run.
+
+    Attributes:
+        run_id (str): Identifier shared by every ad of the same ingestion run.
+        captured_at (datetime): Timestamp of the ingestion run.
+        asset (str): Asset (USDT, BTC, etc).
+        fiat (str): Fiat currency.
+        trade_type (TradeType): Trade type.
+        adv_no (Optional[str]): Advertisement number.
+        price (float): Ad price.
+        tradable_quantity (Optional[float]): Asset quantity still available in the ad.
+        min_limit (Optional[float]): Minimum order amount, in fiat.
+        max_limit (Optional[float]): Maximum order amount, in fiat.
+        pay_methods (Optional[str]): Comma separated identifiers of the accepted payment methods.
+        advertiser_id (Optional[str]): Binance user number of the advertiser.
+    """
+    run_id: str
+    captured_at: datetime
+    asset: str
+    fiat: str
+    trade_type: TradeType
+    adv_no: Optional[str] = None
+    price: float
+    tradable_quantity: Optional[float] = None
+    min_limit: Optional[float] = None
+    max_limit: Optional[float] = None
+    pay_methods: Optional[str] = None
+    advertiser_id: Optional[str] = None
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        use_enum_values=True
+    )
@@ -0,0 +1,27 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, ConfigDict
+
+from app.enums import FeedStatus, CircuitState
+from app.schemas.binance_response_schemas import BinanceResponse
+
+class BinanceFeedResult(BaseModel):
+    """
+    Typed result of a Binance P2P read.
+
+    Attributes:
+        status (FeedStatus): OK with a fresh pair, DEGRADED with the last good pair, UNAVAILABLE with no pair.
+        pair (Optional[BinanceResponse]): Fresh pair, or the last good one when degraded.
+        fetched_at (Optional[datetime]): When the pair was fetched from Binance.
+        age_seconds (Optional[float]): Age of the pair.
+        circuit_state (CircuitState): State of the Binance circuit breaker.
+    """
+    status: FeedStatus
+    pair: Optional[BinanceResponse] = None
+    fetched_at: Optional[datetime] = None
+    age_seconds: Optional[float] = None
+    circuit_state: CircuitState
+
+    model_config = ConfigDict(
+        from_attributes=True
+    )
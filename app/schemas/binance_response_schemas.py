@@ -1,5 +1,7 @@
 from typing import List, Optional
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.ad_snapshots_schemas import BinanceAd
 
 class BinanceResponse(BaseModel):
     """
@@ -9,16 +11,36 @@ class BinanceResponse(BaseModel):
         fiat (str): Fiat currency (e.g., VES, PEN).
         asset (str): Asset (USDT, BTC, etc).
         trade_type (str): Trade type (BUY or SELL).
+        pay_method (Optional[str]): Binance pay type the order book was filtered by, None for the whole book.
         prices (Optional[List[float]]): List of prices. Can be empty or None if Binance returns no data.
         average_price (Optional[float]): Average price. Null if no data.
         median_price (Optional[float]): Median price. Null if no data.
+        trimmed_mean_price (Optional[float]): Mean after cutting both tails. Null if no data.
+        weighted_price (Optional[float]): Price weighted by the tradable quantity of the non-outlier ads.
+        p10_price (Optional[float]): 10th percentile price.
+        p25_price (Optional[float]): 25th percentile price.
+        p75_price (Optional[float]): 75th percentile price.
+        p90_price (Optional[float]): 90th percentile price.
+        sample_size (Optional[int]): Number of ads sampled.
+        outliers_removed (Optional[int]): Number of ads outside the IQR fences.
+        ads (List[BinanceAd]): Raw ads of the sample. Kept for persistence, excluded from serialization.
     """
     fiat: str
     asset: str
     trade_type: str
+    pay_method: Optional[str] = None
     prices: Optional[List[float]] = None
     average_price: Optional[float] = None
     median_price: Optional[float] = None
+    trimmed_mean_price: Optional[float] = None
+    weighted_price: Optional[float] = None
+    p10_price: Optional[float] = None
+    p25_price: Optional[float] = None
+    p75_price: Optional[float] = None
+    p90_price: Optional[float] = None
+    sample_size: Optional[int] = None
+    outliers_removed: Optional[int] = None
+    ads: List[BinanceAd] = Field(default_factory=list, exclude=True)
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -30,7 +52,15 @@ class BinanceResponse(BaseModel):
                     "trade_type": "BUY",
                     "prices": [345.50, 346.20, 347.00, 348.10, 349.00],
                     "average_price": 347.16,
-                    "median_price": 347.00
+                    "median_price": 347.00,
+                    "trimmed_mean_price": 347.10,
+                    "weighted_price": 346.90,
+                    "p10_price": 345.78,
+                    "p25_price": 346.20,
+                    "p75_price": 348.10,
+                    "p90_price": 348.64,
+                    "sample_size": 5,
+                    "outliers_removed": 0
                 },
                 {
                     "fiat": "VES",
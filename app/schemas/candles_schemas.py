@@ -0,0 +1,72 @@
+from datetime import datetime
+from typing import List
+from pydantic import BaseModel, ConfigDict
+
+from app.enums import CurrencyEnum, TradeType, CandleResolution
+
+class CandleResponse(BaseModel):
+    """
+    OHLC candle response model.
+
+    Attributes:
+        from_currency: Currency code of the source currency.
+        to_currency: Currency code of the target currency.
+        trade_type: Binance P2P side of the samples.
+        resolution: Candle resolution (1m, 1h, 1d).
+        bucket_start: Start of the candle period.
+        open: First rate of the period.
+        high: Highest rate of the period.
+        low: Lowest rate of the period.
+        close: Last rate of the period.
+        average: Average of the samples of the period.
+        count: Number of samples of the period.
+    """
+    from_currency: CurrencyEnum
+    to_currency: CurrencyEnum
+    trade_type: TradeType
+    resolution: CandleResolution
+    bucket_start: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    average: float
+    count: int
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        use_enum_values=True,
+        json_schema_extra={
+            "examples": [
+                {
+                    "from_currency": "USDT",
+                    "to_currency": "VES",
+                    "trade_type": "BUY",
+                    "resolution": "1h",
+                    "bucket_start": "2023-10-01T12:00:00",
+                    "open": 518.2,
+                    "high": 521.0,
+                    "low": 517.9,
+                    "close": 520.4,
+                    "average": 519.6,
+                    "count": 60
+                }
+            ]
+        }
+    )
+
+class CandleListResponse(BaseModel):
+    """
+    OHLC candle list response model.
+
+    Attributes:
+        count: Total number of candles.
+        candles: List of candles, oldest first.
+    """
+    count: int
+    candles: List[CandleResponse] = []
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        use_enum_values=True
+    )
@@ -0,0 +1,66 @@
+from datetime import datetime
+from typing import List
+from pydantic import BaseModel, ConfigDict
+
+from app.enums import CurrencyEnum
+
+class CrossRateResponse(BaseModel):
+    """
+    Cross rate derived from two legs quoted against a common asset.
+
+    Attributes:
+        from_currency: Currency code of the source currency.
+        to_currency: Currency code of the target currency.
+        via: Asset shared by both legs (e.g. USDT).
+        rate: Derived rate after applying the margin.
+        raw_rate: Derived rate before applying the margin.
+        margin: Margin applied, as a fraction of the raw rate.
+        source_price: Price of the source leg (via/from_currency).
+        target_price: Price of the target leg (via/to_currency).
+        timestamp: Timestamp of the oldest leg used.
+    """
+    from_currency: CurrencyEnum
+    to_currency: CurrencyEnum
+    via: CurrencyEnum
+    rate: float
+    raw_rate: float
+    margin: float
+    source_price: float
+    target_price: float
+    timestamp: datetime
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        use_enum_values=True,
+        json_schema_extra={
+            "examples": [
+                {
+                    "from_currency": "BRL",
+                    "to_currency": "VES",
+                    "via": "USDT",
+                    "rate": 92.15,
+                    "raw_rate": 95.0,
+                    "margin": 0.03,
+                    "source_price": 5.46,
+                    "target_price": 518.70,
+                    "timestamp": "2023-10-01T12:00:00Z"
+                }
+            ]
+        }
+    )
+
+class CrossRateListResponse(BaseModel):
+    """
+    Cross rate list response model.
+
+    Attributes:
+        count: Total number of cross rates.
+        rates: List of cross rates.
+    """
+    count: int
+    rates: List[CrossRateResponse] = []
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        use_enum_values=True
+    )
@@ -0,0 +1,108 @@
+from datetime import datetime
+from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.enums import CurrencyEnum, TradeType
+
+def _split(value):
+    """Accepts the comma separated lists stored in the database."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",") if item.strip()]
+    return value
+
+class IngestionJobCreate(BaseModel):
+    """
+    Ingestion job creation model.
+
+    Attributes:
+        name: Unique name of the job.
+        asset: Asset sampled (e.g. USDT).
+        fiat: Fiat currency sampled (e.g. VES).
+        trade_types: Binance P2P sides sampled.
+        pay_methods: Binance pay types stored as separate rates on top of the whole book.
+        interval_seconds: Seconds between two runs.
+        pages: Order-book pages fetched on every run.
+        jitter_seconds: Random delay added to every run, None uses the configured default.
+        enabled: Whether the job is scheduled.
+    """
+    name: str
+    asset: CurrencyEnum = CurrencyEnum.USDT
+    fiat: CurrencyEnum
+    trade_types: List[TradeType] = [TradeType.BUY, TradeType.SELL]
+    pay_methods: List[str] = []
+    interval_seconds: int = Field(60, ge=10)
+    pages: int = Field(1, ge=1, le=10)
+    jitter_seconds: Optional[int] = Field(None, ge=0)
+    enabled: bool = True
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        use_enum_values=True,
+        json_schema_extra={
+            "examples": [
+                {
+                    "name": "usdt-ves",
+                    "asset": "USDT",
+                    "fiat": "VES",
+                    "trade_types": ["BUY", "SELL"],
+                    "pay_methods": [],
+                    "interval_seconds": 60,
+                    "pages": 1
+                }
+            ]
+        }
+    )
+
+    _split_lists = field_validator("trade_types", "pay_methods", mode="before")(_split)
+
+class IngestionJobUpdate(BaseModel):
+    """
+    Ingestion job update model.
+
+    Attributes:
+        trade_types: Binance P2P sides sampled.
+        pay_methods: Binance pay types stored as separate rates on top of the whole book.
+        interval_seconds: Seconds between two runs.
+        pages: Order-book pages fetched on every run.
+        jitter_seconds: Random delay added to every run.
+        enabled: Whether the job is scheduled.
+    """
+    trade_types: Optional[List[TradeType]] = None
+    pay_methods: Optional[List[str]] = None
+    interval_seconds: Optional[int] = Field(None, ge=10)
+    pages: Optional[int] = Field(None, ge=1, le=10)
+    jitter_seconds: Optional[int] = Field(None, ge=0)
+    enabled: Optional[bool] = None
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        use_enum_values=True
+    )
+
+class IngestionJobResponse(IngestionJobCreate):
+    """
+    Ingestion job response model.
+
+    Attributes:
+        id: Unique identifier of the job.
+        updated_at: Last change of the job, used to reschedule it.
+    """
+    id: int
+    updated_at: datetime
+
+class IngestionJobListResponse(BaseModel):
+    """
+    Ingestion job list response model.
+
+    Attributes:
+        count: Total number of jobs.
+        jobs: List of jobs.
+    """
+    count: int
+    jobs: List[IngestionJobResponse] = []
+
+    model_config = ConfigDict(
+        from_attributes=True
+    )
@@ -0,0 +1,23 @@
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict
+
+from app.schemas.binance_response_schemas import BinanceResponse
+
+class LiveQuoteResponse(BaseModel):
+    """
+    Schema for a live quote served from the upstream cache.
+
+    Attributes:
+        pair (BinanceResponse): Last Binance P2P sample of the pair.
+        fetched_at (datetime): When the sample was fetched from Binance.
+        age_seconds (float): Age of the sample when served.
+        stale (bool): True if the sample outlived its TTL and a refresh is in progress.
+    """
+    pair: BinanceResponse
+    fetched_at: datetime
+    age_seconds: float
+    stale: bool
+
+    model_config = ConfigDict(
+        from_attributes=True
+    )
@@ -0,0 +1,49 @@
+import base64
+import binascii
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+class PageCursor(BaseModel):
+    """
+    Position of a keyset page: sort key and id of the last row served.
+    Sent to clients as an opaque url-safe token.
+
+    Attributes:
+        sort_key (datetime): Timestamp or creation date of the last row.
+        id (int): ID of the last row, breaks ties between equal sort keys.
+    """
+    sort_key: datetime
+    id: int
+
+    model_config = ConfigDict(
+        from_attributes=True
+    )
+
+    def encode(self) -> str:
+        """
+        Encode the cursor as the `next_cursor` of a list response.
+
+        Returns:
+            str: Opaque cursor token.
+        """
+        return base64.urlsafe_b64encode(self.model_dump_json().encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        """
+        Decode a cursor token received as the `after` parameter.
+
+        Args:
+            token (str): Token returned by encode().
+
+        Returns:
+            PageCursor: The decoded cursor.
+
+        Raises:
+            ValueError: If the token is not a cursor.
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            return cls.model_validate_json(raw)
+        except (binascii.Error, ValidationError) as e:
+            raise ValueError(f"Invalid cursor: {token}") from e
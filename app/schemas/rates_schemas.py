@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Optional, List
 from pydantic import BaseModel, ConfigDict
 
-from app.enums import CurrencyEnum
+from app.enums import CurrencyEnum, TradeType
 
 class RateResponse(BaseModel):
     """
@@ -14,12 +14,16 @@ class RateResponse(BaseModel):
         to_currency: Currency code of the target currency.
         rate: Exchange rate value.
         timestamp: Timestamp of the rate creation.
+        trade_type: Binance P2P side the rate was sampled from, None for manual rates.
+        pay_method: Binance pay type the rate was sampled on, None for the whole order book.
     """
     id: int
     from_currency: CurrencyEnum
     to_currency: CurrencyEnum
     rate: float
     timestamp: datetime
+    trade_type: Optional[TradeType] = None
+    pay_method: Optional[str] = None
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -44,9 +48,11 @@ class RateListResponse(BaseModel):
     Attributes:
         count: Total number of rates.
         rates: List of rate responses.
+        next_cursor: Cursor of the next page, None on the last page or for unpaginated lists.
     """
     count: int
     rates: List[Optional[RateResponse]] = []
+    next_cursor: Optional[str] = None
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -86,11 +92,15 @@ class RateCreate(BaseModel):
         to_currency: Currency code of the target currency.
         rate: Exchange rate value.
         timestamp: Timestamp of the rate creation.
+        trade_type: Binance P2P side the rate was sampled from, None for manual rates.
+        pay_method: Binance pay type the rate was sampled on, None for the whole order book.
     """
     from_currency: CurrencyEnum
     to_currency: CurrencyEnum
     rate: float
     timestamp: Optional[datetime] = None
+    trade_type: Optional[TradeType] = None
+    pay_method: Optional[str] = None
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -116,10 +126,14 @@ class RateUpdate(BaseModel):
         to_currency: Currency code of the target currency.
         rate: Exchange rate value.
         timestamp: Timestamp of the rate creation.
+        trade_type: Binance P2P side the rate was sampled from.
+        pay_method: Binance pay type the rate was sampled on.
     """
     from_currency: Optional[CurrencyEnum] = None
     to_currency: Optional[CurrencyEnum] = None
     rate: Optional[float] = None
+    trade_type: Optional[TradeType] = None
+    pay_method: Optional[str] = None
 
     model_config = ConfigDict(
         from_attributes=True,
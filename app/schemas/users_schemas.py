@@ -117,9 +117,11 @@ class UserListResponse(BaseModel):
     Attributes:
         count: Total number of users.
         users: List of user responses.
+        next_cursor: Cursor of the next page, None on the last page or for unpaginated lists.
     """
     count: int
     users: List[Optional[UserResponse]] = []
+    next_cursor: Optional[str] = None
 
     model_config = ConfigDict(
         from_attributes=True,
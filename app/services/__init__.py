@@ -1,5 +1,14 @@
 from app.services.scheduler_service import SchedulerService
 from app.services.security_service import SecurityService
+from app.services.http_client_service import HttpClient, get_http_client, get_binance_http_client
+from app.services.circuit_breaker_service import CircuitBreaker, get_binance_circuit_breaker
+from app.services.rate_limiter_service import TokenBucket, get_binance_rate_limiter
 from app.services.binance_service import BinanceP2P
-from app.services.rates_service import RateService
-from app.services.user_service import UserService
+from app.services.hot_rates_service import HotRateStore, get_hot_rate_store
+from app.services.rates_service import RateService, get_rate_service
+from app.services.cross_rates_service import CrossRateEngine, get_cross_rate_engine
+from app.services.candles_service import CandleService, get_candle_service
+from app.services.ingestion_jobs_service import IngestionJobService, get_ingestion_job_service
+from app.services.live_quote_service import LiveQuoteCache, get_live_quote_cache
+from app.services.user_service import UserService, get_user_service
+from app.services.leader_election_service import LeaderElection
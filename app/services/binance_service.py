@@ -1,18 +1,52 @@
 """Binance P2P module."""
-import requests
 import logging
-from statistics import median, mean
-from typing import List, Optional, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Optional, Dict, Tuple
+
+from app.config import Config
+from app.enums import FeedStatus
+from app.schemas import BinanceRequest, BinanceResponse, BinanceAd, BinanceFeedResult
+from app.services.http_client_service import HttpClient, get_binance_http_client
+from app.services.circuit_breaker_service import CircuitBreaker, get_binance_circuit_breaker
+from app.services.rate_limiter_service import TokenBucket, get_binance_rate_limiter
+from app.services.price_stats_service import PriceStatistics
+
+# Last good pair per (asset, fiat, trade_type), shared by every client of the process.
+_last_good: Dict[Tuple[str, str, str], Tuple[BinanceResponse, datetime]] = {}
+_last_good_lock = threading.Lock()
+
+def published_price(pair: BinanceResponse) -> Optional[float]:
+    """
+    Price of a pair that is published as rate, selected by Config.BINANCE_PUBLISHED_PRICE.
+
+    Args:
+        pair (BinanceResponse): Binance pair.
+
+    Returns:
+        Optional[float]: Published price, falling back to the average price.
+    """
+    price = getattr(pair, Config.BINANCE_PUBLISHED_PRICE, None)
+    return price if price is not None else pair.average_price
 
-from app.schemas import BinanceRequest, BinanceResponse
-   
 class BinanceP2P:
     """
     Binance P2P Client.
     """
-    def __init__(self):
+    def __init__(
+            self,
+            client: Optional[HttpClient] = None,
+            stats: Optional[PriceStatistics] = None,
+            breaker: Optional[CircuitBreaker] = None,
+            limiter: Optional[TokenBucket] = None
+        ):
         self.url = "https://p2p.binance.com/bapi/c2c/v2/friendly/c2c/adv/search"
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.client = client or get_binance_http_client()
+        self.stats = stats or PriceStatistics()
+        self.breaker = breaker or get_binance_circuit_breaker()
+        self.limiter = limiter or get_binance_rate_limiter()
 
     def build_request(
             self, 
@@ -20,7 +54,8 @@ class BinanceP2P:
             page: Optional[int], 
             rows: Optional[int], 
             trade_type: Optional[str], 
-            asset: Optional[str]
+            asset: Optional[str],
+            pay_types: Optional[List[str]] = None
         ) -> BinanceRequest:
         """
         Build the body request for Binance P2P.
@@ -31,6 +66,7 @@ class BinanceP2P:
             rows (Optional[int]): Number of rows per page.
             trade_type (Optional[str]): Trade type.
             asset (Optional[str]): Asset (USDT, BTC, etc).
+            pay_types (Optional[List[str]]): Binance pay types the ads are filtered by. Defaults to all.
 
         Returns:
             BinanceRequest: BinanceRequest object.
@@ -40,7 +76,8 @@ class BinanceP2P:
             page=page,
             rows=rows,
             tradeType=trade_type,
-            asset=asset
+            asset=asset,
+            payTypes=pay_types or []
         )
         if rows > 20:
             raise ValueError("Rows must be less than or equal to 20")
@@ -54,17 +91,97 @@ class BinanceP2P:
             req (BinanceRequest): BinanceRequest object.
 
         Returns:
-            dict: Response data.
+            dict: Response data, None on error, while the circuit breaker is open
+                or if no rate limit token was granted in time.
         """
         body = req.model_dump()
+        if not self.breaker.allow_request():
+            self.logger.warning(f"Binance P2P circuit {self.breaker.state}, skipping request")
+            return None
+        if not self.limiter.acquire(timeout=Config.BINANCE_RATE_LIMIT_WAIT_SECONDS):
+            self.breaker.cancel_request()
+            self.logger.warning(f"Binance P2P rate limit token not granted, {self.limiter.waiting} requests waiting")
+            return None
         try:
             self.logger.debug("Request Binance P2P")
-            res = requests.post(self.url, json=body, headers={"accept": "application/json"})
+            res = self.client.post(self.url, json=body, headers={"accept": "application/json"})
+            res.raise_for_status()
             json_data = res.json()
-            return json_data
         except Exception as e:
+            self.breaker.record_failure()
             self.logger.error(f"Error at Binance P2P request: {e}")
             return None
+        self.breaker.record_success()
+        return json_data
+
+    def fetch_pages(
+            self,
+            fiat: str,
+            asset: str,
+            trade_type: str,
+            pages: int = 1,
+            rows: int = 20,
+            max_workers: Optional[int] = None,
+            pay_types: Optional[List[str]] = None
+        ) -> List[dict]:
+        """
+        Fetch several order-book pages from Binance P2P concurrently.
+
+        Args:
+            fiat (str): Fiat currency.
+            asset (str): Asset (USDT, BTC, etc).
+            trade_type (str): Trade type.
+            pages (int, optional): Number of pages to fetch, starting at page 1. Defaults to 1.
+            rows (int, optional): Number of rows per page. Defaults to 20, max 20.
+            max_workers (Optional[int], optional): Maximum concurrent requests. Defaults to Config.BINANCE_MAX_WORKERS.
+            pay_types (Optional[List[str]], optional): Binance pay types the ads are filtered by. Defaults to all.
+
+        Returns:
+            List[dict]: Response data of every page that answered, in page order.
+        """
+        if pages < 1:
+            raise ValueError("Pages must be greater than or equal to 1")
+        reqs = [
+            self.build_request(fiat=fiat, page=page, rows=rows, trade_type=trade_type, asset=asset, pay_types=pay_types)
+            for page in range(1, pages + 1)
+        ]
+        if pages == 1:
+            responses = [self.do_request(reqs[0])]
+        else:
+            workers = min(max_workers or Config.BINANCE_MAX_WORKERS, pages)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="binance-page") as executor:
+                responses = list(executor.map(self.do_request, reqs))
+        return [data for data in responses if data]
+
+    def merge_pages(self, pages: List[dict]) -> Optional[dict]:
+        """
+        Merge several Binance P2P page responses into a single response.
+
+        Ads are deduplicated by their advertisement number, since the order book
+        can shift between pages while they are being fetched.
+
+        Args:
+            pages (List[dict]): Response data of each page.
+
+        Returns:
+            Optional[dict]: Response data with the ads of every successful page, None if no page succeeded.
+        """
+        seen = set()
+        ads = []
+        for data in pages:
+            if data.get("code") != "000000" or not isinstance(data.get("data"), list):
+                self.logger.warning(f"Skipping Binance page with code {data.get('code')}")
+                continue
+            for adv in data["data"]:
+                adv_no = adv.get("adv", {}).get("advNo")
+                if adv_no is not None:
+                    if adv_no in seen:
+                        continue
+                    seen.add(adv_no)
+                ads.append(adv)
+        if not ads and not any(data.get("code") == "000000" for data in pages):
+            return None
+        return {"code": "000000", "data": ads}
 
     def colect_prices(self, data: dict, fiat: Optional[str] = None) -> List[float]:
         """
@@ -86,33 +203,145 @@ class BinanceP2P:
             self.logger.error("Binance response error:", data)
             return None
 
-    def calculate_med(self, prices: Optional[List[float]]) -> Dict[str, Optional[float]]:
+    def colect_ads(self, data: dict) -> List[BinanceAd]:
+        """
+        Colect every ad with its limits, payment methods and advertiser from Binance P2P response.
+
+        Args:
+            data (dict): Response data.
+
+        Returns:
+            List[BinanceAd]: Ads of the response.
+        """
+        ads = []
+        for item in data.get("data") or []:
+            adv = item.get("adv", {})
+            try:
+                ads.append(BinanceAd(
+                    adv_no=adv.get("advNo"),
+                    price=float(adv["price"]),
+                    tradable_quantity=adv.get("tradableQuantity") or adv.get("surplusAmount"),
+                    min_limit=adv.get("minSingleTransAmount"),
+                    max_limit=adv.get("maxSingleTransAmount") or adv.get("dynamicMaxSingleTransAmount"),
+                    pay_methods=[
+                        method.get("identifier") for method in adv.get("tradeMethods") or [] if method.get("identifier")
+                    ],
+                    advertiser_id=(item.get("advertiser") or {}).get("userNo")
+                ))
+            except (KeyError, TypeError, ValueError) as e:
+                self.logger.warning(f"Skipping malformed Binance ad: {e}")
+        return ads
+
+    def colect_quantities(self, data: dict) -> List[Optional[float]]:
         """
-        Calculate the median price.
+        Colect the tradable quantity of each ad from Binance P2P response.
+
+        Args:
+            data (dict): Response data.
+
+        Returns:
+            List[Optional[float]]: Tradable quantity of each ad, None when Binance omits it.
+        """
+        quantities = []
+        for adv in data.get("data") or []:
+            quantity = adv["adv"].get("tradableQuantity") or adv["adv"].get("surplusAmount")
+            quantities.append(float(quantity) if quantity is not None else None)
+        return quantities
+
+    def calculate_med(
+            self,
+            prices: Optional[List[float]],
+            quantities: Optional[List[Optional[float]]] = None
+        ) -> Dict[str, Optional[float]]:
+        """
+        Calculate the price statistics.
 
         Args:
             prices (list): List of prices.
+            quantities (list, optional): Tradable quantity of each ad, used for the depth-weighted price.
 
         Returns:
-            Dict[str, float]: Median and average price
+            Dict[str, float]: Median, average, trimmed mean, weighted price and percentiles
         """
         if not prices:
             self.logger.warning("Empty price list received from Binance")
-            return {"median_price": None, "average_price": None}
+            return self.stats.empty()
         try:
-            median_price = median(prices)
-            average_price = mean(prices)
-            return {"median_price": median_price, "average_price": average_price}
+            return self.stats.summarize(prices, quantities)
         except Exception as e:
             self.logger.error(f"Error calculating median price: {e}")
-            return {"median_price": None, "average_price": None}
+            return self.stats.empty()
+
+    def fetch_pair_data(
+            self,
+            fiat: str,
+            asset: str,
+            trade_type: str,
+            rows: int = 20,
+            pages: int = 1,
+            pay_types: Optional[List[str]] = None
+        ) -> Optional[dict]:
+        """
+        Fetch the pages of a pair and merge them.
+
+        Args:
+            fiat (str): Fiat currency.
+            asset (str): Asset (USDT, BTC, etc).
+            trade_type (str): Trade type.
+            rows (int, optional): Number of rows per page. Defaults to 20, max 20.
+            pages (int, optional): Number of pages fetched concurrently and merged. Defaults to 1.
+            pay_types (Optional[List[str]], optional): Binance pay types the ads are filtered by. Defaults to all.
+
+        Returns:
+            Optional[dict]: Merged response data, None if no page succeeded.
+        """
+        responses = self.fetch_pages(
+            fiat=fiat, asset=asset, trade_type=trade_type, pages=pages, rows=rows, pay_types=pay_types
+        )
+        return self.merge_pages(responses)
+
+    def build_response(
+            self,
+            fiat: str,
+            asset: str,
+            trade_type: str,
+            prices: Optional[List[float]],
+            stats: Dict[str, Optional[float]],
+            ads: Optional[List[BinanceAd]] = None,
+            pay_method: Optional[str] = None
+        ) -> BinanceResponse:
+        """
+        Build the pair response from its prices and statistics.
+
+        Args:
+            fiat (str): Fiat currency.
+            asset (str): Asset (USDT, BTC, etc).
+            trade_type (str): Trade type.
+            prices (Optional[List[float]]): List of prices.
+            stats (Dict[str, Optional[float]]): Price statistics.
+            ads (Optional[List[BinanceAd]]): Raw ads of the sample.
+            pay_method (Optional[str]): Binance pay type the sample was filtered by.
+
+        Returns:
+            BinanceResponse: BinanceResponse object.
+        """
+        return BinanceResponse(
+            fiat=fiat,
+            asset=asset,
+            trade_type=trade_type,
+            pay_method=pay_method,
+            prices=prices,
+            ads=ads or [],
+            **stats
+        )
 
     def get_pair(
             self, 
             fiat: str = "VES", 
             asset: str = "USDT", 
             trade_type: str = "BUY", 
-            rows: int = 20
+            rows: int = 20,
+            pages: int = 1
         ) -> Optional[BinanceResponse]:
         """
         Get the pair.
@@ -122,28 +351,154 @@ class BinanceP2P:
             asset (str, optional): Asset (USDT, BTC, etc). Defaults to "USDT".
             trade_type (str, optional): Trade type. Defaults to "BUY".
             rows (int, optional): Number of rows per page. Defaults to 20, max 20.
+            pages (int, optional): Number of pages fetched concurrently and merged. Defaults to 1.
 
         Returns:
             Optional[BinanceResponse]: BinanceResponse object.
         """
-        body = self.build_request(fiat=fiat, page=1, rows=rows, trade_type=trade_type, asset=asset)
-        data = self.do_request(body)
+        data = self.fetch_pair_data(fiat=fiat, asset=asset, trade_type=trade_type, rows=rows, pages=pages)
         if not data:
             self.logger.warning("No data received from Binance")
             return None
         precios = self.colect_prices(data, fiat=fiat)
-        medians = self.calculate_med(precios)
-    
-        pair = BinanceResponse(
-            fiat=fiat,
-            asset=asset,
-            trade_type=trade_type,
-            prices=precios,
-            average_price=medians.get("average_price"),
-            median_price=medians.get("median_price")
-        )
+        medians = self.calculate_med(precios, self.colect_quantities(data))
+        pair = self.build_response(fiat, asset, trade_type, precios, medians, self.colect_ads(data))
+        self.remember_pair(pair)
         return pair
 
+    def get_pairs(
+            self,
+            pairs: List[Tuple[str, str]],
+            trade_types: List[str],
+            pages: int = 1,
+            rows: int = 20,
+            pay_methods: Optional[Dict[str, List[str]]] = None
+        ) -> List[BinanceResponse]:
+        """
+        Get every (asset, fiat) pair on every trade type concurrently, at most
+        Config.HTTP_POOL_SIZE requests in flight counting the pages of every pair.
+        Pay methods fan out into one extra query per method, filtered with payTypes.
+        The statistics of the whole matrix are computed in a single vectorized pass.
+
+        Args:
+            pairs (List[Tuple[str, str]]): Pairs as (asset, fiat) tuples, e.g. ("USDT", "VES").
+            trade_types (List[str]): Trade types to sample for every pair.
+            pages (int, optional): Number of pages fetched for every pair and side. Defaults to 1.
+            rows (int, optional): Number of rows per page. Defaults to 20, max 20.
+            pay_methods (Optional[Dict[str, List[str]]], optional): Binance pay types sampled on top
+                of the whole order book, by fiat. Defaults to none.
+
+        Returns:
+            List[BinanceResponse]: The pairs that Binance answered, in matrix order.
+        """
+        pay_methods = pay_methods or {}
+        matrix = [
+            (asset, fiat, trade_type, pay_method)
+            for asset, fiat in pairs
+            for trade_type in trade_types
+            for pay_method in [None, *pay_methods.get(fiat, [])]
+        ]
+        if not matrix:
+            return []
+
+        def fetch(item: Tuple[str, str, str, Optional[str]]) -> Optional[dict]:
+            asset, fiat, trade_type, pay_method = item
+            try:
+                return self.fetch_pair_data(
+                    fiat=fiat, asset=asset, trade_type=trade_type, rows=rows, pages=pages,
+                    pay_types=[pay_method] if pay_method else None
+                )
+            except Exception as e:
+                self.logger.error(f"Error getting pair {asset}/{fiat} {trade_type} {pay_method or ''}: {e}")
+                return None
+
+        # Pairs times pages in flight stay within the pooled connections of the HTTP client
+        page_workers = min(Config.BINANCE_MAX_WORKERS, pages)
+        pair_workers = min(len(matrix), max(1, Config.HTTP_POOL_SIZE // page_workers))
+        with ThreadPoolExecutor(max_workers=pair_workers, thread_name_prefix="binance-pair") as executor:
+            responses = list(executor.map(fetch, matrix))
+
+        answered = []
+        for (asset, fiat, trade_type, pay_method), data in zip(matrix, responses):
+            if not data:
+                self.logger.warning(f"No data received from Binance for {asset}/{fiat} {trade_type} {pay_method or ''}")
+                continue
+            answered.append((
+                asset, fiat, trade_type, pay_method,
+                self.colect_prices(data, fiat=fiat), self.colect_quantities(data), self.colect_ads(data)
+            ))
+
+        try:
+            stats = self.stats.summarize_many([(prices, quantities) for *_, prices, quantities, _ in answered])
+        except Exception as e:
+            self.logger.error(f"Error calculating price statistics: {e}")
+            stats = [self.stats.empty() for _ in answered]
+        pairs = [
+            self.build_response(fiat, asset, trade_type, prices, pair_stats, ads, pay_method)
+            for (asset, fiat, trade_type, pay_method, prices, _, ads), pair_stats in zip(answered, stats)
+        ]
+        for pair in pairs:
+            self.remember_pair(pair)
+        return pairs
+
+    def remember_pair(self, pair: BinanceResponse) -> None:
+        """
+        Keep the pair as the last good value of its asset, fiat and side, if it carries prices.
+        Samples filtered by pay method are not kept.
+
+        Args:
+            pair (BinanceResponse): Pair fetched from Binance.
+        """
+        if pair.average_price is None or pair.pay_method:
+            return
+        with _last_good_lock:
+            _last_good[(pair.asset, pair.fiat, pair.trade_type)] = (pair, datetime.now())
+
+    def get_pair_result(
+            self,
+            fiat: str = "VES",
+            asset: str = "USDT",
+            trade_type: str = "BUY",
+            rows: int = 20,
+            pages: int = 1
+        ) -> BinanceFeedResult:
+        """
+        Get the pair as a typed result that falls back to the last good value.
+
+        Args:
+            fiat (str, optional): Fiat currency. Defaults to "VES".
+            asset (str, optional): Asset (USDT, BTC, etc). Defaults to "USDT".
+            trade_type (str, optional): Trade type. Defaults to "BUY".
+            rows (int, optional): Number of rows per page. Defaults to 20, max 20.
+            pages (int, optional): Number of pages fetched concurrently and merged. Defaults to 1.
+
+        Returns:
+            BinanceFeedResult: OK with the fresh pair, DEGRADED with the last good pair and its age,
+                or UNAVAILABLE if no pair was ever fetched.
+        """
+        pair = self.get_pair(fiat=fiat, asset=asset, trade_type=trade_type, rows=rows, pages=pages)
+        now = datetime.now()
+        if pair is not None and pair.average_price is not None:
+            return BinanceFeedResult(
+                status=FeedStatus.OK,
+                pair=pair,
+                fetched_at=now,
+                age_seconds=0.0,
+                circuit_state=self.breaker.state
+            )
+        with _last_good_lock:
+            last_good = _last_good.get((asset, fiat, trade_type))
+        if last_good is None:
+            return BinanceFeedResult(status=FeedStatus.UNAVAILABLE, circuit_state=self.breaker.state)
+        last_pair, fetched_at = last_good
+        return BinanceFeedResult(
+            status=FeedStatus.DEGRADED,
+            pair=last_pair,
+            fetched_at=fetched_at,
+            age_seconds=round((now - fetched_at).total_seconds(), 3),
+            circuit_state=self.breaker.state
+        )
+
     def get_usdt_ves_pair(self) -> BinanceResponse:
         """
         Get the USDT/VES pair.
@@ -151,5 +506,13 @@ class BinanceP2P:
         Returns:
             BinanceResponse: USDT/VES pair data.
         """
-        return self.get_pair(fiat="VES", asset="USDT", trade_type="BUY", rows=20)
-        
\ No newline at end of file
+        return self.get_pair(fiat="VES", asset="USDT", trade_type="BUY", rows=20, pages=Config.BINANCE_PAGES)
+
+    def get_usdt_ves_result(self) -> BinanceFeedResult:
+        """
+        Get the USDT/VES pair as a typed result that falls back to the last good value.
+
+        Returns:
+            BinanceFeedResult: USDT/VES feed result.
+        """
+        return self.get_pair_result(fiat="VES", asset="USDT", trade_type="BUY", rows=20, pages=Config.BINANCE_PAGES)
@@ -0,0 +1,118 @@
+"""
+Module for rate candles service and business logic
+"""
+import logging
+import threading
+from datetime import date, datetime
+from typing import List, Optional
+
+from app.enums import CandleResolution
+from app.controllers import CandleController
+from app.schemas import RateCreate, CandleListResponse
+
+class CandleService:
+    """
+    Service for managing the OHLC rate candles.
+    """
+    def __init__(self):
+        self.controller = CandleController()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def pick_resolution(self, start_date: date, end_date: date) -> CandleResolution:
+        """
+        Picks the finest resolution that keeps the response small for a date range.
+
+        Args:
+            start_date (date): The start date of the range.
+            end_date (date): The end date of the range.
+
+        Returns:
+            CandleResolution: 1m up to a day, 1h up to a month, 1d beyond.
+        """
+        days = (end_date - start_date).days
+        if days < 1:
+            return CandleResolution.MINUTE
+        if days <= 31:
+            return CandleResolution.HOUR
+        return CandleResolution.DAY
+
+    def record_samples(self, rates: List[RateCreate]) -> int:
+        """
+        Fold rate samples into their 1m, 1h and 1d candles.
+
+        Args:
+            rates (List[RateCreate]): Samples with a trade type.
+
+        Returns:
+            int: Number of candle updates applied.
+        """
+        now = datetime.now()
+        for rate in rates:
+            if not rate.timestamp:
+                rate.timestamp = now
+        return self.controller.register_samples(rates)
+
+    def get_candles(
+            self,
+            from_currency: str,
+            to_currency: str,
+            start_date: date,
+            end_date: date,
+            resolution: Optional[CandleResolution] = None,
+            trade_type: Optional[str] = None
+        ) -> CandleListResponse:
+        """
+        Get the candles of a pair within a date range.
+
+        Args:
+            from_currency (str): Source currency code.
+            to_currency (str): Target currency code.
+            start_date (date): The start date of the range.
+            end_date (date): The end date of the range, inclusive.
+            resolution (Optional[CandleResolution]): Candle resolution. Picked from the range if omitted.
+            trade_type (Optional[str]): Binance P2P side. Defaults to both.
+
+        Returns:
+            CandleListResponse: Candles within the range, oldest first.
+        """
+        resolution = resolution or self.pick_resolution(start_date, end_date)
+        start = datetime.combine(start_date, datetime.min.time())
+        end = datetime.combine(end_date, datetime.max.time())
+        self.logger.debug(f"Retrieving {resolution} candles from {start} to {end}")
+        return self.controller.get_candles(from_currency, to_currency, resolution, start, end, trade_type)
+
+    def prune_minute_candles(self, retention_days: int) -> int:
+        """
+        Delete the 1m candles older than the retention window.
+
+        Args:
+            retention_days (int): Retention window in days.
+
+        Returns:
+            int: Number of candles deleted.
+        """
+        return self.controller.prune_candles(CandleResolution.MINUTE, retention_days)
+
+    def dispose(self) -> None:
+        """
+        Closes the underlying controller session.
+        """
+        self.controller.close_session()
+
+_service: Optional[CandleService] = None
+_service_lock = threading.Lock()
+
+def get_candle_service() -> CandleService:
+    """
+    Returns the process-wide candle service, creating it on first use.
+    It holds no request state: within session_scope() its controller works on the request session.
+
+    Returns:
+        CandleService: Shared candle service.
+    """
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = CandleService()
+    return _service
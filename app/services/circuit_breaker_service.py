@@ -0,0 +1,133 @@
+"""
+Module for the circuit breaker that guards the upstream calls.
+"""
+import logging
+import threading
+import time
+from typing import Optional
+
+from app.config import Config
+from app.enums import CircuitState
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker.
+
+    - CLOSED: calls go through, consecutive failures are counted.
+    - OPEN: after `failure_threshold` consecutive failures, calls are refused
+      without touching the upstream until `reset_timeout` seconds have passed.
+    - HALF_OPEN: a single probe call is let through. Its success closes the
+      circuit, its failure opens it again.
+    """
+    def __init__(
+            self,
+            name: str,
+            failure_threshold: Optional[int] = None,
+            reset_timeout: Optional[float] = None
+        ) -> None:
+        """
+        Initializes a closed circuit. Thresholds default to their Config values.
+
+        Args:
+            name (str): Name of the guarded upstream, used in the logs.
+            failure_threshold (Optional[int]): Consecutive failures that open the circuit.
+            reset_timeout (Optional[float]): Seconds the circuit stays open before probing.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.name = name
+        self.failure_threshold = failure_threshold or Config.BINANCE_BREAKER_FAILURE_THRESHOLD
+        self.reset_timeout = Config.BINANCE_BREAKER_RESET_SECONDS if reset_timeout is None else reset_timeout
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """
+        Current state, OPEN turns into HALF_OPEN once the reset timeout has passed.
+
+        Returns:
+            CircuitState: State of the circuit.
+        """
+        with self._lock:
+            if self._state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a call may go to the upstream.
+
+        Returns:
+            bool: True if the call may proceed. In HALF_OPEN only the probe call is allowed.
+        """
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return True
+            if self._state == CircuitState.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = CircuitState.HALF_OPEN
+                self._probing = False
+            if self._probing:
+                return False
+            self._probing = True
+            self.logger.info(f"Circuit {self.name} half-open, probing upstream")
+            return True
+
+    def record_success(self) -> None:
+        """
+        Record a successful call, closing the circuit.
+        """
+        with self._lock:
+            if self._state != CircuitState.CLOSED:
+                self.logger.info(f"Circuit {self.name} closed")
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """
+        Record a failed call, opening the circuit when the threshold is reached or the probe failed.
+        """
+        with self._lock:
+            self._failures += 1
+            if self._state == CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != CircuitState.OPEN:
+                    self.logger.warning(f"Circuit {self.name} open after {self._failures} failures")
+                self._state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+    def cancel_request(self) -> None:
+        """
+        Give back a call allowed by allow_request() but never made, freeing the half-open probe.
+        """
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._probing = False
+
+    def reset(self) -> None:
+        """
+        Force the circuit back to CLOSED.
+        """
+        self.record_success()
+
+_binance_breaker: Optional[CircuitBreaker] = None
+_binance_breaker_lock = threading.Lock()
+
+def get_binance_circuit_breaker() -> CircuitBreaker:
+    """
+    Returns the circuit breaker shared by every Binance P2P client, creating it on first use.
+
+    Returns:
+        CircuitBreaker: Shared Binance circuit breaker.
+    """
+    global _binance_breaker
+    if _binance_breaker is None:
+        with _binance_breaker_lock:
+            if _binance_breaker is None:
+                _binance_breaker = CircuitBreaker("binance-p2p")
+    return _binance_breaker
@@ -0,0 +1,209 @@
+"""
+Module for triangular cross rates derived from Binance P2P legs.
+"""
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.config import Config
+from app.enums import CurrencyEnum
+from app.controllers import RateController
+from app.services.binance_service import published_price
+from app.schemas import BinanceResponse, RateResponse, CrossRateResponse
+
+# (asset, fiat, trade_type) -> (price, timestamp)
+Legs = Dict[Tuple[str, str, str], Tuple[float, datetime]]
+
+class CrossRateEngine:
+    """
+    Derives cross rates by treating the currencies as a graph whose edges are the
+    asset/fiat legs sampled from Binance. Every pair of fiats quoted against the same
+    asset yields a cross rate:
+
+        rate(X -> Y) = price(asset/Y, target side) / price(asset/X, source side) * (1 - margin)
+
+    With the default sides, BRL -> VES = USDT/VES BUY / USDT/BRL SELL.
+    The derived table is rebuilt on every update and kept in memory, so quotes are dict lookups.
+    """
+    def __init__(
+            self,
+            margin: Optional[float] = None,
+            source_side: Optional[str] = None,
+            target_side: Optional[str] = None
+        ) -> None:
+        """
+        Initializes the engine with an empty table. Every argument defaults to its Config value.
+
+        Args:
+            margin (Optional[float]): Margin subtracted from the raw rate, as a fraction.
+            source_side (Optional[str]): Trade type of the leg of the source currency.
+            target_side (Optional[str]): Trade type of the leg of the target currency.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.margin = Config.CROSS_RATE_MARGIN if margin is None else margin
+        self.source_side = source_side or Config.CROSS_RATE_SOURCE_SIDE
+        self.target_side = target_side or Config.CROSS_RATE_TARGET_SIDE
+        self._legs: Legs = {}
+        self._table: Dict[Tuple[str, str], CrossRateResponse] = {}
+        self._lock = threading.Lock()
+        self.updated_at = time.monotonic()
+
+    def update_legs(self, legs: Iterable[Tuple[str, str, str, float, datetime]]) -> int:
+        """
+        Updates the legs and rebuilds the derived table.
+
+        Args:
+            legs (Iterable[Tuple[str, str, str, float, datetime]]): (asset, fiat, trade_type, price, timestamp) tuples.
+
+        Returns:
+            int: Number of derived cross rates.
+        """
+        with self._lock:
+            for asset, fiat, trade_type, price, timestamp in legs:
+                if not price:
+                    continue
+                key = (str(asset), str(fiat), str(trade_type))
+                current = self._legs.get(key)
+                if current is None or current[1] <= timestamp:
+                    self._legs[key] = (price, timestamp)
+            table = self._derive(self._legs)
+            # Se reemplaza la tabla completa para que las lecturas nunca vean un estado parcial
+            self._table = table
+            self.updated_at = time.monotonic()
+        self.logger.debug(f"Derived {len(table)} cross rates from {len(self._legs)} legs")
+        return len(table)
+
+    def update_from_pairs(self, pairs: List[BinanceResponse], timestamp: Optional[datetime] = None) -> int:
+        """
+        Updates the legs from Binance responses and rebuilds the derived table.
+
+        Args:
+            pairs (List[BinanceResponse]): Binance pairs.
+            timestamp (Optional[datetime]): Sampling timestamp. Defaults to now.
+
+        Returns:
+            int: Number of derived cross rates.
+        """
+        timestamp = timestamp or datetime.now()
+        return self.update_legs(
+            (pair.asset, pair.fiat, pair.trade_type, published_price(pair), timestamp) for pair in pairs
+        )
+
+    def update_from_rates(self, rates: List[RateResponse]) -> int:
+        """
+        Updates the legs from sampled rate records and rebuilds the derived table.
+
+        Args:
+            rates (List[RateResponse]): Rate records with a trade type. Pay method rates are skipped.
+
+        Returns:
+            int: Number of derived cross rates.
+        """
+        return self.update_legs(
+            (rate.from_currency, rate.to_currency, rate.trade_type, rate.rate, rate.timestamp)
+            for rate in rates if rate.trade_type and not rate.pay_method
+        )
+
+    def load_from_db(self) -> int:
+        """
+        Warms up the engine with the latest sampled legs stored in the database.
+
+        Returns:
+            int: Number of derived cross rates.
+        """
+        controller = RateController()
+        try:
+            return self.update_from_rates(controller.get_latest_sampled_rates())
+        finally:
+            controller.close_session()
+
+    def _derive(self, legs: Legs) -> Dict[Tuple[str, str], CrossRateResponse]:
+        """
+        Builds the cross rate table from the legs.
+
+        Args:
+            legs (Legs): Legs indexed by (asset, fiat, trade_type).
+
+        Returns:
+            Dict[Tuple[str, str], CrossRateResponse]: Cross rates indexed by (from_currency, to_currency).
+        """
+        graph: Dict[str, Dict[str, Dict[str, Tuple[float, datetime]]]] = defaultdict(lambda: defaultdict(dict))
+        for (asset, fiat, trade_type), leg in legs.items():
+            graph[asset][fiat][trade_type] = leg
+
+        table = {}
+        for asset, fiats in graph.items():
+            for source, source_sides in fiats.items():
+                source_leg = source_sides.get(self.source_side)
+                if source_leg is None:
+                    continue
+                for target, target_sides in fiats.items():
+                    target_leg = target_sides.get(self.target_side)
+                    if target == source or target_leg is None:
+                        continue
+                    try:
+                        raw_rate = target_leg[0] / source_leg[0]
+                        table[(source, target)] = CrossRateResponse(
+                            from_currency=CurrencyEnum(source),
+                            to_currency=CurrencyEnum(target),
+                            via=CurrencyEnum(asset),
+                            rate=raw_rate * (1 - self.margin),
+                            raw_rate=raw_rate,
+                            margin=self.margin,
+                            source_price=source_leg[0],
+                            target_price=target_leg[0],
+                            timestamp=min(source_leg[1], target_leg[1])
+                        )
+                    except ValueError as e:
+                        self.logger.warning(f"Skipping cross rate {source}/{target} via {asset}: {e}")
+        return table
+
+    def get_quote(self, from_currency: str, to_currency: str) -> Optional[CrossRateResponse]:
+        """
+        Get a derived cross rate.
+
+        Args:
+            from_currency (str): Source currency code.
+            to_currency (str): Target currency code.
+
+        Returns:
+            Optional[CrossRateResponse]: Cross rate, None if it cannot be derived.
+        """
+        return self._table.get((str(from_currency), str(to_currency)))
+
+    def get_all(self) -> List[CrossRateResponse]:
+        """
+        Get every derived cross rate.
+
+        Returns:
+            List[CrossRateResponse]: Cross rates.
+        """
+        return list(self._table.values())
+
+_engine: Optional[CrossRateEngine] = None
+_engine_lock = threading.Lock()
+
+def get_cross_rate_engine() -> CrossRateEngine:
+    """
+    Returns the process-wide cross rate engine, warming it up from the database on first use.
+    When the legs are not updated in this process (ingestion runs in a separate worker),
+    they are reloaded from the database every Config.CROSS_RATE_REFRESH_SECONDS.
+
+    Returns:
+        CrossRateEngine: Shared cross rate engine.
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                engine = CrossRateEngine()
+                engine.load_from_db()
+                _engine = engine
+    elif time.monotonic() - _engine.updated_at > Config.CROSS_RATE_REFRESH_SECONDS:
+        with _engine_lock:
+            if time.monotonic() - _engine.updated_at > Config.CROSS_RATE_REFRESH_SECONDS:
+                _engine.load_from_db()
+    return _engine
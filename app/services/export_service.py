@@ -0,0 +1,50 @@
+"""
+Module for encoding streamed records as NDJSON or CSV chunks.
+"""
+import csv
+import io
+from typing import AsyncIterator, Dict, List, Sequence
+
+from pydantic import BaseModel
+
+from app.enums import ExportFormat
+
+EXPORT_MEDIA_TYPES: Dict[ExportFormat, str] = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+async def encode_export(
+        batches: AsyncIterator[List[BaseModel]],
+        export_format: ExportFormat,
+        fields: Sequence[str]
+    ) -> AsyncIterator[str]:
+    """
+    Encodes batches of records, one chunk per batch. The CSV header is sent before the first
+    batch is read, so the client gets its first byte right away.
+
+    Args:
+        batches (AsyncIterator[List[BaseModel]]): Batches of records, as streamed by a controller.
+        export_format (ExportFormat): NDJSON, one JSON object per line, or CSV with a header row.
+        fields (Sequence[str]): Fields exported, in column order.
+
+    Yields:
+        str: Encoded chunk.
+    """
+    include = set(fields)
+    if export_format == ExportFormat.NDJSON:
+        async for batch in batches:
+            yield "".join(f"{record.model_dump_json(include=include)}\n" for record in batch)
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(fields)
+    yield buffer.getvalue()
+    async for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        for record in batch:
+            values = record.model_dump(mode="json", include=include)
+            writer.writerow([values[field] for field in fields])
+        yield buffer.getvalue()
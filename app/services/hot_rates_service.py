@@ -0,0 +1,244 @@
+"""
+Module for the in-memory window of recent rates that serves the period endpoints.
+"""
+import logging
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.config import Config
+from app.controllers.rates_controller import RATE_LIST_ADAPTER
+from app.schemas import RateResponse
+
+# Timestamps are kept as integer microseconds since EPOCH, exact and naive like the stored ones
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+# (from_currency, to_currency, trade_type, pay_method)
+SeriesKey = Tuple[str, str, Optional[str], Optional[str]]
+
+def to_micros(timestamp: datetime) -> int:
+    return (timestamp - EPOCH) // MICROSECOND
+
+def from_micros(micros: int) -> datetime:
+    return EPOCH + micros * MICROSECOND
+
+class RateSeries:
+    """
+    Rates of one pair, side and pay method, sorted by timestamp, in typed arrays.
+    """
+    __slots__ = ("timestamps", "ids", "rates")
+
+    def __init__(self) -> None:
+        self.timestamps = array("q")
+        self.ids = array("q")
+        self.rates = array("d")
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def find(self, micros: int, rate_id: int) -> int:
+        """
+        Position of a rate, -1 if missing.
+        """
+        start = bisect_left(self.timestamps, micros)
+        end = bisect_right(self.timestamps, micros, lo=start)
+        for position in range(start, end):
+            if self.ids[position] == rate_id:
+                return position
+        return -1
+
+    def insert(self, micros: int, rate_id: int, rate: float) -> None:
+        """
+        Inserts a rate at its timestamp, an append for the rates sampled now.
+        """
+        position = bisect_right(self.timestamps, micros)
+        self.timestamps.insert(position, micros)
+        self.ids.insert(position, rate_id)
+        self.rates.insert(position, rate)
+
+    def pop(self, position: int) -> None:
+        self.timestamps.pop(position)
+        self.ids.pop(position)
+        self.rates.pop(position)
+
+    def trim(self, micros: int) -> None:
+        """
+        Drops the rates older than micros.
+        """
+        end = bisect_left(self.timestamps, micros)
+        if end:
+            del self.timestamps[:end]
+            del self.ids[:end]
+            del self.rates[:end]
+
+class HotRateStore:
+    """
+    Process-local copy of the rates of the last Config.HOT_RATES_WINDOW_DAYS days.
+
+    The rates are split per pair, side and pay method in sorted typed arrays, a range is
+    answered by bisecting each series, without touching the database. The store is loaded
+    on startup, the writes of this process are applied as they happen and the rates written
+    by other processes (westcambios-worker) are fetched by id every Config.HOT_RATES_SYNC_SECONDS.
+    Rates edited or deleted by another process keep their old value until a restart.
+    """
+    def __init__(self, window_days: Optional[int] = None, sync_seconds: Optional[float] = None) -> None:
+        """
+        Initializes an empty store. Every argument defaults to its Config value.
+
+        Args:
+            window_days (Optional[int]): Days of rates kept, the longest period served.
+            sync_seconds (Optional[float]): Seconds between two fetches of the new rates.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.window_days = Config.HOT_RATES_WINDOW_DAYS if window_days is None else window_days
+        self.sync_seconds = Config.HOT_RATES_SYNC_SECONDS if sync_seconds is None else sync_seconds
+        self._series: Dict[SeriesKey, RateSeries] = {}
+        self._last_id = 0
+        self._synced_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """
+        Whether the store was loaded from the database.
+        """
+        return self._synced_at is not None
+
+    @property
+    def last_id(self) -> int:
+        """
+        Highest rate id seen, the next sync fetches the rates after it.
+        """
+        return self._last_id
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(series) for series in self._series.values())
+
+    def window_start(self) -> datetime:
+        """
+        Oldest timestamp kept, the start of the day Config.HOT_RATES_WINDOW_DAYS days ago.
+        """
+        return datetime.combine(date.today() - timedelta(days=self.window_days), datetime.min.time())
+
+    def sync_due(self) -> bool:
+        """
+        Whether the rates written since the last sync should be fetched.
+        """
+        return self._synced_at is None or time.monotonic() - self._synced_at >= self.sync_seconds
+
+    def sync(self, rates: Iterable[RateResponse]) -> None:
+        """
+        Applies the rates fetched from the database after last_id, the whole window on the first call.
+
+        Args:
+            rates (Iterable[RateResponse]): Rates written since the last sync.
+        """
+        with self._lock:
+            self._merge(rates)
+            cutoff = to_micros(self.window_start())
+            for series in self._series.values():
+                series.trim(cutoff)
+            if self._synced_at is None:
+                self.logger.info(f"Loaded {sum(len(s) for s in self._series.values())} rates in {len(self._series)} series")
+            self._synced_at = time.monotonic()
+
+    def add(self, rates: Iterable[RateResponse]) -> None:
+        """
+        Applies rates written by this process. A rate already in the store gets its value replaced.
+        Ignored until the store is loaded, the load reads them from the database.
+
+        Args:
+            rates (Iterable[RateResponse]): Rates created or upserted.
+        """
+        with self._lock:
+            if self.loaded:
+                self._merge(rates)
+
+    def remove(self, rate_id: int) -> None:
+        """
+        Removes a rate deleted by this process, or edited before adding its new version.
+
+        Args:
+            rate_id (int): Id of the rate.
+        """
+        with self._lock:
+            for series in self._series.values():
+                try:
+                    series.pop(series.ids.index(rate_id))
+                    return
+                except ValueError:
+                    continue
+
+    def get_range(self, start: datetime, end: datetime) -> Optional[List[RateResponse]]:
+        """
+        Rates between start and end, both included, by timestamp.
+
+        Args:
+            start (datetime): Start of the range.
+            end (datetime): End of the range.
+
+        Returns:
+            Optional[List[RateResponse]]: Rates in the range, None if the store is not loaded
+                or the range starts before the window.
+        """
+        if not self.loaded or start < self.window_start():
+            return None
+        start_micros, end_micros = to_micros(start), to_micros(end)
+        rows = []
+        with self._lock:
+            for key, series in self._series.items():
+                first = bisect_left(series.timestamps, start_micros)
+                last = bisect_right(series.timestamps, end_micros, lo=first)
+                rows.extend(
+                    (series.timestamps[i], series.ids[i], series.rates[i], key) for i in range(first, last)
+                )
+        rows.sort()
+        return RATE_LIST_ADAPTER.validate_python([
+            {
+                "id": rate_id, "from_currency": from_currency, "to_currency": to_currency, "rate": rate,
+                "timestamp": from_micros(micros), "trade_type": trade_type, "pay_method": pay_method
+            }
+            for micros, rate_id, rate, (from_currency, to_currency, trade_type, pay_method) in rows
+        ])
+
+    def _merge(self, rates: Iterable[RateResponse]) -> None:
+        """
+        Inserts or replaces rates, under the lock.
+        """
+        cutoff = self.window_start()
+        for rate in rates:
+            self._last_id = max(self._last_id, rate.id)
+            if rate.timestamp < cutoff:
+                continue
+            key = (rate.from_currency, rate.to_currency, rate.trade_type, rate.pay_method)
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = RateSeries()
+            micros = to_micros(rate.timestamp)
+            position = series.find(micros, rate.id)
+            if position >= 0:
+                series.rates[position] = rate.rate
+            else:
+                series.insert(micros, rate.id, rate.rate)
+
+_store: Optional[HotRateStore] = None
+_store_lock = threading.Lock()
+
+def get_hot_rate_store() -> HotRateStore:
+    """
+    Returns the process-wide hot rate store.
+
+    Returns:
+        HotRateStore: Shared hot rate store, loaded by RateService on first use.
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = HotRateStore()
+    return _store
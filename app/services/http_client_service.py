@@ -0,0 +1,178 @@
+"""
+Pooled HTTP client module for upstream calls.
+"""
+import logging
+import threading
+from typing import Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+
+from app.config import Config
+from app.services.rate_limiter_service import TokenBucket, get_binance_rate_limiter
+
+RETRY_STATUS_CODES: Tuple[int, ...] = (429, 500, 502, 503, 504)
+
+class RateLimitedRetry(Retry):
+    """
+    Retry policy that takes a rate limiter token before every retry,
+    so a retried request counts against the upstream limit like the first attempt.
+    """
+    def __init__(self, *args, limiter: Optional[TokenBucket] = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.limiter = limiter
+
+    def new(self, **kwargs) -> "RateLimitedRetry":
+        retry = super().new(**kwargs)
+        retry.limiter = self.limiter
+        return retry
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None) -> "RateLimitedRetry":
+        """
+        Counts the failed attempt, then waits for the token of the next one.
+
+        Raises:
+            MaxRetryError: If the retries are exhausted or no token was granted in time.
+        """
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        if self.limiter is not None and not self.limiter.acquire(timeout=Config.BINANCE_RATE_LIMIT_WAIT_SECONDS):
+            raise MaxRetryError(_pool, url, error or ResponseError("rate limit token not granted for the retry"))
+        return retry
+
+class HttpClient:
+    """
+    Keep-alive HTTP client with connection pooling, timeouts and retries.
+    """
+    def __init__(
+            self,
+            pool_size: Optional[int] = None,
+            connect_timeout: Optional[float] = None,
+            read_timeout: Optional[float] = None,
+            max_retries: Optional[int] = None,
+            backoff_factor: Optional[float] = None,
+            backoff_jitter: Optional[float] = None,
+            limiter: Optional[TokenBucket] = None
+        ) -> None:
+        """
+        Initializes the client with a pooled session. Every argument defaults to its Config value.
+
+        Args:
+            pool_size (Optional[int]): Maximum number of kept-alive connections per host.
+            connect_timeout (Optional[float]): Seconds to wait for the connection to be established.
+            read_timeout (Optional[float]): Seconds to wait for the server to send data.
+            max_retries (Optional[int]): Retries on connection errors and on 429/5xx responses.
+            backoff_factor (Optional[float]): Exponential backoff factor between retries.
+            backoff_jitter (Optional[float]): Maximum random seconds added to every backoff.
+            limiter (Optional[TokenBucket]): Rate limiter charged for every retry, none by default.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.pool_size = pool_size or Config.HTTP_POOL_SIZE
+        self.timeout = (
+            connect_timeout or Config.HTTP_CONNECT_TIMEOUT,
+            read_timeout or Config.HTTP_READ_TIMEOUT
+        )
+        retries = Config.HTTP_MAX_RETRIES if max_retries is None else max_retries
+        self.retry = RateLimitedRetry(
+            limiter=limiter,
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=Config.HTTP_BACKOFF_FACTOR if backoff_factor is None else backoff_factor,
+            backoff_jitter=Config.HTTP_BACKOFF_JITTER if backoff_jitter is None else backoff_jitter,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=None, # Binance P2P search is a read-only POST, safe to retry
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=self.retry
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request through the pooled session.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Target URL.
+            **kwargs: Extra arguments for requests. The client timeout is used unless one is given.
+
+        Returns:
+            requests.Response: Response object.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Send a GET request.
+
+        Args:
+            url (str): Target URL.
+
+        Returns:
+            requests.Response: Response object.
+        """
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """
+        Send a POST request.
+
+        Args:
+            url (str): Target URL.
+
+        Returns:
+            requests.Response: Response object.
+        """
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        """
+        Closes every pooled connection.
+        """
+        self.session.close()
+        self.logger.debug("HTTP session closed.")
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+def get_http_client() -> HttpClient:
+    """
+    Returns the process-wide HTTP client, creating it on first use.
+
+    Returns:
+        HttpClient: Shared HTTP client.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HttpClient()
+    return _client
+
+_binance_client: Optional[HttpClient] = None
+_binance_client_lock = threading.Lock()
+
+def get_binance_http_client() -> HttpClient:
+    """
+    Returns the HTTP client of the Binance P2P calls, creating it on first use.
+    Its retries take tokens from the shared Binance rate limiter.
+
+    Returns:
+        HttpClient: Shared Binance HTTP client.
+    """
+    global _binance_client
+    if _binance_client is None:
+        with _binance_client_lock:
+            if _binance_client is None:
+                _binance_client = HttpClient(limiter=get_binance_rate_limiter())
+    return _binance_client
@@ -0,0 +1,123 @@
+"""
+Module for the Binance ingestion job registry service
+"""
+import logging
+import threading
+from typing import List, Optional
+
+from app.config import Config
+from app.controllers import IngestionJobController
+from app.schemas import IngestionJobCreate, IngestionJobUpdate, IngestionJobResponse, IngestionJobListResponse
+
+class IngestionJobService:
+    """
+    Service for managing the registry of Binance ingestion jobs.
+    """
+    def __init__(self):
+        self.controller = IngestionJobController()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def default_jobs(self) -> List[IngestionJobCreate]:
+        """
+        Jobs built from the configured ingestion pairs and sides.
+
+        Returns:
+            List[IngestionJobCreate]: One job per configured pair.
+        """
+        return [
+            IngestionJobCreate(
+                name=f"{asset}-{fiat}".lower(),
+                asset=asset,
+                fiat=fiat,
+                trade_types=Config.BINANCE_INGEST_SIDES,
+                interval_seconds=max(10, Config.BINANCE_SAMPLING_INTERVAL_SECONDS),
+                pages=Config.BINANCE_SAMPLING_PAGES,
+                enabled=Config.BINANCE_SAMPLING_INTERVAL_SECONDS > 0
+            )
+            for asset, fiat in Config.BINANCE_INGEST_PAIRS
+        ]
+
+    def seed_jobs(self) -> int:
+        """
+        Seed the registry from the configuration if it is empty.
+
+        Returns:
+            int: Number of jobs created.
+        """
+        created = self.controller.register_jobs_if_empty(self.default_jobs())
+        if created:
+            self.logger.info(f"Seeded {created} ingestion jobs from configuration")
+        return created
+
+    def get_jobs(self, enabled_only: bool = False) -> IngestionJobListResponse:
+        """
+        Get the registered jobs.
+
+        Args:
+            enabled_only (bool): Only the jobs that are scheduled.
+
+        Returns:
+            IngestionJobListResponse: Registered jobs.
+        """
+        return self.controller.get_jobs(enabled_only=enabled_only)
+
+    def register_job(self, job: IngestionJobCreate) -> Optional[IngestionJobResponse]:
+        """
+        Register a new job.
+
+        Args:
+            job (IngestionJobCreate): Job data.
+
+        Returns:
+            Optional[IngestionJobResponse]: Registered job.
+        """
+        return self.controller.register_job(job)
+
+    def update_job(self, job_id: int, job: IngestionJobUpdate) -> Optional[IngestionJobResponse]:
+        """
+        Update a job.
+
+        Args:
+            job_id (int): ID of the job.
+            job (IngestionJobUpdate): Updated fields.
+
+        Returns:
+            Optional[IngestionJobResponse]: Updated job.
+        """
+        return self.controller.update_job(job_id, job)
+
+    def delete_job(self, job_id: int) -> bool:
+        """
+        Delete a job.
+
+        Args:
+            job_id (int): ID of the job.
+
+        Returns:
+            bool: True if the job was deleted.
+        """
+        return self.controller.delete_job(job_id)
+
+    def dispose(self) -> None:
+        """
+        Closes the underlying controller session.
+        """
+        self.controller.close_session()
+
+_service: Optional[IngestionJobService] = None
+_service_lock = threading.Lock()
+
+def get_ingestion_job_service() -> IngestionJobService:
+    """
+    Returns the process-wide ingestion job service, creating it on first use.
+    It holds no request state: within session_scope() its controller works on the request session.
+
+    Returns:
+        IngestionJobService: Shared ingestion job service.
+    """
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = IngestionJobService()
+    return _service
@@ -0,0 +1,165 @@
+"""
+Module for electing the single process that runs the ingestion scheduler.
+"""
+import logging
+import os
+import socket
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config import Config
+from app.database.db_config import engine as default_engine
+from app.database.models import LeasesDatabaseModel
+
+class LeaderElection:
+    """
+    Leader election on a lease row of the SQLite database.
+
+    Every process runs a renewal thread. The holder of an unexpired lease extends it
+    every `renew_interval` seconds, the others try to take it over once it expires.
+    Each attempt is a single conditional UPDATE, which SQLite serializes, so at most
+    one process holds the lease at any time. If the leader dies, its lease expires
+    after `lease_seconds` and another process is elected.
+    """
+    def __init__(
+            self,
+            name: str,
+            on_elected: Callable[[], None],
+            on_demoted: Callable[[], None],
+            lease_seconds: Optional[float] = None,
+            renew_interval: Optional[float] = None,
+            engine: Optional[Engine] = None
+        ) -> None:
+        """
+        Initializes the election. Timings default to their Config values.
+
+        Args:
+            name (str): Name of the lease, one per elected role.
+            on_elected (Callable[[], None]): Called when this process becomes leader.
+            on_demoted (Callable[[], None]): Called when this process loses the lease.
+            lease_seconds (Optional[float]): Validity of the lease after each renewal.
+            renew_interval (Optional[float]): Seconds between two renewals or takeover attempts.
+            engine (Optional[Engine]): Database engine holding the lease table.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.name = name
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.lease_seconds = lease_seconds or Config.LEADER_LEASE_SECONDS
+        self.renew_interval = renew_interval or Config.LEADER_RENEW_SECONDS
+        self.engine = engine or default_engine
+        self.holder = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def try_acquire(self) -> bool:
+        """
+        Take or renew the lease if it is free, expired or already ours.
+
+        Returns:
+            bool: True if this process holds the lease.
+        """
+        now = datetime.now()
+        expires_at = now + timedelta(seconds=self.lease_seconds)
+        lease = LeasesDatabaseModel
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(
+                    insert(lease)
+                    .values(name=self.name, holder=self.holder, acquired_at=now, expires_at=expires_at)
+                    .on_conflict_do_nothing(index_elements=[lease.name])
+                )
+                result = conn.execute(
+                    update(lease)
+                    .where(lease.name == self.name)
+                    .where((lease.holder == self.holder) | (lease.expires_at < now))
+                    .values(
+                        holder=self.holder,
+                        expires_at=expires_at,
+                        acquired_at=lease.acquired_at if self.is_leader else now
+                    )
+                )
+                return result.rowcount == 1
+        except SQLAlchemyError as e:
+            self.logger.error(f"Error renewing lease {self.name}: {e}")
+            return False
+
+    def release(self) -> None:
+        """
+        Give up the lease so another process can take over without waiting for it to expire.
+        """
+        lease = LeasesDatabaseModel
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(
+                    update(lease)
+                    .where(lease.name == self.name, lease.holder == self.holder)
+                    .values(expires_at=datetime.now() - timedelta(seconds=1))
+                )
+        except SQLAlchemyError as e:
+            self.logger.error(f"Error releasing lease {self.name}: {e}")
+
+    def tick(self) -> bool:
+        """
+        Run one election round and fire the callbacks on a change of role.
+        If on_elected fails, the lease is released and this process stays a follower.
+
+        Returns:
+            bool: True if this process is the leader after the round.
+        """
+        acquired = self.try_acquire()
+        if acquired and not self.is_leader:
+            self.logger.info(f"{self.holder} elected leader of {self.name}")
+            try:
+                self.on_elected()
+            except Exception as e:
+                self.logger.error(f"{self.holder} could not take the lead of {self.name}, releasing the lease: {e}")
+                self.release()
+                return False
+            self.is_leader = True
+        elif not acquired and self.is_leader:
+            self.is_leader = False
+            self.logger.warning(f"{self.holder} lost the lease of {self.name}")
+            self.on_demoted()
+        return self.is_leader
+
+    def _run(self) -> None:
+        """
+        Renewal loop of the background thread.
+        """
+        while not self._stop.is_set():
+            try:
+                self.tick()
+            except Exception as e:
+                self.logger.error(f"Error in leader election {self.name}: {e}")
+            self._stop.wait(self.renew_interval)
+
+    def start(self) -> None:
+        """
+        Start the renewal thread.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"leader-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the renewal thread and release the lease if held.
+        """
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.renew_interval)
+        if self.is_leader:
+            self.is_leader = False
+            self.on_demoted()
+            self.release()
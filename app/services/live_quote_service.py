@@ -0,0 +1,142 @@
+"""
+Module for live Binance quotes served from a stale-while-revalidate cache.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from app.config import Config
+from app.schemas import BinanceResponse, LiveQuoteResponse
+from app.services.binance_service import BinanceP2P
+
+class LiveQuoteCache:
+    """
+    Short TTL cache in front of an upstream fetcher.
+
+    - Fresh hits are served from memory.
+    - Concurrent misses share a single upstream call (single-flight).
+    - Once the TTL expires, the stale value keeps being served while one
+      background refresh runs, until it is older than the maximum staleness.
+    """
+    def __init__(
+            self,
+            fetcher: Callable[[], Optional[BinanceResponse]],
+            ttl_seconds: Optional[float] = None,
+            max_stale_seconds: Optional[float] = None
+        ) -> None:
+        """
+        Initializes an empty cache. Every argument defaults to its Config value.
+
+        Args:
+            fetcher (Callable[[], Optional[BinanceResponse]]): Upstream call, returns None on failure.
+            ttl_seconds (Optional[float]): Seconds a value is served as fresh.
+            max_stale_seconds (Optional[float]): Seconds a value may be served while it is revalidated.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.fetcher = fetcher
+        self.ttl_seconds = Config.LIVE_QUOTE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.max_stale_seconds = Config.LIVE_QUOTE_MAX_STALE_SECONDS if max_stale_seconds is None else max_stale_seconds
+        self._value: Optional[BinanceResponse] = None
+        self._fetched_at: float = 0.0
+        self._inflight: Optional[Future] = None
+        self._lock = threading.Lock()
+
+    def _refresh(self, future: Future) -> None:
+        """
+        Runs the upstream call and publishes its result to every waiter.
+        A response without average price (no ads, degraded pair) is a failure,
+        the cached value is kept.
+
+        Args:
+            future (Future): Future shared by the callers waiting for this refresh.
+        """
+        value = None
+        try:
+            value = self.fetcher()
+        except Exception as e:
+            self.logger.error(f"Error refreshing live quote: {e}")
+        if value is not None and value.average_price is None:
+            self.logger.warning("Live quote refresh returned no average price, keeping the cached value")
+            value = None
+        with self._lock:
+            if value is not None:
+                self._value = value
+                self._fetched_at = time.monotonic()
+            self._inflight = None
+        future.set_result(value)
+
+    def _response(self, stale: bool) -> LiveQuoteResponse:
+        """
+        Builds the response for the cached value.
+
+        Args:
+            stale (bool): Whether the value outlived its TTL.
+
+        Returns:
+            LiveQuoteResponse: Cached value with its age.
+        """
+        age = time.monotonic() - self._fetched_at
+        return LiveQuoteResponse(
+            pair=self._value,
+            fetched_at=datetime.now() - timedelta(seconds=age),
+            age_seconds=round(age, 3),
+            stale=stale
+        )
+
+    def get(self, timeout: Optional[float] = None) -> Optional[LiveQuoteResponse]:
+        """
+        Get the live quote.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for an upstream call on a cold miss.
+
+        Returns:
+            Optional[LiveQuoteResponse]: The quote, None if the upstream call failed and nothing usable is cached.
+        """
+        with self._lock:
+            age = time.monotonic() - self._fetched_at
+            if self._value is not None and age < self.ttl_seconds:
+                return self._response(stale=False)
+            serve_stale = self._value is not None and age < self.max_stale_seconds
+            future = self._inflight
+            leader = future is None
+            if leader:
+                future = self._inflight = Future()
+
+        if leader and serve_stale:
+            threading.Thread(target=self._refresh, args=(future,), name="live-quote-refresh", daemon=True).start()
+        elif leader:
+            self._refresh(future)
+
+        if serve_stale:
+            with self._lock:
+                return self._response(stale=True)
+
+        try:
+            future.result(timeout=timeout)
+        except Exception as e:
+            self.logger.warning(f"Live quote refresh not available: {e}")
+        with self._lock:
+            if self._value is None or time.monotonic() - self._fetched_at >= self.max_stale_seconds:
+                return None
+            return self._response(stale=time.monotonic() - self._fetched_at >= self.ttl_seconds)
+
+_cache: Optional[LiveQuoteCache] = None
+_cache_lock = threading.Lock()
+
+def get_live_quote_cache() -> LiveQuoteCache:
+    """
+    Returns the process-wide USDT/VES live quote cache, creating it on first use.
+
+    Returns:
+        LiveQuoteCache: Shared live quote cache.
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LiveQuoteCache(BinanceP2P().get_usdt_ves_pair)
+    return _cache
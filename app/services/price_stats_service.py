@@ -0,0 +1,143 @@
+"""
+Vectorized robust statistics for Binance P2P price samples.
+"""
+import logging
+import warnings
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.config import Config
+
+PERCENTILES: Tuple[int, ...] = (10, 25, 50, 75, 90)
+
+Sample = Tuple[Sequence[float], Optional[Sequence[Optional[float]]]]
+
+class PriceStatistics:
+    """
+    Statistics stage for P2P price samples built on NumPy arrays.
+
+    Many samples (pages merged per pair and side) are padded into a single 2-D array,
+    so every statistic of every sample is computed in one vectorized pass:
+    median, mean, trimmed mean, percentiles, IQR outlier rejection and a
+    depth-weighted price that weights each ad by its tradable quantity.
+    Any object exposing summarize/summarize_many can replace it in BinanceP2P.
+    """
+    def __init__(self, trim_fraction: Optional[float] = None, iqr_factor: Optional[float] = None) -> None:
+        """
+        Initializes the stage. Every argument defaults to its Config value.
+
+        Args:
+            trim_fraction (Optional[float]): Fraction cut from each tail for the trimmed mean.
+            iqr_factor (Optional[float]): Tukey fence factor, prices outside Q1 - k*IQR and Q3 + k*IQR are outliers.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.trim_fraction = Config.PRICE_TRIM_FRACTION if trim_fraction is None else trim_fraction
+        self.iqr_factor = Config.PRICE_IQR_FACTOR if iqr_factor is None else iqr_factor
+
+    def empty(self) -> Dict[str, Optional[float]]:
+        """
+        Statistics of an empty sample.
+
+        Returns:
+            Dict[str, Optional[float]]: Every statistic set to None.
+        """
+        stats = {
+            "median_price": None,
+            "average_price": None,
+            "trimmed_mean_price": None,
+            "weighted_price": None,
+            "sample_size": 0,
+            "outliers_removed": 0
+        }
+        stats.update({f"p{p}_price": None for p in PERCENTILES if p != 50})
+        return stats
+
+    def summarize(
+            self,
+            prices: Sequence[float],
+            quantities: Optional[Sequence[Optional[float]]] = None
+        ) -> Dict[str, Optional[float]]:
+        """
+        Compute the statistics of a single sample.
+
+        Args:
+            prices (Sequence[float]): Ad prices.
+            quantities (Optional[Sequence[Optional[float]]]): Tradable quantity of each ad.
+
+        Returns:
+            Dict[str, Optional[float]]: Statistics of the sample.
+        """
+        return self.summarize_many([(prices, quantities)])[0]
+
+    def summarize_many(self, samples: List[Sample]) -> List[Dict[str, Optional[float]]]:
+        """
+        Compute the statistics of many samples in one vectorized pass.
+
+        Args:
+            samples (List[Sample]): (prices, quantities) tuples, quantities may be None.
+
+        Returns:
+            List[Dict[str, Optional[float]]]: Statistics of each sample, in the same order.
+        """
+        if not samples:
+            return []
+        width = max((len(prices) for prices, _ in samples if prices), default=0)
+        if width == 0:
+            return [self.empty() for _ in samples]
+
+        prices = np.full((len(samples), width), np.nan)
+        quantities = np.full((len(samples), width), np.nan)
+        for row, (sample_prices, sample_quantities) in enumerate(samples):
+            if not sample_prices:
+                continue
+            prices[row, :len(sample_prices)] = sample_prices
+            if sample_quantities is not None:
+                quantities[row, :len(sample_quantities)] = [
+                    np.nan if quantity is None else quantity for quantity in sample_quantities
+                ]
+
+        with warnings.catch_warnings(), np.errstate(invalid="ignore", divide="ignore"):
+            # Las filas vacías producen "All-NaN slice"; se devuelven como None más abajo
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            valid = ~np.isnan(prices)
+            counts = valid.sum(axis=1)
+
+            percentiles = np.nanpercentile(prices, PERCENTILES, axis=1)
+            by_percentile = dict(zip(PERCENTILES, percentiles))
+            average = np.nanmean(prices, axis=1)
+
+            # Trimmed mean: NaN se ordena al final, así que cada fila conserva [k, count - k)
+            ordered = np.sort(prices, axis=1)
+            cut = np.floor(counts * self.trim_fraction).astype(int)
+            positions = np.arange(width)
+            kept = (positions >= cut[:, None]) & (positions < (counts - cut)[:, None])
+            trimmed_mean = np.where(kept, ordered, 0.0).sum(axis=1) / kept.sum(axis=1)
+
+            # Tukey fences
+            iqr = by_percentile[75] - by_percentile[25]
+            lower = by_percentile[25] - self.iqr_factor * iqr
+            upper = by_percentile[75] + self.iqr_factor * iqr
+            inliers = valid & (prices >= lower[:, None]) & (prices <= upper[:, None])
+            outliers = counts - inliers.sum(axis=1)
+
+            weights = np.where(inliers & ~np.isnan(quantities) & (quantities > 0), quantities, 0.0)
+            weight_sum = weights.sum(axis=1)
+            weighted = np.where(inliers, prices * weights, 0.0).sum(axis=1) / weight_sum
+
+        results = []
+        for row in range(len(samples)):
+            if counts[row] == 0:
+                results.append(self.empty())
+                continue
+            stats = {
+                "median_price": float(by_percentile[50][row]),
+                "average_price": float(average[row]),
+                "trimmed_mean_price": float(trimmed_mean[row]),
+                "weighted_price": float(weighted[row]) if weight_sum[row] > 0 else None,
+                "sample_size": int(counts[row]),
+                "outliers_removed": int(outliers[row])
+            }
+            stats.update({f"p{p}_price": float(by_percentile[p][row]) for p in PERCENTILES if p != 50})
+            results.append(stats)
+        return results
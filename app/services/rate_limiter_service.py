@@ -0,0 +1,106 @@
+"""
+Module for the client-side rate limiter of the upstream calls.
+"""
+import logging
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from app.config import Config
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with a FIFO queue of waiters.
+
+    Tokens refill continuously at `rate` per second, up to `burst`. Callers
+    are served strictly in arrival order, so a burst of page fetches cannot
+    starve a scheduler job or an on-demand request that queued before it.
+    A rate of 0 disables the limiter.
+    """
+    def __init__(self, rate: Optional[float] = None, burst: Optional[int] = None) -> None:
+        """
+        Initializes a full bucket. Arguments default to their Config values.
+
+        Args:
+            rate (Optional[float]): Tokens added per second.
+            burst (Optional[int]): Bucket capacity.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.rate = Config.BINANCE_RATE_LIMIT_PER_SECOND if rate is None else rate
+        self.burst = max(1, burst or Config.BINANCE_RATE_LIMIT_BURST)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._queue: deque = deque()
+        self._cond = threading.Condition()
+
+    def _refill(self) -> None:
+        """
+        Add the tokens earned since the last refill.
+        """
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Take a token, waiting in line for it.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait, None waits forever.
+
+        Returns:
+            bool: True if a token was taken, False if the timeout expired first.
+        """
+        if self.rate <= 0:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        waiter = object()
+        with self._cond:
+            self._queue.append(waiter)
+            try:
+                while True:
+                    wait = None
+                    if self._queue[0] is waiter:
+                        self._refill()
+                        if self._tokens >= 1:
+                            self._tokens -= 1
+                            return True
+                        wait = (1 - self._tokens) / self.rate
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return False
+                        wait = remaining if wait is None else min(wait, remaining)
+                    self._cond.wait(wait)
+            finally:
+                self._queue.remove(waiter)
+                self._cond.notify_all()
+
+    @property
+    def waiting(self) -> int:
+        """
+        Number of callers waiting for a token.
+
+        Returns:
+            int: Queue length.
+        """
+        with self._cond:
+            return len(self._queue)
+
+_binance_limiter: Optional[TokenBucket] = None
+_binance_limiter_lock = threading.Lock()
+
+def get_binance_rate_limiter() -> TokenBucket:
+    """
+    Returns the token bucket shared by every Binance P2P client, creating it on first use.
+
+    Returns:
+        TokenBucket: Shared Binance rate limiter.
+    """
+    global _binance_limiter
+    if _binance_limiter is None:
+        with _binance_limiter_lock:
+            if _binance_limiter is None:
+                _binance_limiter = TokenBucket()
+    return _binance_limiter
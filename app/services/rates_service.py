@@ -2,11 +2,18 @@
 Module for rates service and business logic
 """
 import logging
+import threading
 from datetime import date, datetime, timedelta
-from typing import Optional
+from typing import AsyncIterator, List, Optional
 
+from app.config import Config
+from app.enums import ExportFormat
 from app.controllers import RateController
-from app.schemas import RateCreate, RateResponse, RateUpdate, RateListResponse
+from app.schemas import RateCreate, RateResponse, RateUpdate, RateListResponse, PageCursor
+from app.services.export_service import encode_export
+from app.services.hot_rates_service import get_hot_rate_store
+
+RATE_EXPORT_FIELDS = tuple(RateResponse.model_fields)
 
 class RateService:
     """
@@ -16,6 +23,58 @@ class RateService:
         self.controller = RateController()
         self.logger = logging.getLogger(self.__class__.__name__)
 
+    def sync_hot_rates(self) -> None:
+        """
+        Loads the hot rate store, or fetches the rates written since its last sync when due.
+        """
+        store = get_hot_rate_store()
+        if Config.HOT_RATES_ENABLED and store.sync_due():
+            rates = self.controller.get_rates_after_id(store.last_id, store.window_start())
+            if rates is not None:
+                store.sync(rates)
+
+    async def sync_hot_rates_async(self) -> None:
+        """
+        Async version of sync_hot_rates().
+        """
+        store = get_hot_rate_store()
+        if Config.HOT_RATES_ENABLED and store.sync_due():
+            rates = await self.controller.get_rates_after_id_async(store.last_id, store.window_start())
+            if rates is not None:
+                store.sync(rates)
+
+    def _get_hot_rates(self, start_date: date, end_date: date) -> Optional[List[RateResponse]]:
+        """
+        Helper to read a date range from the hot rate store, None if the store can not serve it.
+        """
+        if not Config.HOT_RATES_ENABLED:
+            return None
+        return get_hot_rate_store().get_range(
+            datetime.combine(start_date, datetime.min.time()),
+            datetime.combine(end_date, datetime.max.time())
+        )
+
+    def _get_range(self, start_date: date, end_date: date) -> RateListResponse:
+        """
+        Helper to fetch the rates of a date range, from the hot rate store when it covers it.
+        An empty range is None, like for the database read.
+        """
+        self.sync_hot_rates()
+        rates = self._get_hot_rates(start_date, end_date)
+        if rates is None:
+            return self.controller.get_rates_by_time_range(start_date, end_date)
+        return RateListResponse(count=len(rates), rates=rates) if rates else None
+
+    async def _get_range_async(self, start_date: date, end_date: date) -> RateListResponse:
+        """
+        Async version of _get_range().
+        """
+        await self.sync_hot_rates_async()
+        rates = self._get_hot_rates(start_date, end_date)
+        if rates is None:
+            return await self.controller.get_rates_by_time_range_async(start_date, end_date)
+        return RateListResponse(count=len(rates), rates=rates) if rates else None
+
     def _get_range_response(self, days: int) -> RateListResponse:
             """
             Helper to calculate date ranges and fetch records.
@@ -23,7 +82,36 @@ class RateService:
             today = datetime.now().date()
             start_date = today - timedelta(days=days)
             self.logger.debug(f"Retrieving rates from {start_date} to {today}")
-            return self.controller.get_rates_by_time_range(start_date, today)
+            return self._get_range(start_date, today)
+
+    async def _get_range_response_async(self, days: int) -> RateListResponse:
+            """
+            Async version of _get_range_response().
+            """
+            today = datetime.now().date()
+            start_date = today - timedelta(days=days)
+            self.logger.debug(f"Retrieving rates from {start_date} to {today}")
+            return await self._get_range_async(start_date, today)
+
+    @staticmethod
+    def _filter_latest_rates(
+            rates: List[RateResponse],
+            from_currency: Optional[str],
+            to_currency: Optional[str],
+            trade_type: Optional[str],
+            pay_method: Optional[str]
+        ) -> RateListResponse:
+        """
+        Helper to apply the filters of get_latest_rates().
+        """
+        rates = [
+            rate for rate in rates
+            if (from_currency is None or rate.from_currency == from_currency)
+            and (to_currency is None or rate.to_currency == to_currency)
+            and (trade_type is None or rate.trade_type == trade_type)
+            and (pay_method is None or (rate.pay_method or "").lower() == pay_method.lower())
+        ]
+        return RateListResponse(count=len(rates), rates=rates)
 
     def register_rate(self, rate_data: RateCreate) -> Optional[RateResponse]:
         """
@@ -38,8 +126,30 @@ class RateService:
         if not rate_data.timestamp:
             rate_data.timestamp = datetime.now()
         self.logger.debug(f"Creating rate: {rate_data}")
-        return self.controller.register_rate(rate_data)
+        rate = self.controller.register_rate(rate_data)
+        if rate is not None:
+            get_hot_rate_store().add([rate])
+        return rate
     
+    def register_rates(self, rates_data: List[RateCreate]) -> List[RateResponse]:
+        """
+        Register several rates in a single transaction.
+
+        Args:
+            rates_data (List[RateCreate]): The rates data to be registered.
+
+        Returns:
+            List[RateResponse]: The registered rate records.
+        """
+        now = datetime.now()
+        for rate_data in rates_data:
+            if not rate_data.timestamp:
+                rate_data.timestamp = now
+        self.logger.debug(f"Creating {len(rates_data)} rates")
+        rates = self.controller.register_rates(rates_data)
+        get_hot_rate_store().add(rates)
+        return rates
+
     def get_rate_by_id(self, rate_id: int) -> Optional[RateResponse]:
         """
         Get a rate by its ID.
@@ -52,7 +162,53 @@ class RateService:
         """
         self.logger.debug(f"Retrieving rate with ID: {rate_id}")
         return self.controller.get_rate_by_id(rate_id)
+
+    async def get_rate_by_id_async(self, rate_id: int) -> Optional[RateResponse]:
+        """
+        Async version of get_rate_by_id().
+        """
+        self.logger.debug(f"Retrieving rate with ID: {rate_id}")
+        return await self.controller.get_rate_by_id_async(rate_id)
     
+    def get_latest_rates(
+            self,
+            from_currency: Optional[str] = None,
+            to_currency: Optional[str] = None,
+            trade_type: Optional[str] = None,
+            pay_method: Optional[str] = None
+        ) -> RateListResponse:
+        """
+        Get the latest Binance rate of every pair, side and pay method.
+
+        Args:
+            from_currency (Optional[str]): Source currency code filter.
+            to_currency (Optional[str]): Target currency code filter.
+            trade_type (Optional[str]): Binance P2P side filter.
+            pay_method (Optional[str]): Pay method filter, case insensitive.
+
+        Returns:
+            RateListResponse: Latest rates matching the filters.
+        """
+        return self._filter_latest_rates(
+            self.controller.get_latest_sampled_rates(include_pay_methods=True),
+            from_currency, to_currency, trade_type, pay_method
+        )
+
+    async def get_latest_rates_async(
+            self,
+            from_currency: Optional[str] = None,
+            to_currency: Optional[str] = None,
+            trade_type: Optional[str] = None,
+            pay_method: Optional[str] = None
+        ) -> RateListResponse:
+        """
+        Async version of get_latest_rates().
+        """
+        return self._filter_latest_rates(
+            await self.controller.get_latest_sampled_rates_async(include_pay_methods=True),
+            from_currency, to_currency, trade_type, pay_method
+        )
+
     def get_all_rates(self) -> RateListResponse:
         """
         Get all rates.
@@ -62,6 +218,20 @@ class RateService:
         """
         self.logger.debug("Retrieving all rates")
         return self.controller.get_all_rates()
+
+    async def get_rates_page_async(self, limit: int, after: Optional[PageCursor] = None) -> RateListResponse:
+        """
+        Get a page of rates, newest first.
+
+        Args:
+            limit (int): Maximum number of rates in the page.
+            after (Optional[PageCursor]): Cursor of the previous page, None for the first one.
+
+        Returns:
+            RateListResponse: Page of rates, with the cursor of the next page if any.
+        """
+        self.logger.debug(f"Retrieving {limit} rates after {after}")
+        return await self.controller.get_rates_page_async(limit, after)
     
     def get_today_rates(self) -> RateListResponse:
         """
@@ -117,6 +287,42 @@ class RateService:
         """
         return self._get_range_response(days=365)
     
+    async def get_today_rates_async(self) -> RateListResponse:
+        """
+        Async version of get_today_rates().
+        """
+        return await self._get_range_response_async(days=0)
+
+    async def get_last_week_rates_async(self) -> RateListResponse:
+        """
+        Async version of get_last_week_rates().
+        """
+        return await self._get_range_response_async(days=7)
+
+    async def get_last_month_rates_async(self) -> RateListResponse:
+        """
+        Async version of get_last_month_rates().
+        """
+        return await self._get_range_response_async(days=30)
+
+    async def get_last_3_months_rates_async(self) -> RateListResponse:
+        """
+        Async version of get_last_3_months_rates().
+        """
+        return await self._get_range_response_async(days=90)
+
+    async def get_last_6_months_rates_async(self) -> RateListResponse:
+        """
+        Async version of get_last_6_months_rates().
+        """
+        return await self._get_range_response_async(days=180)
+
+    async def get_last_year_rates_async(self) -> RateListResponse:
+        """
+        Async version of get_last_year_rates().
+        """
+        return await self._get_range_response_async(days=365)
+
     def get_rates_by_custom_range(self, start_date: date, end_date: date) -> RateListResponse:
         """
         Get rates within a specified date range.
@@ -128,7 +334,13 @@ class RateService:
         Returns:
             RateListResponse: List of rate records within the specified date range.
         """
-        return self.controller.get_rates_by_time_range(start_date, end_date)
+        return self._get_range(start_date, end_date)
+
+    async def get_rates_by_custom_range_async(self, start_date: date, end_date: date) -> RateListResponse:
+        """
+        Async version of get_rates_by_custom_range().
+        """
+        return await self._get_range_async(start_date, end_date)
     
     def update_rate(self, rate_id: int, rate_data: RateUpdate) -> Optional[RateResponse]:
         """
@@ -142,7 +354,12 @@ class RateService:
             RateResponse: The updated rate record.
         """
         self.logger.debug(f"Updating rate with ID: {rate_id} with data: {rate_data}")
-        return self.controller.update_rate_record(rate_id, rate_data)
+        rate = self.controller.update_rate_record(rate_id, rate_data)
+        if rate is not None:
+            store = get_hot_rate_store()
+            store.remove(rate_id)
+            store.add([rate])
+        return rate
     
     def delete_rate(self, rate_id: int) -> bool:
         """
@@ -155,10 +372,45 @@ class RateService:
             bool: True if the deletion was successful, False otherwise.
         """
         self.logger.debug(f"Deleting rate with ID: {rate_id}")
-        return self.controller.delete_rate_record(rate_id)
+        deleted = self.controller.delete_rate_record(rate_id)
+        if deleted:
+            get_hot_rate_store().remove(rate_id)
+        return deleted
+
+    def export_rates(self, export_format: ExportFormat) -> AsyncIterator[str]:
+        """
+        Export every rate as a stream of chunks, oldest first.
+
+        Args:
+            export_format (ExportFormat): NDJSON or CSV.
+
+        Returns:
+            AsyncIterator[str]: Encoded chunks, one per batch of Config.EXPORT_BATCH_SIZE rates.
+        """
+        self.logger.debug(f"Exporting rates as {export_format}")
+        batches = self.controller.stream_rates_async(Config.EXPORT_BATCH_SIZE)
+        return encode_export(batches, export_format, RATE_EXPORT_FIELDS)
 
     def dispose(self) -> None:
             """
             Closes the underlying controller session.
             """
-            self.controller.close_session()
\ No newline at end of file
+            self.controller.close_session()
+
+_service: Optional[RateService] = None
+_service_lock = threading.Lock()
+
+def get_rate_service() -> RateService:
+    """
+    Returns the process-wide rate service, creating it on first use.
+    It holds no request state: within session_scope() its controller works on the request session.
+
+    Returns:
+        RateService: Shared rate service.
+    """
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = RateService()
+    return _service
@@ -1,12 +1,37 @@
+import functools
 import logging
+import uuid
 from pytz import timezone
 from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 
-from app.enums import CurrencyEnum
-from app.controllers import RateController
-from app.services.binance_service import BinanceP2P
-from app.schemas import RateCreate, RateResponse, BinanceResponse
+from app.config import Config
+from app.database.db_config import session_scope
+from app.enums import CurrencyEnum, TradeType, FeedStatus
+from app.controllers import RateController, AdSnapshotController
+from app.services.binance_service import BinanceP2P, published_price
+from app.services.cross_rates_service import get_cross_rate_engine
+from app.services.hot_rates_service import get_hot_rate_store
+from app.services.candles_service import CandleService
+from app.services.ingestion_jobs_service import IngestionJobService
+from app.schemas import RateCreate, RateResponse, BinanceResponse, AdSnapshotCreate, IngestionJobResponse
+
+T = TypeVar("T")
+
+INGESTION_JOB_PREFIX = "ingest:"
+
+def in_session_scope(job: Callable[..., T]) -> Callable[..., T]:
+    """
+    Wraps a scheduler job so every run has its own database session, shared by the
+    controllers it calls. Runs on different executor threads never share a session.
+    """
+    @functools.wraps(job)
+    def run(*args, **kwargs) -> T:
+        with session_scope():
+            return job(*args, **kwargs)
+    return run
 
 class SchedulerService:
     """
@@ -16,7 +41,20 @@ class SchedulerService:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.binance = BinanceP2P()
         self.rate_controller = RateController()
-        self.scheduler = BackgroundScheduler(timezone=timezone('America/Caracas'))
+        self.cross_rates = get_cross_rate_engine()
+        self.candle_service = CandleService()
+        self.ad_snapshot_controller = AdSnapshotController()
+        self.ingestion_jobs = IngestionJobService()
+        self._scheduled_versions: Dict[str, datetime] = {}
+        self.scheduler = BackgroundScheduler(
+            timezone=timezone('America/Caracas'),
+            executors={"default": ThreadPoolExecutor(max_workers=Config.INGESTION_EXECUTOR_WORKERS)},
+            job_defaults={
+                "coalesce": True,
+                "max_instances": Config.INGESTION_JOB_MAX_INSTANCES,
+                "misfire_grace_time": Config.INGESTION_MISFIRE_GRACE_SECONDS
+            }
+        )
     
     def save_binance_rate(self) -> bool:
         """
@@ -26,7 +64,14 @@ class SchedulerService:
             bool: True if the operation was successful, False otherwise.
         """
         try:
-            pair = self.binance.get_usdt_ves_pair()
+            result = self.binance.get_usdt_ves_result()
+            if result.status != FeedStatus.OK:
+                age = f", last good value is {result.age_seconds}s old" if result.pair else ""
+                self.logger.warning(
+                    f"Binance feed {result.status} (circuit {result.circuit_state}){age}, rate not saved"
+                )
+                return False
+            pair = result.pair
             self.logger.info(f"Saving Binance rate: {pair.average_price} {pair.fiat}/{pair.asset}")
             rate = RateCreate(
                 from_currency=CurrencyEnum.USDT,
@@ -34,36 +79,306 @@ class SchedulerService:
                 rate=pair.average_price,
                 timestamp=datetime.now()   
             )
-            self.rate_controller.register_rate(rate)
+            saved = self.rate_controller.register_rate(rate)
+            if saved is not None:
+                get_hot_rate_store().add([saved])
             return True
         except Exception as e:
             self.logger.error(f"Error saving Binance rate: {e}")
             return False
     
+    def build_rates(self, pairs: List[BinanceResponse], timestamp: datetime) -> List[RateCreate]:
+        """
+        Build the rate records for the Binance pairs that returned a published price,
+        one per pair, side and pay method.
+
+        Args:
+            pairs (List[BinanceResponse]): Binance pairs.
+            timestamp (datetime): Timestamp shared by every record of the tick.
+
+        Returns:
+            List[RateCreate]: Rates to be saved.
+        """
+        rates = []
+        for pair in pairs:
+            price = published_price(pair)
+            if price is None:
+                self.logger.warning(f"No price for {pair.asset}/{pair.fiat} {pair.trade_type} {pair.pay_method or ''}, skipping")
+                continue
+            try:
+                rates.append(RateCreate(
+                    from_currency=CurrencyEnum(pair.asset),
+                    to_currency=CurrencyEnum(pair.fiat),
+                    rate=price,
+                    timestamp=timestamp,
+                    trade_type=TradeType(pair.trade_type),
+                    pay_method=pair.pay_method
+                ))
+            except ValueError as e:
+                self.logger.error(f"Unsupported pair {pair.asset}/{pair.fiat} {pair.trade_type}: {e}")
+        return rates
+
+    def build_cross_rates(self, timestamp: datetime) -> List[RateCreate]:
+        """
+        Build the rate records of the configured cross pairs derived from this tick's legs.
+        Cross rates that still depend on an older leg are not persisted.
+
+        Args:
+            timestamp (datetime): Timestamp of the tick.
+
+        Returns:
+            List[RateCreate]: Cross rates to be saved.
+        """
+        rates = []
+        for from_currency, to_currency in Config.CROSS_RATE_PAIRS:
+            quote = self.cross_rates.get_quote(from_currency, to_currency)
+            if quote is None or quote.timestamp < timestamp:
+                self.logger.warning(f"Cross rate {from_currency}/{to_currency} not derivable in this tick")
+                continue
+            rates.append(RateCreate(
+                from_currency=quote.from_currency,
+                to_currency=quote.to_currency,
+                rate=quote.rate,
+                timestamp=timestamp
+            ))
+        return rates
+
+    def build_ad_snapshots(self, pairs: List[BinanceResponse], run_id: str, timestamp: datetime) -> List[AdSnapshotCreate]:
+        """
+        Build the snapshot records of every ad sampled in an ingestion run.
+
+        Args:
+            pairs (List[BinanceResponse]): Binance pairs with their raw ads.
+            run_id (str): Identifier of the ingestion run.
+            timestamp (datetime): Timestamp of the ingestion run.
+
+        Returns:
+            List[AdSnapshotCreate]: Ads to be stored.
+        """
+        return [
+            AdSnapshotCreate(
+                run_id=run_id,
+                captured_at=timestamp,
+                asset=pair.asset,
+                fiat=pair.fiat,
+                trade_type=pair.trade_type,
+                adv_no=ad.adv_no,
+                price=ad.price,
+                tradable_quantity=ad.tradable_quantity,
+                min_limit=ad.min_limit,
+                max_limit=ad.max_limit,
+                pay_methods=",".join(ad.pay_methods) or None,
+                advertiser_id=ad.advertiser_id
+            )
+            for pair in pairs for ad in pair.ads
+        ]
+
+    def ingestion_matrix(self) -> Tuple[List[Tuple[str, str]], List[str], Dict[str, List[str]]]:
+        """
+        Pairs, sides and pay methods of the enabled registry jobs, falling back to the configured ones.
+        The pay methods of the jobs are merged with Config.BINANCE_PAY_METHODS.
+
+        Returns:
+            Tuple[List[Tuple[str, str]], List[str], Dict[str, List[str]]]: (asset, fiat) pairs,
+                trade types and pay methods by fiat.
+        """
+        pay_methods = {fiat: list(methods) for fiat, methods in Config.BINANCE_PAY_METHODS.items()}
+        jobs = self.ingestion_jobs.get_jobs(enabled_only=True).jobs
+        if not jobs:
+            return Config.BINANCE_INGEST_PAIRS, Config.BINANCE_INGEST_SIDES, pay_methods
+        pairs = list(dict.fromkeys((str(job.asset), str(job.fiat)) for job in jobs))
+        sides = list(dict.fromkeys(str(side) for job in jobs for side in job.trade_types))
+        for job in jobs:
+            methods = pay_methods.setdefault(str(job.fiat), [])
+            methods.extend(method for method in job.pay_methods if method not in methods)
+        return pairs, sides, pay_methods
+
+    def save_binance_rates(self) -> bool:
+        """
+        Fetch every registered pair and side concurrently and save them in a single transaction.
+
+        Returns:
+            bool: True if the operation was successful, False otherwise.
+        """
+        try:
+            pairs, sides, pay_methods = self.ingestion_matrix()
+            pairs = self.binance.get_pairs(
+                pairs=pairs, trade_types=sides, pages=Config.BINANCE_PAGES, pay_methods=pay_methods
+            )
+            books = [pair for pair in pairs if not pair.pay_method]
+            timestamp = datetime.now()
+            rates = self.build_rates(pairs, timestamp=timestamp)
+            self.cross_rates.update_from_pairs(books, timestamp=timestamp)
+            rates.extend(self.build_cross_rates(timestamp))
+            if Config.BINANCE_STORE_AD_SNAPSHOTS:
+                run_id = uuid.uuid4().hex
+                stored = self.ad_snapshot_controller.bulk_register(self.build_ad_snapshots(books, run_id, timestamp))
+                self.logger.info(f"Stored {stored} ad snapshots for run {run_id}")
+            if not rates:
+                self.logger.warning("No Binance rates to save")
+                return False
+            saved = self.rate_controller.register_rates(rates)
+            get_hot_rate_store().add(saved)
+            self.logger.info(f"Saved {len(saved)} Binance rates")
+            return len(saved) == len(rates)
+        except Exception as e:
+            self.logger.error(f"Error saving Binance rates: {e}")
+            return False
+    
+    def sample_binance_rates(
+            self,
+            pairs: Optional[List[Tuple[str, str]]] = None,
+            trade_types: Optional[List[str]] = None,
+            pages: Optional[int] = None
+        ) -> bool:
+        """
+        High-frequency sampling of a set of pairs and sides, the configured ones by default.
+        Samples are folded into the 1m, 1h and 1d candles instead of being stored as rates.
+
+        Args:
+            pairs (Optional[List[Tuple[str, str]]]): (asset, fiat) pairs to sample.
+            trade_types (Optional[List[str]]): Trade types to sample.
+            pages (Optional[int]): Order-book pages per pair and side.
+
+        Returns:
+            bool: True if the operation was successful, False otherwise.
+        """
+        try:
+            pairs = self.binance.get_pairs(
+                pairs=pairs or Config.BINANCE_INGEST_PAIRS,
+                trade_types=trade_types or Config.BINANCE_INGEST_SIDES,
+                pages=pages or Config.BINANCE_SAMPLING_PAGES
+            )
+            timestamp = datetime.now()
+            samples = self.build_rates(pairs, timestamp=timestamp)
+            self.cross_rates.update_from_pairs(pairs, timestamp=timestamp)
+            if not samples:
+                self.logger.warning("No Binance samples to record")
+                return False
+            self.candle_service.record_samples(samples)
+            return True
+        except Exception as e:
+            self.logger.error(f"Error sampling Binance rates: {e}")
+            return False
+
+    def run_ingestion_job(self, job: IngestionJobResponse) -> bool:
+        """
+        Run a registry job: sample the whole order book of its pair on every side into the candles.
+        Its pay methods are sampled by the rate snapshots.
+
+        Args:
+            job (IngestionJobResponse): Job to run.
+
+        Returns:
+            bool: True if the operation was successful, False otherwise.
+        """
+        self.logger.debug(f"Running ingestion job {job.name}")
+        return self.sample_binance_rates(
+            pairs=[(str(job.asset), str(job.fiat))],
+            trade_types=[str(side) for side in job.trade_types],
+            pages=job.pages
+        )
+
+    def sync_ingestion_jobs(self) -> int:
+        """
+        Reconcile the scheduled ingestion jobs with the enabled jobs of the registry.
+        New or changed jobs are (re)scheduled, disabled or deleted ones are removed.
+
+        Returns:
+            int: Number of ingestion jobs scheduled after the sync.
+        """
+        jobs = self.ingestion_jobs.get_jobs(enabled_only=True).jobs
+        wanted = {f"{INGESTION_JOB_PREFIX}{job.id}": job for job in jobs}
+
+        for job_id in list(self._scheduled_versions):
+            if job_id not in wanted:
+                self.scheduler.remove_job(job_id)
+                del self._scheduled_versions[job_id]
+                self.logger.info(f"Removed ingestion job {job_id}")
+
+        for job_id, job in wanted.items():
+            if self._scheduled_versions.get(job_id) == job.updated_at:
+                continue
+            jitter = Config.INGESTION_JOB_JITTER_SECONDS if job.jitter_seconds is None else job.jitter_seconds
+            self.scheduler.add_job(
+                func=in_session_scope(self.run_ingestion_job),
+                args=[job],
+                trigger="interval",
+                seconds=job.interval_seconds,
+                jitter=jitter or None,
+                id=job_id,
+                name=f"Ingest {job.name}",
+                replace_existing=True,
+                )
+            self._scheduled_versions[job_id] = job.updated_at
+            self.logger.info(f"Scheduled ingestion job {job.name} every {job.interval_seconds}s")
+        return len(wanted)
+
+    def prune_candles(self) -> int:
+        """
+        Delete the 1m candles older than the retention window.
+
+        Returns:
+            int: Number of candles deleted.
+        """
+        return self.candle_service.prune_minute_candles(Config.CANDLE_MINUTE_RETENTION_DAYS)
+
     def scheduler_jobs(self):
         """
         Scheduler jobs.
         """
         self.scheduler.add_job(
-            func=self.save_binance_rate, 
+            func=in_session_scope(self.save_binance_rates), 
             trigger="cron",
             hour="0,6,12,18",
             minute="0",
             second="0",
-            id="save_binance_rate", 
-            name="Save Binance rate", 
+            id="save_binance_rates", 
+            name="Save Binance rates", 
+            )
+        self.scheduler.add_job(
+            func=in_session_scope(self.prune_candles),
+            trigger="cron",
+            hour="3",
+            minute="30",
+            id="prune_candles",
+            name="Prune minute candles",
+            )
+        with session_scope():
+            self.ingestion_jobs.seed_jobs()
+            self.sync_ingestion_jobs()
+        self.scheduler.add_job(
+            func=in_session_scope(self.sync_ingestion_jobs),
+            trigger="interval",
+            seconds=Config.INGESTION_JOBS_REFRESH_SECONDS,
+            id="sync_ingestion_jobs",
+            name="Sync ingestion jobs",
             )
     
     def start_scheduler(self):
         """
-        Start the scheduler.
+        Start the scheduler, or resume it if it was paused.
         """
+        if self.scheduler.running:
+            self.logger.info("Resuming scheduler...")
+            self.scheduler.resume()
+            self.sync_ingestion_jobs()
+            return
         self.logger.info("Starting scheduler...")
         self.scheduler_jobs()
         self.scheduler.start()
+
+    def pause_scheduler(self):
+        """
+        Pause the scheduler, running jobs are allowed to finish.
+        """
+        if self.scheduler.running:
+            self.logger.info("Pausing scheduler...")
+            self.scheduler.pause()
     
     def stop_scheduler(self):
         """
         Stop the scheduler.
         """
-        self.scheduler.shutdown()
\ No newline at end of file
+        if self.scheduler.running:
+            self.scheduler.shutdown()
\ No newline at end of file
@@ -2,13 +2,18 @@
 Module for users service and business logic
 """
 import logging
-from typing import Optional
+import threading
+from typing import AsyncIterator, Optional
 from datetime import date, datetime, timedelta
 
-from app.schemas import UserCreate, UserResponse, UserUpdate, UserListResponse, UserLogin
+from app.schemas import UserCreate, UserResponse, UserUpdate, UserListResponse, UserLogin, PageCursor
 from app.services.security_service import SecurityService
 from app.controllers import UserController
-from app.enums import UserRole
+from app.enums import UserRole, ExportFormat
+from app.config import Config
+from app.services.export_service import encode_export
+
+USER_EXPORT_FIELDS = tuple(field for field in UserResponse.model_fields if field != "password_hash")
 
 class UserService:
     """
@@ -126,6 +131,33 @@ class UserService:
         """
         self.logger.debug("Retrieving all users")
         return self.controller.get_all_users()
+
+    def get_users_page(self, limit: int, after: Optional[PageCursor] = None) -> UserListResponse:
+        """
+        Get a page of users in registration order.
+
+        Args:
+            limit (int): Maximum number of users in the page.
+            after (Optional[PageCursor]): Cursor of the previous page, None for the first one.
+
+        Returns:
+            UserListResponse: Page of users, with the cursor of the next page if any.
+        """
+        return self.controller.get_users_page(limit, after)
+
+    def export_users(self, export_format: ExportFormat) -> AsyncIterator[str]:
+        """
+        Export every user as a stream of chunks, without the password hashes.
+
+        Args:
+            export_format (ExportFormat): NDJSON or CSV.
+
+        Returns:
+            AsyncIterator[str]: Encoded chunks, one per batch of Config.EXPORT_BATCH_SIZE users.
+        """
+        self.logger.debug(f"Exporting users as {export_format}")
+        batches = self.controller.stream_users_async(Config.EXPORT_BATCH_SIZE)
+        return encode_export(batches, export_format, USER_EXPORT_FIELDS)
     
     def get_user_register_last_month(self) -> UserListResponse:
         """
@@ -297,4 +329,22 @@ class UserService:
         Closes the underlying controller session.
         """
         self.controller.close_session()
-        self.logger.debug("Controller session closed.")
\ No newline at end of file
+        self.logger.debug("Controller session closed.")
+
+_service: Optional[UserService] = None
+_service_lock = threading.Lock()
+
+def get_user_service() -> UserService:
+    """
+    Returns the process-wide user service, creating it on first use.
+    It holds no request state: within session_scope() its controller works on the request session.
+
+    Returns:
+        UserService: Shared user service.
+    """
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = UserService()
+    return _service
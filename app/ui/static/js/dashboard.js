@@ -29,6 +29,30 @@ document.addEventListener('DOMContentLoaded', async () => {
     await loadUsers();
 });
 
+// Recorre las páginas de un listado siguiendo next_cursor, devuelve null si la sesión expiró
+async function fetchAllPages(url, key, token) {
+    const items = [];
+    let cursor = null;
+    do {
+        const params = new URLSearchParams({ limit: 1000 });
+        if (cursor) params.set('after', cursor);
+        const response = await fetch(`${url}?${params}`, {
+            headers: { 'Authorization': `Bearer ${token}` }
+        });
+
+        if (response.status === 401 || response.status === 403) {
+            logout();
+            return null;
+        }
+        if (!response.ok) break;
+
+        const page = await response.json(); // { count, <key>: [...], next_cursor }
+        items.push(...page[key]);
+        cursor = page.next_cursor;
+    } while (cursor);
+    return items;
+}
+
 // Carga de usuarios
 async function loadUsers() {
     const token = localStorage.getItem('access_token');
@@ -38,20 +62,10 @@ async function loadUsers() {
     }
 
     try {
-        const response = await fetch('/api/v1/admin/all_users', {
-            headers: { 'Authorization': `Bearer ${token}` }
-        });
+        const usersList = await fetchAllPages('/api/v1/admin/all_users', 'users', token);
+        if (usersList === null) return;
 
-        if (response.status === 401 || response.status === 403) {
-            logout();
-            return;
-        }
-
-        const data = await response.json(); // 'data' es el diccionario {count: 3, users: [...]}
         const tableBody = document.getElementById('users-table-body');
-        
-        // Accedemos a la lista dentro del diccionario
-        const usersList = data.users; 
 
         if (usersList && usersList.length > 0) {
             // Dentro de loadUsers, al mapear los usuarios:
@@ -95,20 +109,11 @@ async function loadUsers() {
 async function loadRates() {
     const token = localStorage.getItem('access_token');
     try {
-        const response = await fetch('/api/v1/rates/all', {
-            headers: { 'Authorization': `Bearer ${token}` }
-        });
-
-        if (response.status === 401 || response.status === 403) {
-            logout();
-            return;
-        }
+        const rates = await fetchAllPages('/api/v1/rates/all', 'rates', token);
+        if (rates === null) return;
 
-        const data = await response.json(); // { count: 4, rates: [...] }
         const tableBody = document.getElementById('rates-table-body');
-        
-        // Accedemos a la lista 'rates'
-        const ratesList = data.rates.sort((a, b) => b.id - a.id);
+        const ratesList = rates.sort((a, b) => b.id - a.id);
 
         if (ratesList && ratesList.length > 0) {
             tableBody.innerHTML = ratesList.map(rate => {
@@ -0,0 +1,71 @@
+"""
+Standalone ingestion worker.
+
+Runs the scheduler and the Binance pipeline outside the API process, so sampling
+never competes with request handling. Start the API with INGESTION_ENABLED=false
+and run `westcambios-worker` next to it.
+"""
+import logging
+import os
+import signal
+import threading
+
+from app.config import Config
+from app.database.db_config import init_db
+from app.database.db_writer import get_db_writer
+from app.services import SchedulerService, LeaderElection
+
+
+def setup_logging() -> None:
+    """
+    Configure the worker logs, on the console and in logs/worker.log.
+    """
+    Config.create_dirs()
+    logging.basicConfig(
+        level=Config.LOG_LEVEL,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        handlers=[
+            logging.StreamHandler(),
+            logging.FileHandler(os.path.join(Config.LOGS_PATH, "worker.log"), encoding="utf-8"),
+        ]
+    )
+
+
+def run_worker() -> None:
+    """
+    Run the ingestion worker until SIGINT or SIGTERM.
+    Several workers can run at once, the scheduler lease keeps a single one ingesting.
+    """
+    setup_logging()
+    init_db(instance_path=Config.INSTANCE_PATH)
+
+    scheduler = SchedulerService()
+    election = LeaderElection(
+        "scheduler",
+        on_elected=scheduler.start_scheduler,
+        on_demoted=scheduler.pause_scheduler
+    )
+    stop = threading.Event()
+
+    def handle_signal(signum, frame):
+        logging.info(f"Received signal {signum}, stopping worker")
+        stop.set()
+
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+
+    logging.info(f"Starting ingestion worker {election.holder}")
+    election.start()
+    try:
+        while not stop.wait(1):
+            pass
+    finally:
+        election.stop()
+        scheduler.stop_scheduler()
+        get_db_writer().stop()
+        logging.info("Ingestion worker stopped")
+
+
+if __name__ == "__main__":
+    run_worker()
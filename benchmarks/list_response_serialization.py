@@ -0,0 +1,103 @@
+"""
+Time to serve large list responses through FastAPI, default pipeline vs PydanticJSONResponse.
+
+- default: the route returns the model, FastAPI validates it against the response_model,
+  dumps it to Python dicts and renders them with json.dumps().
+- pydantic-json: the route returns PydanticJSONResponse(model), pydantic-core renders the bytes.
+
+Both routes are called through the ASGI interface, with the same prebuilt response.
+
+Usage:
+    SECRET_KEY=x python -m benchmarks.list_response_serialization [--rows 100000] [--repeat 3]
+"""
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+
+from fastapi import FastAPI
+
+from app.api.responses import PydanticJSONResponse
+from app.enums import UserRole
+from app.schemas import RateListResponse, RateResponse, UserListResponse, UserResponse
+
+def rate_list(rows: int) -> RateListResponse:
+    start = datetime(2025, 1, 1)
+    rates = [
+        RateResponse(
+            id=i, from_currency="USDT", to_currency="VES", rate=500.0 + i % 100,
+            timestamp=start + timedelta(minutes=i), trade_type="BUY" if i % 2 else "SELL", pay_method="PagoMovil"
+        )
+        for i in range(rows)
+    ]
+    return RateListResponse(count=rows, rates=rates)
+
+def user_list(rows: int) -> UserListResponse:
+    start = datetime(2025, 1, 1)
+    users = [
+        UserResponse(
+            id=i, email=f"user{i}@example.com", username=f"user{i}", password_hash="x" * 60,
+            is_active=True, role=UserRole.CLIENT, created_at=start + timedelta(minutes=i)
+        )
+        for i in range(rows)
+    ]
+    return UserListResponse(count=rows, users=users)
+
+def build_app(rates: RateListResponse, users: UserListResponse) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/default/rates", response_model=RateListResponse)
+    async def default_rates():
+        return rates
+
+    @app.get("/fast/rates", response_model=RateListResponse)
+    async def fast_rates():
+        return PydanticJSONResponse(rates)
+
+    @app.get("/default/users", response_model=UserListResponse)
+    async def default_users():
+        return users
+
+    @app.get("/fast/users", response_model=UserListResponse)
+    async def fast_users():
+        return PydanticJSONResponse(users)
+
+    return app
+
+async def get(app: FastAPI, path: str) -> bytes:
+    sent = []
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+    async def send(message):
+        sent.append(message)
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": path, "raw_path": path.encode(), "query_string": b"", "headers": [], "root_path": "",
+        "client": ("bench", 0), "server": ("bench", 80)
+    }
+    await app(scope, receive, send)
+    return b"".join(message.get("body", b"") for message in sent[1:])
+
+def measure(app: FastAPI, path: str, repeat: int) -> bytes:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = asyncio.run(get(app, path))
+        best = min(best, time.perf_counter() - started)
+    print(f"{path:<16} bytes={len(body):>10} best={best * 1000:>8.1f} ms")
+    return body
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    app = build_app(rate_list(args.rows), user_list(args.rows))
+    for resource in ("rates", "users"):
+        default = measure(app, f"/default/{resource}", args.repeat)
+        fast = measure(app, f"/fast/{resource}", args.repeat)
+        assert json.loads(default) == json.loads(fast)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Rows per second of the rate list reads, from SQLite to RateResponse models.
+
+- orm: full ORM entities, then RateResponse.model_validate(from_attributes) per row,
+  the read path before RateController used column projections.
+- columns+adapter: rate_columns() projection validated in bulk by a TypeAdapter,
+  the current read path of RateController.
+- columns+construct: typed column projection, RateResponse.model_construct() per row, no validation.
+- hot-store: HotRateStore.get_range() over the whole window, the read path of the period endpoints.
+
+Usage:
+    SECRET_KEY=x python -m benchmarks.rates_read_path [--rows 100000] [--repeat 3]
+"""
+import argparse
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, List
+
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.controllers.rates_controller import rate_columns, rate_responses
+from app.database.db_base import Base
+from app.database.db_config import create_sqlite_engine
+from app.database.models import RatesDatabaseModel
+from app.schemas import RateResponse
+from app.services.hot_rates_service import HotRateStore
+
+START = datetime(2025, 1, 1)
+
+def seed(engine, rows: int) -> None:
+    start = START
+    with engine.begin() as conn:
+        conn.execute(insert(RatesDatabaseModel), [
+            {
+                "from_currency": "USDT", "to_currency": "VES", "rate": 500.0 + i % 100,
+                "timestamp": start + timedelta(minutes=i), "trade_type": "BUY" if i % 2 else "SELL"
+            }
+            for i in range(rows)
+        ])
+
+def orm(session: Session) -> List[RateResponse]:
+    return [RateResponse.model_validate(rate) for rate in session.scalars(select(RatesDatabaseModel)).all()]
+
+def columns_adapter(session: Session) -> List[RateResponse]:
+    return rate_responses(session.execute(select(*rate_columns())).all())
+
+def columns_construct(session: Session) -> List[RateResponse]:
+    query = select(*RatesDatabaseModel.__table__.c)
+    return [RateResponse.model_construct(**row) for row in session.execute(query).mappings()]
+
+def hot_store(engine) -> Callable[[Session], List[RateResponse]]:
+    store = HotRateStore(window_days=(date.today() - START.date()).days, sync_seconds=3600)
+    with Session(engine) as session:
+        store.sync(columns_adapter(session))
+    return lambda session: store.get_range(START, datetime.now())
+
+def measure(name: str, read: Callable[[Session], List[RateResponse]], engine, repeat: int) -> None:
+    best = float("inf")
+    for _ in range(repeat):
+        with Session(engine) as session:
+            started = time.perf_counter()
+            rates = read(session)
+            best = min(best, time.perf_counter() - started)
+    print(f"{name:<18} rows={len(rates):>8} best={best * 1000:>8.1f} ms rows/s={len(rates) / best:>12.0f}")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_sqlite_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        seed(engine, args.rows)
+        measure("orm", orm, engine, args.repeat)
+        measure("columns+adapter", columns_adapter, engine, args.repeat)
+        measure("columns+construct", columns_construct, engine, args.repeat)
+        measure("hot-store", hot_store(engine), engine, args.repeat)
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Concurrent read throughput of the rates table while the ingestion is writing.
+
+Compares the SQLite defaults (rollback journal, synchronous=FULL) with the profile
+of app.database.db_config.sqlite_pragmas(). A writer thread upserts batches of
+rates like the scheduler does, while reader threads run the latest-rates query of the
+/rates endpoints.
+
+Usage:
+    SECRET_KEY=x python -m benchmarks.sqlite_concurrency [--seconds 5] [--readers 4] [--rows 20000]
+"""
+import argparse
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.exc import OperationalError
+
+from app.database.db_base import Base
+from app.database.db_config import create_sqlite_engine, sqlite_pragmas
+from app.database.migrations import run_migrations
+from app.database.models import RatesDatabaseModel, rates_natural_key
+
+DEFAULT_PROFILE = {"journal_mode": "DELETE", "synchronous": "FULL", "busy_timeout": 5000}
+
+def seed(engine, rows: int) -> datetime:
+    start = datetime(2025, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(insert(RatesDatabaseModel), [
+            {
+                "from_currency": "USDT", "to_currency": "VES", "rate": 500.0 + i % 100,
+                "timestamp": start + timedelta(minutes=i), "trade_type": "BUY" if i % 2 else "SELL"
+            }
+            for i in range(rows)
+        ])
+    return start
+
+def run_profile(name: str, pragmas: dict, seconds: float, readers: int, rows: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_sqlite_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", pragmas=pragmas)
+        Base.metadata.create_all(engine)
+        run_migrations(engine)
+        start = seed(engine, rows)
+        stop = threading.Event()
+        counts = {"reads": 0, "writes": 0, "read_errors": 0, "write_errors": 0}
+        lock = threading.Lock()
+
+        def writer():
+            tick = start + timedelta(minutes=rows)
+            while not stop.is_set():
+                tick += timedelta(minutes=1)
+                stmt = insert(RatesDatabaseModel).values([
+                    {"from_currency": "USDT", "to_currency": fiat, "rate": 1.0, "timestamp": tick, "trade_type": side}
+                    for fiat in ("VES", "BRL", "COP", "PEN") for side in ("BUY", "SELL")
+                ])
+                stmt = stmt.on_conflict_do_update(index_elements=rates_natural_key(), set_={"rate": stmt.excluded.rate})
+                try:
+                    with engine.begin() as conn:
+                        conn.execute(stmt)
+                    key = "writes"
+                except OperationalError:
+                    key = "write_errors"
+                with lock:
+                    counts[key] += 1
+
+        def reader():
+            query = select(RatesDatabaseModel).where(
+                RatesDatabaseModel.from_currency == "USDT",
+                RatesDatabaseModel.to_currency == "VES"
+            ).order_by(RatesDatabaseModel.timestamp.desc()).limit(30)
+            while not stop.is_set():
+                try:
+                    with engine.connect() as conn:
+                        conn.execute(query).all()
+                    key = "reads"
+                except OperationalError:
+                    key = "read_errors"
+                with lock:
+                    counts[key] += 1
+
+        threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(readers)]
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        with engine.connect() as conn:
+            journal = conn.execute(text("PRAGMA journal_mode")).scalar()
+        engine.dispose()
+
+    print(
+        f"{name:<8} journal={journal:<6} reads/s={counts['reads'] / seconds:>9.1f} "
+        f"writes/s={counts['writes'] / seconds:>8.1f} "
+        f"errors(read/write)={counts['read_errors']}/{counts['write_errors']}"
+    )
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--rows", type=int, default=20000)
+    args = parser.parse_args()
+    run_profile("default", DEFAULT_PROFILE, args.seconds, args.readers, args.rows)
+    run_profile("tuned", sqlite_pragmas(), args.seconds, args.readers, args.rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+from datetime import datetime
+from app.controllers import AdSnapshotController
+from app.database.models import AdSnapshotsDatabaseModel
+from app.schemas import AdSnapshotCreate
+
+def test_bulk_register_single_commit(db_session):
+    """The ads of a run are stored with one insert and one commit."""
+    controller = AdSnapshotController()
+    controller.session = db_session
+    now = datetime.now()
+    snapshots = [
+        AdSnapshotCreate(
+            run_id="run-1", captured_at=now, asset="USDT", fiat="VES", trade_type="BUY",
+            price=500.0 + i, tradable_quantity=10.0, pay_methods="PagoMovil"
+        )
+        for i in range(300)
+    ]
+
+    commits = []
+    original_commit = db_session.commit
+    db_session.commit = lambda: commits.append(1) or original_commit()
+
+    assert controller.bulk_register(snapshots) == 300
+    assert len(commits) == 1
+    assert db_session.query(AdSnapshotsDatabaseModel).filter_by(run_id="run-1").count() == 300
@@ -1,6 +1,11 @@
 import pytest
+import threading
+import time
 from unittest.mock import MagicMock, patch
+from app.config import Config
 from app.services.binance_service import BinanceP2P
+from app.services.circuit_breaker_service import CircuitBreaker
+from app.services.rate_limiter_service import TokenBucket
 from app.schemas import BinanceRequest, BinanceResponse
 
 class TestBinanceP2PService:
@@ -57,15 +62,160 @@ class TestBinanceP2PService:
 
     def test_get_pair(self):
         """
-        Test de integración (o mockeado) de get_pair.
+        Test de get_pair con la respuesta de Binance mockeada, sin red ni breaker o limiter globales.
         """
-        # Aquí usamos datos reales o mockeamos la respuesta de la red
-        pair = self.service.get_usdt_ves_pair()
-        
-        if pair: # Si Binance respondió correctamente
-            assert isinstance(pair, BinanceResponse)
-            assert pair.fiat == "VES"
-            assert pair.asset == "USDT"
-            # En BinanceResponse definiste trade_type (snake_case)
-            assert pair.trade_type == "BUY"
-            assert isinstance(pair.average_price, (float, type(None)))
\ No newline at end of file
+        response = MagicMock()
+        response.json.return_value = {
+            "code": "000000",
+            "data": [
+                {"adv": {"advNo": "a", "price": "100.0", "tradableQuantity": "10"}},
+                {"adv": {"advNo": "b", "price": "102.0", "tradableQuantity": "10"}}
+            ]
+        }
+        client = MagicMock()
+        client.post.return_value = response
+        service = BinanceP2P(client=client, breaker=CircuitBreaker("test"), limiter=TokenBucket(rate=100, burst=10))
+
+        with patch.object(service, "remember_pair"):
+            pair = service.get_usdt_ves_pair()
+
+        assert client.post.call_count == Config.BINANCE_PAGES
+        assert isinstance(pair, BinanceResponse)
+        assert pair.fiat == "VES"
+        assert pair.asset == "USDT"
+        assert pair.trade_type == "BUY"
+        assert pair.average_price == 101.0
+        assert service.breaker.state == "closed"
+
+    def test_fetch_pages_merges_and_deduplicates(self):
+        """
+        Verifica que las páginas se pidan todas y que los anuncios repetidos se descarten.
+        """
+        def fake_request(req):
+            return {
+                "code": "000000",
+                "data": [
+                    {"adv": {"advNo": f"{req.page}-a", "price": str(100 + req.page)}},
+                    {"adv": {"advNo": "shared", "price": "50.0"}},
+                ]
+            }
+
+        with patch.object(self.service, "do_request", side_effect=fake_request) as mocked:
+            pages = self.service.fetch_pages(fiat="VES", asset="USDT", trade_type="BUY", pages=3)
+            merged = self.service.merge_pages(pages)
+
+        assert mocked.call_count == 3
+        prices = self.service.colect_prices(merged, fiat="VES")
+        assert sorted(prices) == [50.0, 101.0, 102.0, 103.0]
+
+    def test_get_pair_multiple_pages(self):
+        """
+        Verifica que get_pair calcule las estadísticas sobre todas las páginas.
+        """
+        def fake_request(req):
+            return {"code": "000000", "data": [{"adv": {"advNo": str(req.page), "price": str(req.page * 10)}}]}
+
+        with patch.object(self.service, "do_request", side_effect=fake_request):
+            pair = self.service.get_pair(fiat="VES", pages=3)
+
+        assert pair.prices == [10.0, 20.0, 30.0]
+        assert pair.median_price == 20.0
+
+    def test_get_pairs_matrix(self):
+        """
+        Verifica que se consulte cada par en cada lado y se descarten los fallos.
+        """
+        def fake_data(fiat, asset, trade_type, rows, pages, pay_types=None):
+            if fiat == "COP":
+                return None
+            return {"code": "000000", "data": [{"adv": {"price": "1.0", "tradableQuantity": "10"}}]}
+
+        with patch.object(self.service, "fetch_pair_data", side_effect=fake_data) as mocked:
+            pairs = self.service.get_pairs(
+                pairs=[("USDT", "VES"), ("USDT", "BRL"), ("USDT", "COP")],
+                trade_types=["BUY", "SELL"]
+            )
+
+        assert mocked.call_count == 6
+        assert [(p.fiat, p.trade_type) for p in pairs] == [
+            ("VES", "BUY"), ("VES", "SELL"), ("BRL", "BUY"), ("BRL", "SELL")
+        ]
+        assert all(p.weighted_price == 1.0 for p in pairs)
+
+    def test_get_pairs_pay_method_fan_out(self):
+        """
+        Verifica que cada método de pago se consulte aparte, filtrado con payTypes.
+        """
+        def fake_data(fiat, asset, trade_type, rows, pages, pay_types=None):
+            price = "2.0" if pay_types == ["PIX"] else "1.0"
+            return {"code": "000000", "data": [{"adv": {"price": price, "tradableQuantity": "10"}}]}
+
+        with patch.object(self.service, "fetch_pair_data", side_effect=fake_data) as mocked:
+            pairs = self.service.get_pairs(
+                pairs=[("USDT", "BRL"), ("USDT", "VES")],
+                trade_types=["BUY"],
+                pay_methods={"BRL": ["PIX"]}
+            )
+
+        assert mocked.call_count == 3
+        assert [(p.fiat, p.pay_method, p.average_price) for p in pairs] == [
+            ("BRL", None, 1.0), ("BRL", "PIX", 2.0), ("VES", None, 1.0)
+        ]
+
+    def test_get_pairs_bounded_by_the_http_pool(self, monkeypatch):
+        """
+        Verifica que los pares en vuelo por sus páginas no superen el pool HTTP.
+        """
+        monkeypatch.setattr(Config, "HTTP_POOL_SIZE", 4)
+        monkeypatch.setattr(Config, "BINANCE_MAX_WORKERS", 2)
+        lock, active, peak = threading.Lock(), [0], [0]
+
+        def fake_data(fiat, asset, trade_type, rows, pages, pay_types=None):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return {"code": "000000", "data": [{"adv": {"price": "1.0", "tradableQuantity": "10"}}]}
+
+        with patch.object(self.service, "fetch_pair_data", side_effect=fake_data), \
+                patch.object(self.service, "remember_pair"):
+            pairs = self.service.get_pairs(
+                pairs=[("USDT", fiat) for fiat in ("VES", "BRL", "COP", "ARS", "PEN")],
+                trade_types=["BUY", "SELL"],
+                pages=3
+            )
+
+        assert len(pairs) == 10
+        assert peak[0] == 2
+
+    def test_colect_ads(self):
+        """
+        Verifica que se conserven cantidad, límites, métodos de pago y anunciante de cada anuncio.
+        """
+        mock_data = {
+            "code": "000000",
+            "data": [
+                {
+                    "adv": {
+                        "advNo": "1",
+                        "price": "35.5",
+                        "tradableQuantity": "120.5",
+                        "minSingleTransAmount": "500",
+                        "maxSingleTransAmount": "10000",
+                        "tradeMethods": [{"identifier": "PagoMovil"}, {"identifier": "BANK"}]
+                    },
+                    "advertiser": {"userNo": "abc"}
+                },
+                {"adv": {"advNo": "2"}}
+            ]
+        }
+
+        ads = self.service.colect_ads(mock_data)
+
+        assert len(ads) == 1
+        assert ads[0].tradable_quantity == 120.5
+        assert ads[0].max_limit == 10000
+        assert ads[0].pay_methods == ["PagoMovil", "BANK"]
+        assert ads[0].advertiser_id == "abc"
@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta
+from app.controllers import CandleController
+from app.enums import CurrencyEnum, TradeType, CandleResolution
+from app.schemas import RateCreate
+
+def make_sample(rate: float, timestamp: datetime) -> RateCreate:
+    return RateCreate(
+        from_currency=CurrencyEnum.USDT,
+        to_currency=CurrencyEnum.VES,
+        rate=rate,
+        timestamp=timestamp,
+        trade_type=TradeType.BUY
+    )
+
+def test_candles_are_updated_incrementally(db_session):
+    """Samples of the same period are merged into one OHLC candle per resolution."""
+    controller = CandleController()
+    controller.session = db_session
+    start = datetime(2025, 1, 10, 12, 30, 5)
+
+    controller.register_samples([make_sample(100.0, start)])
+    controller.register_samples([make_sample(104.0, start + timedelta(seconds=20))])
+    controller.register_samples([make_sample(98.0, start + timedelta(seconds=40))])
+    controller.register_samples([make_sample(101.0, start + timedelta(minutes=1))])
+
+    minutes = controller.get_candles("USDT", "VES", CandleResolution.MINUTE, start, start + timedelta(hours=1))
+    assert minutes.count == 2
+    first = minutes.candles[0]
+    assert (first.open, first.high, first.low, first.close, first.count) == (100.0, 104.0, 98.0, 98.0, 3)
+    assert first.average == (100.0 + 104.0 + 98.0) / 3
+
+    hours = controller.get_candles("USDT", "VES", CandleResolution.HOUR, start, start + timedelta(hours=1))
+    assert hours.count == 1
+    assert hours.candles[0].close == 101.0
+    assert hours.candles[0].count == 4
+
+def test_out_of_order_sample_keeps_close(db_session):
+    """A late sample updates high/low but never the close of the period."""
+    controller = CandleController()
+    controller.session = db_session
+    start = datetime(2025, 1, 10, 12, 0, 30)
+
+    controller.register_samples([make_sample(100.0, start)], [CandleResolution.DAY])
+    controller.register_samples([make_sample(90.0, start - timedelta(seconds=10))], [CandleResolution.DAY])
+
+    day = controller.get_candles("USDT", "VES", CandleResolution.DAY, start, start).candles[0]
+    assert day.close == 100.0
+    assert day.low == 90.0
@@ -0,0 +1,76 @@
+import time
+from unittest.mock import MagicMock, patch
+import requests
+
+from app.enums import CircuitState, FeedStatus
+from app.services.binance_service import BinanceP2P
+from app.services.circuit_breaker_service import CircuitBreaker
+from app.schemas import BinanceResponse
+
+def test_breaker_opens_and_probes():
+    """The circuit opens after the threshold and lets a single probe through after the timeout."""
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow_request()
+
+    time.sleep(0.06)
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow_request()
+
+def test_open_circuit_skips_upstream():
+    """While the circuit is open do_request returns None without calling Binance."""
+    client = MagicMock()
+    client.post.side_effect = requests.ConnectionError("down")
+    service = BinanceP2P(client=client, breaker=CircuitBreaker("test", failure_threshold=2, reset_timeout=60))
+    req = service.build_request(fiat="VES", page=1, rows=10, trade_type="BUY", asset="USDT")
+
+    for _ in range(5):
+        assert service.do_request(req) is None
+    assert client.post.call_count == 2
+
+def test_degraded_result_carries_last_good_pair():
+    """When Binance fails the feed result falls back to the last good pair and its age."""
+    service = BinanceP2P(breaker=CircuitBreaker("test", failure_threshold=1, reset_timeout=60))
+    good = BinanceResponse(fiat="PEN", asset="USDT", trade_type="SELL", average_price=3.7)
+
+    with patch.object(service, "get_pair", return_value=None):
+        assert service.get_pair_result(fiat="PEN", trade_type="SELL").status == FeedStatus.UNAVAILABLE
+
+    service.remember_pair(good)
+    with patch.object(service, "get_pair", return_value=None):
+        result = service.get_pair_result(fiat="PEN", trade_type="SELL")
+
+    assert result.status == FeedStatus.DEGRADED
+    assert result.pair.average_price == 3.7
+    assert result.age_seconds >= 0
+
+def test_breaker_is_checked_before_the_rate_limiter():
+    """An open circuit takes no rate limit token, and a probe that got no token is given back."""
+    client, limiter = MagicMock(), MagicMock()
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.05)
+    service = BinanceP2P(client=client, breaker=breaker, limiter=limiter)
+    req = service.build_request(fiat="VES", page=1, rows=10, trade_type="BUY", asset="USDT")
+
+    breaker.record_failure()
+    assert service.do_request(req) is None
+    limiter.acquire.assert_not_called()
+
+    time.sleep(0.06)
+    limiter.acquire.return_value = False
+    assert service.do_request(req) is None
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow_request()
+    client.post.assert_not_called()
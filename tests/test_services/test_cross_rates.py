@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from app.config import Config
+from app.services import cross_rates_service
+from app.services.cross_rates_service import CrossRateEngine
+from app.schemas import BinanceResponse
+
+def make_pair(fiat: str, trade_type: str, price: float) -> BinanceResponse:
+    return BinanceResponse(fiat=fiat, asset="USDT", trade_type=trade_type, average_price=price)
+
+def test_brl_ves_cross_rate():
+    """BRL->VES = USDT/VES BUY / USDT/BRL SELL, minus the margin."""
+    engine = CrossRateEngine(margin=0.02, source_side="SELL", target_side="BUY")
+    engine.update_from_pairs([
+        make_pair("VES", "BUY", 500.0),
+        make_pair("VES", "SELL", 490.0),
+        make_pair("BRL", "BUY", 5.5),
+        make_pair("BRL", "SELL", 5.0),
+    ])
+
+    quote = engine.get_quote("BRL", "VES")
+    assert quote.via == "USDT"
+    assert quote.raw_rate == 100.0
+    assert quote.rate == 98.0
+
+    inverse = engine.get_quote("VES", "BRL")
+    assert inverse.raw_rate == 5.5 / 490.0
+    assert len(engine.get_all()) == 2
+
+def test_missing_leg_and_stale_update():
+    """A pair without both legs is not derived and older legs never overwrite newer ones."""
+    engine = CrossRateEngine(margin=0.0, source_side="SELL", target_side="BUY")
+    now = datetime.now()
+    engine.update_legs([("USDT", "VES", "BUY", 500.0, now)])
+    assert engine.get_quote("BRL", "VES") is None
+
+    engine.update_legs([
+        ("USDT", "BRL", "SELL", 5.0, now),
+        ("USDT", "VES", "BUY", 400.0, now - timedelta(hours=1)),
+    ])
+    assert engine.get_quote("BRL", "VES").rate == 100.0
+
+def test_shared_engine_reloads_when_idle():
+    """Without in-process updates, the shared engine reloads its legs from the database."""
+    engine = CrossRateEngine()
+    engine.updated_at -= Config.CROSS_RATE_REFRESH_SECONDS + 1
+    with patch.object(cross_rates_service, "_engine", engine), \
+            patch.object(engine, "load_from_db") as load:
+        assert cross_rates_service.get_cross_rate_engine() is engine
+        load.assert_called_once()
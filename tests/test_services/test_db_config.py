@@ -0,0 +1,37 @@
+from sqlalchemy import text
+
+from app.config import Config
+from app.database.db_config import create_sqlite_engine
+
+def test_sqlite_profile_applied_on_connect(tmp_path):
+    """Every pooled connection runs with the configured SQLite profile."""
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar().upper() == Config.SQLITE_JOURNAL_MODE.upper()
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == Config.SQLITE_BUSY_TIMEOUT_MS
+        assert conn.execute(text("PRAGMA cache_size")).scalar() == Config.SQLITE_CACHE_SIZE
+        assert conn.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+    assert engine.pool.size() == Config.DATABASE_POOL_SIZE
+    engine.dispose()
+
+def test_in_memory_engine_skips_file_pragmas():
+    """In-memory databases keep their own journal and pool."""
+    engine = create_sqlite_engine("sqlite://")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "memory"
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == Config.SQLITE_BUSY_TIMEOUT_MS
+    engine.dispose()
+
+def test_session_scope_shared_by_controllers():
+    """Controllers used within a request scope share its session, and keep their own outside of it."""
+    from app.controllers import RateController, UserController
+    from app.database.db_config import session_scope
+    rates, users = RateController(), UserController()
+    with session_scope() as session:
+        assert rates.session is session
+        assert users.session is session
+    assert rates.session is not session
+    assert rates.session is not users.session
+    rates.close_session()
+    users.close_session()
@@ -0,0 +1,128 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+import app.controllers.base_controller as base_controller
+from app.controllers import UserController
+from app.database.db_base import Base
+from app.database.db_config import create_sqlite_engine
+from app.database.db_writer import DatabaseWriter
+from app.database.models import UsersDatabaseModel
+from app.schemas import UserCreate, UserUpdate
+from app.enums import UserRole
+
+@pytest.fixture
+def file_engine(tmp_path):
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'writer.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+def add_user(name):
+    def operation(session):
+        session.add(UsersDatabaseModel(email=f"{name}@example.com", username=name, password_hash="x", role=UserRole.CLIENT))
+        return name
+    return operation
+
+def test_queued_writes_share_a_transaction(file_engine):
+    """Writes queued while a transaction runs are committed together in the next one."""
+    commits = []
+    event.listen(file_engine, "commit", lambda conn: commits.append(1))
+    writer = DatabaseWriter(file_engine, max_batch=50, linger_seconds=0)
+    release = threading.Event()
+    first = writer.submit(lambda session: release.wait(5))
+    futures = [writer.submit(add_user(f"user{i}")) for i in range(20)]
+    release.set()
+    assert first.result(5) is True
+    assert [future.result(5) for future in futures] == [f"user{i}" for i in range(20)]
+    writer.stop(5)
+    assert len(commits) <= 2
+    with sessionmaker(bind=file_engine)() as session:
+        assert session.scalar(select(func.count()).select_from(UsersDatabaseModel)) == 20
+
+def test_failed_write_only_fails_its_own_future(file_engine):
+    """A failing operation is isolated, the rest of its batch still commits."""
+    writer = DatabaseWriter(file_engine, linger_seconds=0)
+    release = threading.Event()
+    writer.submit(lambda session: release.wait(5))
+    ok = writer.submit(add_user("alice"))
+    duplicate = writer.submit(add_user("alice"))
+    other = writer.submit(add_user("bob"))
+    release.set()
+    assert ok.result(5) == "alice"
+    assert other.result(5) == "bob"
+    with pytest.raises(IntegrityError):
+        duplicate.result(5)
+    writer.stop(5)
+
+def test_controller_writes_go_through_the_writer(file_engine, monkeypatch):
+    """Controllers bound to the application engine hand their writes to the writer thread."""
+    writer = DatabaseWriter(file_engine)
+    writer_threads = set()
+    submit = writer.submit
+    def record_thread(operation):
+        return submit(lambda session: writer_threads.add(threading.current_thread().name) or operation(session))
+    monkeypatch.setattr(writer, "submit", record_thread)
+    monkeypatch.setattr(base_controller, "engine", file_engine)
+    monkeypatch.setattr(base_controller, "get_db_writer", lambda: writer)
+
+    def register(i):
+        controller = UserController()
+        controller.session = sessionmaker(bind=file_engine, autoflush=False)()
+        try:
+            return controller.register_user(UserCreate(
+                email=f"user{i}@example.com", username=f"user{i}", password_hash="x", role=UserRole.CLIENT
+            ))
+        finally:
+            controller.close_session()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        users = list(pool.map(register, range(16)))
+    assert all(user is not None and user.id for user in users)
+    assert writer_threads == {"db-writer"}
+
+    controller = UserController()
+    controller.session = sessionmaker(bind=file_engine, autoflush=False)()
+    updated = controller.update_user(users[0].id, UserUpdate(username="renamed"))
+    assert updated.username == "renamed"
+    assert controller.delete_user(users[1].id) is True
+    assert controller.get_user_by_id(users[1].id) is None
+    assert controller.get_user_by_id(users[0].id).username == "renamed"
+    controller.close_session()
+    writer.stop(5)
+
+def test_write_timeout_cancels_queued_writes_only(file_engine, monkeypatch):
+    """A timed out write is cancelled if still queued, a running one is waited for."""
+    writer = DatabaseWriter(file_engine, linger_seconds=0)
+    monkeypatch.setattr(base_controller, "engine", file_engine)
+    monkeypatch.setattr(base_controller, "get_db_writer", lambda: writer)
+    monkeypatch.setattr(base_controller.Config, "DB_WRITER_TIMEOUT_SECONDS", 0.1)
+    controller = UserController()
+    controller.session = sessionmaker(bind=file_engine, autoflush=False)()
+
+    release, started = threading.Event(), threading.Event()
+    blocker = writer.submit(lambda session: started.set() or release.wait(5))
+    started.wait(5)
+    with pytest.raises(TimeoutError):
+        controller._write(add_user("queued"))
+    release.set()
+    blocker.result(5)
+
+    started.clear()
+    def slow_write(session):
+        started.set()
+        release.wait(5)
+        return add_user("running")(session)
+    release.clear()
+    threading.Thread(target=lambda: started.wait(5) and time.sleep(0.3) or release.set()).start()
+    assert controller._write(slow_write) == "running"
+
+    names = controller.session.scalars(select(UsersDatabaseModel.username)).all()
+    assert names == ["running"]
+    controller.close_session()
+    writer.stop(5)
@@ -0,0 +1,64 @@
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import MagicMock, patch
+from app.services.http_client_service import HttpClient, get_http_client
+
+def test_client_configuration():
+    """Verifies the pool, timeouts and retry policy of the client."""
+    client = HttpClient(pool_size=4, connect_timeout=1, read_timeout=5, max_retries=2)
+    adapter = client.session.get_adapter("https://p2p.binance.com")
+
+    assert client.timeout == (1, 5)
+    assert adapter._pool_maxsize == 4
+    assert adapter.max_retries.total == 2
+    assert 429 in adapter.max_retries.status_forcelist
+    assert adapter.max_retries.backoff_jitter >= 0
+    client.close()
+
+def test_default_timeout_is_applied():
+    """Verifies that every request carries the client timeout unless overridden."""
+    client = HttpClient(connect_timeout=2, read_timeout=7)
+    with patch.object(client.session, "request") as mocked:
+        client.post("https://example.com", json={})
+        client.get("https://example.com", timeout=1)
+
+    assert mocked.call_args_list[0].kwargs["timeout"] == (2, 7)
+    assert mocked.call_args_list[1].kwargs["timeout"] == 1
+    client.close()
+
+def test_shared_client_is_reused():
+    """Verifies that the upstream services share a single pooled client."""
+    assert get_http_client() is get_http_client()
+
+def serve(statuses):
+    """Starts a local server answering the given statuses in order, returns it and its URL."""
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.send_response(statuses.pop(0) if statuses else 200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/"
+
+def test_retries_take_rate_limit_tokens():
+    """Verifies that every retry takes a token, and that a retry without a token is not sent."""
+    limiter = MagicMock()
+    limiter.acquire.return_value = True
+    client = HttpClient(max_retries=3, backoff_factor=0, backoff_jitter=0, limiter=limiter)
+    server, url = serve([503, 429])
+    assert client.post(url).status_code == 200
+    assert limiter.acquire.call_count == 2
+    server.shutdown()
+
+    statuses = [503, 503]
+    server, url = serve(statuses)
+    limiter.acquire.return_value = False
+    assert client.post(url).status_code == 503
+    assert statuses == [503]
+    server.shutdown()
+    client.close()
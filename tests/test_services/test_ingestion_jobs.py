@@ -0,0 +1,59 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from app.schemas import IngestionJobCreate, IngestionJobUpdate
+from app.database.db_config import get_scoped_session
+from app.services import IngestionJobService, SchedulerService
+from app.services.scheduler_service import in_session_scope
+
+@pytest.fixture
+def job_service(db_session):
+    service = IngestionJobService()
+    service.controller.session = db_session
+    return service
+
+def test_seed_only_when_empty(job_service):
+    """The registry is seeded from the configuration once."""
+    assert job_service.seed_jobs() == len(job_service.default_jobs())
+    assert job_service.seed_jobs() == 0
+
+def test_register_and_update_job(job_service):
+    """List fields round-trip through the database."""
+    job = job_service.register_job(IngestionJobCreate(
+        name="usdt-cop", fiat="COP", trade_types=["SELL"], pay_methods=["Nequi", "Bancolombia"], interval_seconds=120
+    ))
+    assert job.trade_types == ["SELL"]
+    assert job.pay_methods == ["Nequi", "Bancolombia"]
+
+    updated = job_service.update_job(job.id, IngestionJobUpdate(enabled=False))
+    assert updated.enabled is False
+    assert job_service.get_jobs(enabled_only=True).count == 0
+
+def test_sync_schedules_registry_jobs(job_service):
+    """Enabled jobs are scheduled with jitter and removed once disabled."""
+    scheduler = SchedulerService()
+    scheduler.ingestion_jobs = job_service
+    first = job_service.register_job(IngestionJobCreate(name="usdt-ves", fiat="VES", interval_seconds=60, jitter_seconds=3))
+    job_service.register_job(IngestionJobCreate(name="usdt-brl", fiat="BRL", interval_seconds=30, pay_methods=["PIX", "TED"]))
+
+    assert scheduler.sync_ingestion_jobs() == 2
+    job = scheduler.scheduler.get_job(f"ingest:{first.id}")
+    assert job.trigger.interval.total_seconds() == 60
+    assert job.trigger.jitter == 3
+
+    job_service.update_job(first.id, IngestionJobUpdate(enabled=False))
+    assert scheduler.sync_ingestion_jobs() == 1
+    assert scheduler.scheduler.get_job(f"ingest:{first.id}") is None
+    pairs, sides, pay_methods = scheduler.ingestion_matrix()
+    assert (pairs, sides) == ([("USDT", "BRL")], ["BUY", "SELL"])
+    assert pay_methods["BRL"] == ["PIX", "TED"]
+
+def test_job_runs_get_their_own_session():
+    """Each run of a scheduled job has its own session, even on a shared executor thread."""
+    sessions = []
+    job = in_session_scope(lambda: sessions.append(get_scoped_session()))
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        list(pool.map(lambda _: job(), range(4)))
+
+    assert None not in sessions
+    assert len({id(session) for session in sessions}) == 4
+    assert get_scoped_session() is None
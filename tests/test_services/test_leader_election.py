@@ -0,0 +1,83 @@
+import time
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from app.database.db_base import Base
+from app.services.leader_election_service import LeaderElection
+
+@pytest.fixture
+def lease_engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+class Role:
+    def __init__(self):
+        self.events = []
+
+    def elected(self):
+        self.events.append("elected")
+
+    def demoted(self):
+        self.events.append("demoted")
+
+def make_election(engine, role, lease_seconds=30):
+    return LeaderElection(
+        "scheduler", on_elected=role.elected, on_demoted=role.demoted,
+        lease_seconds=lease_seconds, renew_interval=0.01, engine=engine
+    )
+
+def test_single_leader(lease_engine):
+    """Only one process holds the lease, the leader keeps it on renewal."""
+    first, second = Role(), Role()
+    leader = make_election(lease_engine, first)
+    follower = make_election(lease_engine, second)
+
+    assert leader.tick()
+    assert not follower.tick()
+    assert leader.tick()
+    assert first.events == ["elected"]
+    assert second.events == []
+
+def test_takeover_after_expiry(lease_engine):
+    """A follower takes over an expired lease and the old leader steps down."""
+    first, second = Role(), Role()
+    leader = make_election(lease_engine, first, lease_seconds=0.01)
+    follower = make_election(lease_engine, second)
+
+    assert leader.tick()
+    time.sleep(0.02)
+    assert follower.tick()
+    assert not leader.tick()
+    assert first.events == ["elected", "demoted"]
+    assert second.events == ["elected"]
+
+def test_release_hands_over(lease_engine):
+    """Stopping the leader releases the lease at once."""
+    first, second = Role(), Role()
+    leader = make_election(lease_engine, first)
+    follower = make_election(lease_engine, second)
+
+    assert leader.tick()
+    leader.stop()
+    assert follower.tick()
+    assert first.events == ["elected", "demoted"]
+
+def test_failed_start_releases_the_lease(lease_engine):
+    """A process whose on_elected fails stays a follower and hands the lease over at once."""
+    def fail():
+        raise RuntimeError("scheduler did not start")
+
+    second = Role()
+    failing = LeaderElection(
+        "scheduler", on_elected=fail, on_demoted=lambda: None,
+        lease_seconds=30, renew_interval=0.01, engine=lease_engine
+    )
+    follower = make_election(lease_engine, second)
+
+    assert not failing.tick()
+    assert not failing.is_leader
+    assert follower.tick()
+    assert second.events == ["elected"]
@@ -0,0 +1,66 @@
+import threading
+import time
+from app.services.live_quote_service import LiveQuoteCache
+from app.schemas import BinanceResponse
+
+class SlowFetcher:
+    def __init__(self, delay: float = 0.2):
+        self.calls = 0
+        self.delay = delay
+        self.lock = threading.Lock()
+
+    def __call__(self) -> BinanceResponse:
+        with self.lock:
+            self.calls += 1
+            price = float(self.calls)
+        time.sleep(self.delay)
+        return BinanceResponse(fiat="VES", asset="USDT", trade_type="BUY", average_price=price)
+
+def test_concurrent_misses_share_one_call():
+    """Concurrent cold misses trigger a single upstream call."""
+    fetcher = SlowFetcher()
+    cache = LiveQuoteCache(fetcher, ttl_seconds=60, max_stale_seconds=120)
+    results = []
+
+    threads = [threading.Thread(target=lambda: results.append(cache.get(timeout=5))) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert fetcher.calls == 1
+    assert len(results) == 20
+    assert all(r.pair.average_price == 1.0 and not r.stale for r in results)
+
+def test_stale_value_served_while_revalidating():
+    """After the TTL the stale value is served at once and refreshed in the background."""
+    fetcher = SlowFetcher(delay=0.2)
+    cache = LiveQuoteCache(fetcher, ttl_seconds=0.05, max_stale_seconds=60)
+    cache.get(timeout=5)
+    time.sleep(0.1)
+
+    started = time.monotonic()
+    stale = [cache.get(timeout=5) for _ in range(10)]
+    assert time.monotonic() - started < 0.1
+    assert all(r.stale and r.pair.average_price == 1.0 for r in stale)
+
+    time.sleep(0.4)
+    assert fetcher.calls == 2
+    assert cache.get(timeout=5).pair.average_price == 2.0
+
+def test_failed_fetch_returns_none():
+    """Without a cached value an upstream failure yields no quote."""
+    cache = LiveQuoteCache(lambda: None, ttl_seconds=10, max_stale_seconds=20)
+    assert cache.get(timeout=1) is None
+
+def test_empty_quote_keeps_cached_value():
+    """A refresh without average price does not replace the cached quote."""
+    prices = iter([1.0])
+    fetcher = lambda: BinanceResponse(fiat="VES", asset="USDT", trade_type="BUY", average_price=next(prices, None))
+    cache = LiveQuoteCache(fetcher, ttl_seconds=0, max_stale_seconds=60)
+    assert cache.get(timeout=1).pair.average_price == 1.0
+
+    cache.get(timeout=1)
+    time.sleep(0.1)
+    quote = cache.get(timeout=1)
+    assert quote.stale and quote.pair.average_price == 1.0
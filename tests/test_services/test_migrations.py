@@ -0,0 +1,82 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import pytest
+from sqlalchemy import create_engine, select, text
+
+from app.database.db_base import Base
+from app.database.migrations import MIGRATIONS, current_version, run_migrations, explain_query_plan
+from app.database.models import RatesDatabaseModel, UsersDatabaseModel, PaymentsDatabaseModel
+
+LEGACY_RATES = (
+    "CREATE TABLE rates (id INTEGER PRIMARY KEY AUTOINCREMENT, from_currency VARCHAR(4) NOT NULL, "
+    "to_currency VARCHAR(4) NOT NULL, rate FLOAT NOT NULL, timestamp DATETIME NOT NULL)"
+)
+
+@pytest.fixture
+def legacy_engine():
+    """A database created before the migrations: rates without side, pay method nor indexes."""
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text(LEGACY_RATES))
+        for rate in (1.0, 2.0):
+            conn.execute(text(
+                "INSERT INTO rates (from_currency, to_currency, rate, timestamp) "
+                "VALUES ('USDT', 'VES', :rate, '2025-01-01 00:00:00.000000')"
+            ), {"rate": rate})
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+def test_migrations_upgrade_legacy_database(legacy_engine):
+    """Pending migrations are applied once, in order, and deduplicate the rates."""
+    assert current_version(legacy_engine) == 0
+    assert run_migrations(legacy_engine) == len(MIGRATIONS)
+    assert run_migrations(legacy_engine) == 0
+    assert current_version(legacy_engine) == MIGRATIONS[-1].version
+
+    with legacy_engine.connect() as conn:
+        assert conn.execute(text("SELECT rate FROM rates")).scalars().all() == [2.0]
+        indexes = set(conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'")).scalars())
+    assert {"uq_rates_natural_key", "ix_rates_timestamp", "ix_rates_pair_timestamp",
+            "ix_users_created_at", "ix_payments_user_date"} <= indexes
+
+def test_range_queries_use_indexes(legacy_engine):
+    """The range endpoints search an index instead of scanning the tables."""
+    run_migrations(legacy_engine)
+    start, end = datetime(2025, 1, 1), datetime(2025, 2, 1)
+    with legacy_engine.connect() as conn:
+        by_time = explain_query_plan(conn, select(RatesDatabaseModel).where(
+            RatesDatabaseModel.timestamp >= start, RatesDatabaseModel.timestamp <= end
+        ))
+        by_pair = explain_query_plan(conn, select(RatesDatabaseModel).where(
+            RatesDatabaseModel.from_currency == "USDT", RatesDatabaseModel.to_currency == "VES"
+        ).order_by(RatesDatabaseModel.timestamp.desc()).limit(30))
+        users = explain_query_plan(conn, select(UsersDatabaseModel).where(
+            UsersDatabaseModel.created_at >= start, UsersDatabaseModel.created_at <= end
+        ))
+        payments = explain_query_plan(conn, select(PaymentsDatabaseModel).where(
+            PaymentsDatabaseModel.id_user == 1, PaymentsDatabaseModel.payment_date >= start
+        ))
+
+    assert any("USING INDEX ix_rates_timestamp" in step for step in by_time)
+    assert any("USING INDEX ix_rates_pair_timestamp" in step for step in by_pair)
+    assert not any("TEMP B-TREE" in step for step in by_pair)
+    assert any("USING INDEX ix_users_created_at" in step for step in users)
+    assert any("USING INDEX ix_payments_user_date" in step for step in payments)
+
+def test_concurrent_runs_apply_each_migration_once(tmp_path):
+    """Processes migrating the same database together apply every migration once."""
+    url = f"sqlite:///{tmp_path / 'legacy.db'}"
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text(LEGACY_RATES))
+    Base.metadata.create_all(engine)
+    engine.dispose()
+
+    engines = [create_engine(url, connect_args={"timeout": 30}) for _ in range(4)]
+    with ThreadPoolExecutor(max_workers=len(engines)) as pool:
+        applied = list(pool.map(run_migrations, engines))
+    for each in engines:
+        each.dispose()
+
+    assert sum(applied) == len(MIGRATIONS)
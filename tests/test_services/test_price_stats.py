@@ -0,0 +1,34 @@
+import pytest
+from app.services.price_stats_service import PriceStatistics
+
+def test_robust_statistics_reject_outliers():
+    """A single scam ad shifts the mean but not the robust statistics."""
+    stats = PriceStatistics(trim_fraction=0.1, iqr_factor=1.5)
+    prices = [100.0, 101.0, 102.0, 100.5, 101.5, 99.5, 100.0, 101.0, 102.0, 500.0]
+    quantities = [10, 10, 10, 10, 10, 10, 10, 10, 10, 10_000]
+
+    result = stats.summarize(prices, quantities)
+
+    assert result["sample_size"] == 10
+    assert result["outliers_removed"] == 1
+    assert result["average_price"] > 140
+    assert result["trimmed_mean_price"] == pytest.approx(sum(sorted(prices)[1:-1]) / 8)
+    assert result["weighted_price"] == pytest.approx(sum(prices[:-1]) / 9)
+    assert result["p10_price"] <= result["median_price"] <= result["p90_price"]
+
+def test_summarize_many_matches_single_samples():
+    """The vectorized pass over several samples gives the same result as one by one."""
+    stats = PriceStatistics()
+    samples = [
+        ([10.0, 11.0, 12.0], [1.0, None, 3.0]),
+        ([], None),
+        ([5.0, 5.5, 6.0, 6.5, 7.0, 30.0], None),
+    ]
+
+    batch = stats.summarize_many(samples)
+
+    assert batch[0] == stats.summarize(*samples[0])
+    assert batch[1]["median_price"] is None and batch[1]["sample_size"] == 0
+    assert batch[2] == stats.summarize(*samples[2])
+    assert batch[0]["weighted_price"] == pytest.approx((10.0 * 1 + 12.0 * 3) / 4)
+    assert batch[2]["weighted_price"] is None
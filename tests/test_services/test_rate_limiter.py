@@ -0,0 +1,39 @@
+import threading
+import time
+from app.services.rate_limiter_service import TokenBucket
+
+def test_burst_then_rate():
+    """The burst is served at once, then tokens follow the configured rate."""
+    bucket = TokenBucket(rate=20, burst=3)
+    started = time.monotonic()
+    for _ in range(3):
+        assert bucket.acquire(timeout=0)
+    assert not bucket.acquire(timeout=0)
+    assert bucket.acquire(timeout=1)
+    assert 0.03 <= time.monotonic() - started < 0.5
+
+def test_waiters_are_served_in_order():
+    """Callers waiting for a token are served first come, first served."""
+    bucket = TokenBucket(rate=50, burst=1)
+    assert bucket.acquire()
+    served = []
+
+    def worker(i):
+        bucket.acquire(timeout=5)
+        served.append(i)
+
+    threads = []
+    for i in range(5):
+        thread = threading.Thread(target=worker, args=(i,))
+        thread.start()
+        threads.append(thread)
+        while bucket.waiting < i + 1 and thread.is_alive():
+            time.sleep(0.001)
+    for thread in threads:
+        thread.join()
+    assert served == [0, 1, 2, 3, 4]
+
+def test_disabled_limiter():
+    """A rate of 0 never blocks."""
+    bucket = TokenBucket(rate=0, burst=1)
+    assert all(bucket.acquire(timeout=0) for _ in range(100))
@@ -1,8 +1,23 @@
 import pytest
-from datetime import datetime
+import asyncio
+import csv
+import io
+import json
+import math
+from datetime import date, datetime, timedelta
+from fastapi.responses import JSONResponse
+from sqlalchemy import func, select
+
+from app.api.responses import PydanticJSONResponse
+from app.config import Config
+from app.controllers.rates_controller import rate_columns, rate_responses
+from app.database.db_config import async_engine
+from app.database.models import RatesDatabaseModel
+import app.services.hot_rates_service as hot_rates_service
+from app.services.hot_rates_service import HotRateStore
 from app.services.rates_service import RateService
-from app.schemas import RateCreate, RateListResponse
-from app.enums import CurrencyEnum
+from app.schemas import RateCreate, RateListResponse, RateResponse, RateUpdate, PageCursor
+from app.enums import CurrencyEnum, TradeType, ExportFormat
 
 class TestRateService:
     def setup_method(self):
@@ -42,4 +57,207 @@ class TestRateService:
         # Probamos un rango de 7 días (week)
         response = self.service.get_last_week_rates()
         assert isinstance(response, RateListResponse)
-        assert isinstance(response.rates, list)
\ No newline at end of file
+        assert isinstance(response.rates, list)
+
+    def test_register_rates_batch(self):
+        """
+        Test that several rates are registered in a single call.
+        """
+        now = datetime.now()
+        batch = [
+            RateCreate(from_currency=CurrencyEnum.USDT, to_currency=CurrencyEnum.VES, rate=50.0, timestamp=now, trade_type=TradeType.BUY),
+            RateCreate(from_currency=CurrencyEnum.USDT, to_currency=CurrencyEnum.VES, rate=49.0, timestamp=now, trade_type=TradeType.SELL),
+        ]
+
+        registered = self.service.register_rates(batch)
+
+        assert len(registered) == 2
+        assert {r.trade_type for r in registered} == {"BUY", "SELL"}
+        assert all(r.id is not None for r in registered)
+
+    def test_latest_rates_by_pay_method(self):
+        """
+        Test that the latest rate is kept per pay method, next to the whole-book rate.
+        """
+        now = datetime.now()
+        self.service.register_rates([
+            RateCreate(from_currency=CurrencyEnum.USDT, to_currency=CurrencyEnum.PEN, rate=3.70, timestamp=now, trade_type=TradeType.BUY),
+            RateCreate(from_currency=CurrencyEnum.USDT, to_currency=CurrencyEnum.PEN, rate=3.75, timestamp=now, trade_type=TradeType.BUY, pay_method="Yape"),
+            RateCreate(from_currency=CurrencyEnum.USDT, to_currency=CurrencyEnum.PEN, rate=3.72, timestamp=now, trade_type=TradeType.BUY, pay_method="BCP"),
+        ])
+
+        latest = self.service.get_latest_rates(from_currency="USDT", to_currency="PEN")
+        assert {r.pay_method: r.rate for r in latest.rates} == {None: 3.70, "Yape": 3.75, "BCP": 3.72}
+
+        yape = self.service.get_latest_rates(to_currency="PEN", pay_method="yape")
+        assert yape.count == 1 and yape.rates[0].rate == 3.75
+
+    def test_register_rates_is_idempotent(self):
+        """
+        Test that retrying a batch updates the same rows instead of duplicating them.
+        """
+        now = datetime.now()
+        batch = [
+            RateCreate(from_currency=CurrencyEnum.USDT, to_currency=CurrencyEnum.ARS, rate=1000.0, timestamp=now, trade_type=TradeType.BUY),
+            RateCreate(from_currency=CurrencyEnum.USDT, to_currency=CurrencyEnum.ARS, rate=990.0, timestamp=now),
+        ]
+        first = self.service.register_rates(batch)
+        batch[0].rate = 1005.0
+        retried = self.service.register_rates(batch)
+
+        assert [r.id for r in retried] == [r.id for r in first]
+        assert retried[0].rate == 1005.0
+        single = self.service.register_rate(batch[1])
+        assert single.id == first[1].id
+
+    def test_async_reads_match_sync_reads(self):
+        """
+        Test that the async read path returns the same rates as the sync one.
+        """
+        now = datetime.now()
+        registered = self.service.register_rates([
+            RateCreate(from_currency=CurrencyEnum.USDT, to_currency=CurrencyEnum.COP, rate=3900.0, timestamp=now, trade_type=TradeType.BUY),
+            RateCreate(from_currency=CurrencyEnum.USDT, to_currency=CurrencyEnum.COP, rate=3950.0, timestamp=now, trade_type=TradeType.BUY, pay_method="Nequi"),
+        ])
+
+        async def read():
+            try:
+                return await asyncio.gather(
+                    self.service.get_rate_by_id_async(registered[0].id),
+                    self.service.get_today_rates_async(),
+                    self.service.get_latest_rates_async(to_currency="COP")
+                )
+            finally:
+                # Pooled aiosqlite connections belong to this event loop
+                await async_engine.dispose()
+
+        by_id, today, latest = asyncio.run(read())
+        assert by_id == self.service.get_rate_by_id(registered[0].id)
+        assert {r.id for r in today.rates} == {r.id for r in self.service.get_today_rates().rates}
+        assert latest == self.service.get_latest_rates(to_currency="COP")
+
+    def test_column_projection_matches_orm_responses(self):
+        """
+        Test that the column-projected read builds the same responses as the ORM entities.
+        """
+        self.service.register_rate(RateCreate(
+            from_currency=CurrencyEnum.USDT, to_currency=CurrencyEnum.ARS, rate=950.5,
+            timestamp=datetime.now(), trade_type=TradeType.SELL, pay_method="Santander"
+        ))
+        session = self.service.controller.session
+        projected = rate_responses(session.execute(select(*rate_columns())).all())
+        entities = [RateResponse.model_validate(rate) for rate in session.scalars(select(RatesDatabaseModel)).all()]
+        assert projected == entities
+
+    def test_rates_pages_follow_the_cursor(self):
+        """
+        Test that following next_cursor walks every rate once, newest first, across equal timestamps.
+        """
+        now = datetime.now()
+        self.service.register_rates([
+            RateCreate(from_currency=CurrencyEnum.USDT, to_currency=CurrencyEnum.BRL, rate=5.0 + i, timestamp=now, trade_type=TradeType.SELL, pay_method=f"Bank{i}")
+            for i in range(5)
+        ])
+        total = self.service.controller.session.scalar(select(func.count()).select_from(RatesDatabaseModel))
+
+        async def walk():
+            try:
+                pages, cursor = [], None
+                while True:
+                    page = await self.service.get_rates_page_async(2, cursor)
+                    pages.append(page)
+                    if page.next_cursor is None:
+                        return pages
+                    cursor = PageCursor.decode(page.next_cursor)
+            finally:
+                await async_engine.dispose()
+
+        pages = asyncio.run(walk())
+        rates = [rate for page in pages for rate in page.rates]
+        keys = [(rate.timestamp, rate.id) for rate in rates]
+        assert len(rates) == total
+        assert keys == sorted(set(keys), reverse=True)
+        assert all(page.count == 2 for page in pages[:-1])
+
+    def test_export_streams_every_rate_in_batches(self, monkeypatch):
+        """
+        Test that the CSV and NDJSON exports stream every rate, one chunk per batch.
+        """
+        self.service.register_rate(RateCreate(
+            from_currency=CurrencyEnum.USDT, to_currency=CurrencyEnum.PEN, rate=3.75,
+            timestamp=datetime.now(), trade_type=TradeType.BUY, pay_method="Yape"
+        ))
+        monkeypatch.setattr(Config, "EXPORT_BATCH_SIZE", 2)
+        expected = rate_responses(self.service.controller.session.execute(
+            select(*rate_columns()).order_by(RatesDatabaseModel.id)
+        ).all())
+
+        async def export(export_format):
+            try:
+                return [chunk async for chunk in self.service.export_rates(export_format)]
+            finally:
+                await async_engine.dispose()
+
+        ndjson = asyncio.run(export(ExportFormat.NDJSON))
+        assert len(ndjson) == math.ceil(len(expected) / 2)
+        assert [RateResponse.model_validate_json(line) for line in "".join(ndjson).splitlines()] == expected
+
+        csv_chunks = asyncio.run(export(ExportFormat.CSV))
+        rows = list(csv.DictReader(io.StringIO("".join(csv_chunks))))
+        assert csv_chunks[0] == ",".join(RateResponse.model_fields) + "\n"
+        assert [int(row["id"]) for row in rows] == [rate.id for rate in expected]
+        assert rows[-1]["pay_method"] == expected[-1].pay_method
+
+    def test_pydantic_json_response_matches_default_rendering(self):
+        """
+        Test that the fast response renders the same JSON as the default response pipeline.
+        """
+        rates = self.service.register_rates([
+            RateCreate(from_currency=CurrencyEnum.USDT, to_currency=CurrencyEnum.VES, rate=512.25, timestamp=datetime.now(), trade_type=TradeType.SELL),
+            RateCreate(from_currency=CurrencyEnum.BRL, to_currency=CurrencyEnum.VES, rate=95.9, timestamp=datetime.now()),
+        ])
+        response = RateListResponse(count=len(rates), rates=rates)
+        fast = PydanticJSONResponse(response)
+        assert fast.media_type == "application/json"
+        assert json.loads(fast.body) == json.loads(JSONResponse(response.model_dump(mode="json")).body)
+
+    def test_hot_rate_store_serves_the_period_reads(self, monkeypatch):
+        """
+        Test that the period reads are served from the hot rate store, kept in step with the writes.
+        """
+        store = HotRateStore(sync_seconds=3600)
+        monkeypatch.setattr(hot_rates_service, "_store", store)
+        earlier = datetime.now() - timedelta(days=3)
+        registered = self.service.register_rates([
+            RateCreate(from_currency=CurrencyEnum.USDT, to_currency=CurrencyEnum.VES, rate=520.0 + i, timestamp=earlier, trade_type=TradeType.BUY, pay_method=f"Hot{i}")
+            for i in range(3)
+        ])
+
+        week = self.service.get_last_week_rates()
+        assert store.loaded
+        today = datetime.now().date()
+        database = self.service.controller.get_rates_by_time_range(today - timedelta(days=7), today)
+        assert week.rates == sorted(database.rates, key=lambda rate: (rate.timestamp, rate.id))
+
+        # Writes of this process are applied right away
+        created = self.service.register_rate(RateCreate(
+            from_currency=CurrencyEnum.USDT, to_currency=CurrencyEnum.VES, rate=530.0, timestamp=datetime.now(), trade_type=TradeType.SELL
+        ))
+        self.service.update_rate(registered[0].id, RateUpdate(rate=1.5))
+        assert self.service.delete_rate(registered[1].id)
+        rates = {rate.id: rate for rate in self.service.get_last_week_rates().rates}
+        assert rates[created.id] == created
+        assert rates[registered[0].id].rate == 1.5
+        assert registered[1].id not in rates
+
+        # Rates written by another process show up on the next sync
+        other = self.service.controller.register_rate(RateCreate(
+            from_currency=CurrencyEnum.USDT, to_currency=CurrencyEnum.VES, rate=531.0, timestamp=datetime.now(), trade_type=TradeType.SELL
+        ))
+        assert other.id not in {rate.id for rate in self.service.get_today_rates().rates}
+        store.sync_seconds = 0
+        assert other.id in {rate.id for rate in self.service.get_today_rates().rates}
+
+        # Ranges older than the window are read from the database
+        assert store.get_range(datetime(2000, 1, 1), datetime.now()) is None
+        assert self.service.get_rates_by_custom_range(date(2000, 1, 1), today).count == len(database.rates) + 1
@@ -1,4 +1,4 @@
-from app.schemas import UserCreate
+from app.schemas import UserCreate, PageCursor
 from app.enums import UserRole
 
 def test_register_user_duplicate_email(user_service):
@@ -16,4 +16,21 @@ def test_register_user_duplicate_email(user_service):
     
     # Segundo registro: Debe fallar por validación de email
     duplicate_user = user_service.register_user(user_data)
-    assert duplicate_user is None
\ No newline at end of file
+    assert duplicate_user is None
+def test_users_pages_follow_the_cursor(user_service):
+    """Ensures that following next_cursor lists every user once, in registration order."""
+    for i in range(5):
+        user_service.register_user(UserCreate(
+            email=f"page{i}@example.com", username=f"page{i}", password_hash="plain_password", role=UserRole.CLIENT
+        ))
+
+    ids, cursor = [], None
+    while True:
+        page = user_service.get_users_page(2, cursor)
+        ids.extend(user.id for user in page.users)
+        if page.next_cursor is None:
+            break
+        cursor = PageCursor.decode(page.next_cursor)
+
+    assert ids == [user.id for user in user_service.get_all_users().users]
+    assert len(ids) == len(set(ids))